@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, Callable, Dict
+
+import anyio
+from fastapi import FastAPI, Request
+
+from ..schemas.common import fail
+from .metrics import REGISTRY, Counter, Gauge
+from .responses import ORJSONResponse
+
+# 엔드포인트별 동시 실행 상한 + 대기열 상한 (초과 시 즉시 503 + Retry-After)
+# 환경변수: ADMISSION_<NAME>_CONCURRENCY / _QUEUE / _TIMEOUT  (예: ADMISSION_POLICY_QA_CONCURRENCY=8)
+_DEFAULTS = {
+    # LLM 호출: 외부 API 지연이 길어 동시 실행을 작게, 대기도 짧게
+    "policy_qa": (8, 16, 10.0),
+    "recommend": (32, 128, 2.0),
+    "similar": (32, 128, 2.0),
+}
+
+# 클라이언트별 token bucket (RATE_LIMIT_RPS=0이면 비활성)
+RATE_LIMIT_RPS = float(os.getenv("RATE_LIMIT_RPS", "0"))
+RATE_LIMIT_BURST = float(os.getenv("RATE_LIMIT_BURST", "20"))
+RATE_LIMIT_MAX_CLIENTS = int(os.getenv("RATE_LIMIT_MAX_CLIENTS", "10000"))
+# X-Client-Id는 클라이언트가 임의로 바꿀 수 있으므로, 앞단 프록시/게이트웨이가 검증·주입하는 환경에서만 켠다
+RATE_LIMIT_TRUST_CLIENT_ID = os.getenv("RATE_LIMIT_TRUST_CLIENT_ID", "0") == "1"
+
+
+class Overloaded(Exception):
+    """대기열이 가득 찼거나 대기 시간이 초과됨 → 503"""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"{name} is overloaded")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class RateLimited(Exception):
+    """클라이언트 요청 속도 초과 → 429"""
+
+    def __init__(self, retry_after: float):
+        super().__init__("rate limit exceeded")
+        self.retry_after = retry_after
+
+
+# -------------------------
+# concurrency limiter
+# -------------------------
+class ConcurrencyLimiter:
+    """
+    - 동시 실행 max_concurrent개, 대기 max_queue개까지 허용
+    - 대기열이 가득 차면 기다리지 않고 바로 Overloaded (빠른 shedding)
+    - 대기 중 queue_timeout이 지나도 Overloaded
+    - blocking 작업은 run_sync()로 이 엔드포인트 전용 스레드 상한에서 실행
+      → LLM 호출이 기본 스레드풀(다른 sync 엔드포인트와 공유)을 다 잡아먹지 않음
+    """
+
+    def __init__(self, name: str, max_concurrent: int, max_queue: int, queue_timeout: float):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._sem = asyncio.Semaphore(max_concurrent)
+        self._threads = anyio.CapacityLimiter(max_concurrent)
+        self.in_flight = 0
+        self.waiting = 0
+        self.shed = 0
+        self._ewma_seconds = 1.0  # 처리 시간 이동평균 → Retry-After 추정
+
+    def retry_after(self) -> int:
+        # 대기열을 비우는 데 걸릴 대략적인 시간
+        backlog = self.waiting + self.in_flight
+        return max(1, math.ceil(self._ewma_seconds * backlog / max(1, self.max_concurrent)))
+
+    async def acquire(self) -> None:
+        if self._sem.locked():
+            if self.waiting >= self.max_queue:
+                self.shed += 1
+                raise Overloaded(self.name, self.retry_after())
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(self._sem.acquire(), timeout=self.queue_timeout)
+            except asyncio.TimeoutError:
+                self.shed += 1
+                raise Overloaded(self.name, self.retry_after()) from None
+            finally:
+                self.waiting -= 1
+        else:
+            await self._sem.acquire()
+        self.in_flight += 1
+
+    def release(self, elapsed: float) -> None:
+        self.in_flight -= 1
+        self._ewma_seconds = 0.8 * self._ewma_seconds + 0.2 * elapsed
+        self._sem.release()
+
+    async def run_sync(self, fn: Callable, *args):
+        return await anyio.to_thread.run_sync(fn, *args, limiter=self._threads)
+
+
+def _env(name: str, key: str, default):
+    return type(default)(os.getenv(f"ADMISSION_{name.upper()}_{key}", default))
+
+
+_limiters: Dict[str, ConcurrencyLimiter] = {}
+
+
+def get_limiter(name: str) -> ConcurrencyLimiter:
+    lim = _limiters.get(name)
+    if lim is None:
+        conc, queue, timeout = _DEFAULTS.get(name, (64, 256, 5.0))
+        lim = _limiters[name] = ConcurrencyLimiter(
+            name,
+            max_concurrent=_env(name, "CONCURRENCY", conc),
+            max_queue=_env(name, "QUEUE", queue),
+            queue_timeout=_env(name, "TIMEOUT", timeout),
+        )
+    return lim
+
+
+def admit(name: str) -> Callable:
+    """
+    라우트 의존성으로 사용:
+    @router.post("", dependencies=[Depends(admit("recommend"))])
+    """
+    limiter = get_limiter(name)
+
+    async def dependency(request: Request) -> AsyncIterator[None]:
+        rate_limiter.check(request)
+        await limiter.acquire()
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            limiter.release(time.perf_counter() - t0)
+
+    return dependency
+
+
+# -------------------------
+# per-client token bucket
+# -------------------------
+class TokenBucketLimiter:
+    """
+    클라이언트(IP)별 token bucket. 오래 안 쓴 클라이언트는 LRU로 정리
+    - trust_client_id=True일 때만 X-Client-Id 헤더를 키로 사용 (신뢰할 수 있는 프록시 뒤에서만)
+    """
+
+    def __init__(self, rate: float, burst: float, max_clients: int, trust_client_id: bool = False):
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self.trust_client_id = trust_client_id
+        self._buckets: "OrderedDict[str, list[float]]" = OrderedDict()  # key → [tokens, last_ts]
+        self._lock = threading.Lock()
+        self.rejected = 0
+
+    def client_key(self, request: Request) -> str:
+        if self.trust_client_id:
+            cid = request.headers.get("x-client-id")
+            if cid:
+                return cid
+        return request.client.host if request.client else "unknown"
+
+    def check(self, request: Request) -> None:
+        if self.rate <= 0:
+            return
+        key = self.client_key(request)
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [self.burst, now]
+                while len(self._buckets) > self.max_clients:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+                bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+                bucket[1] = now
+            if bucket[0] < 1.0:
+                self.rejected += 1
+                raise RateLimited(retry_after=(1.0 - bucket[0]) / self.rate)
+            bucket[0] -= 1.0
+
+
+rate_limiter = TokenBucketLimiter(
+    RATE_LIMIT_RPS, RATE_LIMIT_BURST, RATE_LIMIT_MAX_CLIENTS, RATE_LIMIT_TRUST_CLIENT_ID
+)
+
+
+# -------------------------
+# error handlers
+# -------------------------
+def _retry_after_header(seconds: float) -> Dict[str, str]:
+    return {"Retry-After": str(max(1, math.ceil(seconds)))}
+
+
+async def _overloaded_handler(request: Request, exc: Overloaded) -> ORJSONResponse:
+    return ORJSONResponse(
+        fail("OVERLOADED", f"{exc.name} is busy, retry later"),
+        status_code=503,
+        headers=_retry_after_header(exc.retry_after),
+    )
+
+
+async def _rate_limited_handler(request: Request, exc: RateLimited) -> ORJSONResponse:
+    return ORJSONResponse(
+        fail("RATE_LIMITED", "too many requests"),
+        status_code=429,
+        headers=_retry_after_header(exc.retry_after),
+    )
+
+
+def add_admission_control(app: FastAPI) -> None:
+    app.add_exception_handler(Overloaded, _overloaded_handler)
+    app.add_exception_handler(RateLimited, _rate_limited_handler)
+
+
+REGISTRY.register(
+    Gauge(
+        "admission_in_flight",
+        "Requests currently holding an admission slot",
+        ("endpoint",),
+        collect=lambda: [((n,), lim.in_flight) for n, lim in _limiters.items()],
+    )
+)
+REGISTRY.register(
+    Gauge(
+        "admission_waiting",
+        "Requests waiting for an admission slot",
+        ("endpoint",),
+        collect=lambda: [((n,), lim.waiting) for n, lim in _limiters.items()],
+    )
+)
+REGISTRY.register(
+    Counter(
+        "admission_shed_total",
+        "Requests rejected with 503 by admission control",
+        ("endpoint",),
+        collect=lambda: [((n,), lim.shed) for n, lim in _limiters.items()],
+    )
+)
+REGISTRY.register(
+    Counter(
+        "rate_limited_total",
+        "Requests rejected with 429 by the per-client token bucket",
+        collect=lambda: [((), rate_limiter.rejected)],
+    )
+)
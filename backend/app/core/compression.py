@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import logging
+import os
+
+from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+
+logger = logging.getLogger(__name__)
+
+# 이 크기(bytes) 미만 응답은 압축하지 않음 (작은 응답은 압축 이득보다 CPU 비용이 큼)
+COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", "1024"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "4"))
+
+
+def add_compression(app: FastAPI) -> None:
+    """
+    응답 압축 미들웨어 등록.
+    - brotli-asgi가 설치돼 있으면 br 우선(+ gzip fallback)
+    - 없으면 gzip만 사용
+    """
+    try:
+        from brotli_asgi import BrotliMiddleware
+    except ImportError:
+        app.add_middleware(GZipMiddleware, minimum_size=COMPRESS_MIN_SIZE, compresslevel=GZIP_LEVEL)
+        logger.info("compression: gzip (brotli-asgi not installed)")
+        return
+
+    app.add_middleware(
+        BrotliMiddleware,
+        quality=BROTLI_QUALITY,
+        minimum_size=COMPRESS_MIN_SIZE,
+        gzip_fallback=True,
+    )
+    logger.info("compression: brotli (+gzip fallback)")
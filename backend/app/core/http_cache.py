@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from fastapi import Request, Response
+
+from .metrics import REGISTRY, Counter, Gauge
+
+# 정책 데이터는 cleaner/ingest 실행 때만 바뀜 → 짧게 캐시하고 이후에는 ETag로 재검증
+POLICY_CACHE_CONTROL = os.getenv("POLICY_CACHE_CONTROL", "public, max-age=60, must-revalidate")
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "512"))
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    데이터 버전 등으로부터 weak ETag 생성.
+    같은 태그가 원본/압축(gzip, br) 표현 모두에 붙으므로 바이트 단위 동일성을 뜻하는 strong ETag는 쓰지 않는다.
+    """
+    h = hashlib.sha256("\x1f".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+    return f'W/"{h[:32]}"'
+
+
+def _opaque_tag(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    If-None-Match 비교 (RFC 9110: weak comparison).
+    - 콤마로 여러 개 전달 가능, '*'는 항상 일치
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    expected = _opaque_tag(etag)
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if _opaque_tag(tag) == expected:
+            return True
+    return False
+
+
+def normalized_query(request: Request) -> str:
+    """파라미터 순서가 달라도 같은 캐시 키가 되도록 정렬"""
+    return "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+
+
+def cache_headers(etag: str, cache_control: str = POLICY_CACHE_CONTROL) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": cache_control}
+
+
+def not_modified(etag: str, cache_control: str = POLICY_CACHE_CONTROL) -> Response:
+    return Response(status_code=304, headers=cache_headers(etag, cache_control))
+
+
+def json_bytes_response(body: bytes, etag: str, cache_control: str = POLICY_CACHE_CONTROL) -> Response:
+    return Response(content=body, media_type="application/json", headers=cache_headers(etag, cache_control))
+
+
+def render_model(model_type: Any, payload: Any, **dump_kwargs: Any) -> bytes:
+    """response_model과 같은 검증 + JSON 직렬화를 직접 수행 (캐시에 넣을 최종 바이트)"""
+    return model_type.model_validate(payload).model_dump_json(**dump_kwargs).encode("utf-8")
+
+
+class ResponseCache:
+    """
+    렌더링된 응답 바이트를 보관하는 프로세스 내 LRU 캐시.
+    키에 데이터 버전을 포함시키므로 데이터가 바뀌면 이전 항목은 더 이상 조회되지 않고
+    LRU로 자연스럽게 밀려난다(별도 무효화 불필요).
+    """
+
+    def __init__(self, name: str, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES):
+        self.name = name
+        self.max_entries = max_entries
+        self._data: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        with self._lock:
+            body = self._data.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def put(self, key: Hashable, body: bytes) -> None:
+        with self._lock:
+            self._data[key] = body
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+policy_response_cache = ResponseCache("policy_response")
+
+# hit ratio = hits / (hits + misses)
+REGISTRY.register(
+    Counter(
+        "cache_requests_total",
+        "Response cache lookups by result",
+        ("cache", "result"),
+        collect=lambda: [
+            ((policy_response_cache.name, "hit"), policy_response_cache.hits),
+            ((policy_response_cache.name, "miss"), policy_response_cache.misses),
+        ],
+    )
+)
+REGISTRY.register(
+    Gauge(
+        "cache_entries",
+        "Entries held by the response cache",
+        ("cache",),
+        collect=lambda: [((policy_response_cache.name,), len(policy_response_cache))],
+    )
+)
@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from fastapi import Response
+
+# 외부 의존성 없이 Prometheus text format(0.0.4)을 직접 렌더링한다.
+# - 관측 1회 = 락 1번 + bisect 1번 → 운영에서 계속 켜 둘 수 있는 비용
+# - 프로세스 단위 집계 (uvicorn 워커가 여러 개면 워커별로 scrape)
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "1") not in ("0", "false", "False")
+METRICS_PREFIX = "policy_reco_"
+
+# 단위: 초. 1ms(DB 단건) ~ 60s(LLM 응답)까지
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(v: str) -> str:
+    return v.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: LabelValues, extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _fmt(v: float) -> str:
+    if v == float("inf"):
+        return "+Inf"
+    if float(v).is_integer():
+        return str(int(v))
+    return repr(float(v))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, doc: str, labelnames: Sequence[str] = ()):
+        self.name = METRICS_PREFIX + name
+        self.doc = doc
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.doc}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class _ValueMetric(_Metric):
+    """
+    label → 값 하나짜리 지표.
+    직접 갱신하거나, collect 함수를 넘겨 scrape 시점에 값을 읽는다
+    (캐시 hit 수, 큐 길이처럼 이미 다른 객체가 들고 있는 값).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        doc: str,
+        labelnames: Sequence[str] = (),
+        collect: Optional[Callable[[], Iterable[Tuple[LabelValues, float]]]] = None,
+    ):
+        super().__init__(name, doc, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._collect = collect
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def render(self) -> List[str]:
+        if self._collect is not None:
+            items = sorted(self._collect())
+        else:
+            with self._lock:
+                items = sorted(self._values.items())
+        return self.header() + [f"{self.name}{_labels(self.labelnames, k)} {_fmt(v)}" for k, v in items]
+
+
+class Counter(_ValueMetric):
+    kind = "counter"
+
+
+class Gauge(_ValueMetric):
+    kind = "gauge"
+
+    def set(self, value: float, *labels: str) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        doc: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, doc, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # label → [bucket별 count..., +Inf count, sum]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        i = bisect_left(self.buckets, value)
+        with self._lock:
+            row = self._values.get(labels)
+            if row is None:
+                row = self._values[labels] = [0.0] * (len(self.buckets) + 2)
+            row[i] += 1
+            row[-1] += value
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._values.items())
+        out = self.header()
+        for labels, row in items:
+            cumulative = 0.0
+            for edge, n in zip(self.buckets + (float("inf"),), row[:-1]):
+                cumulative += n
+                le = f'le="{_fmt(edge)}"'
+                out.append(f"{self.name}_bucket{_labels(self.labelnames, labels, le)} {_fmt(cumulative)}")
+            out.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {_fmt(row[-1])}")
+            out.append(f"{self.name}_count{_labels(self.labelnames, labels)} {_fmt(cumulative)}")
+        return out
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for m in self._metrics:
+            lines.extend(m.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+# -------------------------
+# 공통 지표
+# -------------------------
+HTTP_LATENCY = REGISTRY.register(
+    Histogram("http_request_seconds", "HTTP request latency by route template", ("method", "route", "status"))
+)
+STAGE_LATENCY = REGISTRY.register(
+    Histogram("stage_seconds", "Latency of each pipeline stage", ("flow", "stage"))
+)
+STAGE_ERRORS = REGISTRY.register(
+    Counter("stage_errors_total", "Stages that raised an exception", ("flow", "stage"))
+)
+LLM_IN_FLIGHT = REGISTRY.register(
+    Gauge("llm_in_flight", "LLM / embedding API calls currently in progress", ("kind",))
+)
+INDEX_SIZE = REGISTRY.register(
+    Gauge("index_size", "Number of items held by in-memory indexes", ("index",))
+)
+
+
+@contextmanager
+def timed(flow: str, stage: str) -> Iterator[None]:
+    """
+    with timed("qa", "retrieve"):
+        ...
+    소요 시간을 stage_seconds{flow, stage}에, 예외 발생 시 stage_errors_total에 기록
+    """
+    if not METRICS_ENABLED:
+        yield
+        return
+    t0 = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        STAGE_ERRORS.inc(flow, stage)
+        raise
+    finally:
+        STAGE_LATENCY.observe(time.perf_counter() - t0, flow, stage)
+
+
+@contextmanager
+def llm_call(kind: str = "chat") -> Iterator[None]:
+    """진행 중인 외부 모델 호출 수 (kind: chat / embedding)"""
+    LLM_IN_FLIGHT.inc(kind)
+    try:
+        yield
+    finally:
+        LLM_IN_FLIGHT.dec(kind)
+
+
+def instrument_repository(flow: str = "db") -> Callable[[type], type]:
+    """
+    저장소 클래스의 public async 메서드를 stage_seconds{flow="db", stage="Class.method"}로 계측.
+    @instrument_repository()
+    class PolicyRepository: ...
+    """
+
+    def wrap(cls: type) -> type:
+        if not METRICS_ENABLED:
+            return cls
+        for name, fn in list(vars(cls).items()):
+            if name.startswith("_") or not inspect.iscoroutinefunction(fn):
+                continue
+            stage = f"{cls.__name__}.{name}"
+
+            def make(fn=fn, stage=stage):
+                @functools.wraps(fn)
+                async def inner(*args, **kwargs):
+                    with timed(flow, stage):
+                        return await fn(*args, **kwargs)
+
+                return inner
+
+            setattr(cls, name, make())
+        return cls
+
+    return wrap
+
+
+# -------------------------
+# HTTP 미들웨어 (순수 ASGI: BaseHTTPMiddleware보다 오버헤드가 작음)
+# -------------------------
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        t0 = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # 경로 파라미터가 들어간 실제 path 대신 라우트 템플릿 사용 (라벨 폭증 방지)
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "unmatched"
+            HTTP_LATENCY.observe(time.perf_counter() - t0, scope["method"], path, str(status["code"]))
+
+
+def metrics_response() -> Response:
+    return Response(content=REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import cProfile
+import hmac
+import itertools
+import json
+import logging
+import marshal
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import anyio
+from fastapi import FastAPI
+
+logger = logging.getLogger(__name__)
+
+# 요청 단위 on-demand 프로파일링
+# - 헤더(X-Profile: 1 또는 X-Profile: cprofile) / 쿼리(?profile=1) + X-Admin-Token 일치 시
+# - 또는 PROFILE_SAMPLE_EVERY=N 이면 N번째 요청마다 1번
+# 둘 다 꺼져 있으면 미들웨어 자체를 등록하지 않음 → 비활성 시 오버헤드 0
+PROFILE_ADMIN_TOKEN = os.getenv("PROFILE_ADMIN_TOKEN", "")
+PROFILE_SAMPLE_EVERY = int(os.getenv("PROFILE_SAMPLE_EVERY", "0"))
+PROFILE_DIR = Path(os.getenv("PROFILE_DIR", str(Path(__file__).resolve().parents[3] / "data" / "profiles")))
+PROFILE_MAX_FILES = int(os.getenv("PROFILE_MAX_FILES", "200"))
+PROFILE_INTERVAL = float(os.getenv("PROFILE_INTERVAL", "0.005"))  # sampling 간격(초)
+
+MODES = ("sample", "cprofile")
+# 파일명에 쓰이므로 '.' 불허 (_prune의 "{id}.*" glob이 다른 id의 파일까지 지우지 않도록)
+_ID_RE = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+# cProfile은 스레드당 하나만 활성화 가능 → 동시에 요청되면 나머지는 sample 모드로
+_cprofile_lock = threading.Lock()
+
+
+def profiling_enabled() -> bool:
+    return bool(PROFILE_ADMIN_TOKEN) or PROFILE_SAMPLE_EVERY > 0
+
+
+def check_admin_token(token: Optional[str]) -> bool:
+    if not PROFILE_ADMIN_TOKEN or not token:
+        return False
+    return hmac.compare_digest(token, PROFILE_ADMIN_TOKEN)
+
+
+# -------------------------
+# profilers
+# -------------------------
+class StackSampler:
+    """
+    별도 스레드에서 interval마다 모든 스레드의 스택을 떠서 collapsed stack으로 누적.
+    - 스레드풀에서 도는 LLM/파이프라인 코드까지 잡힘 (cProfile은 이벤트 루프 스레드만 봄)
+    - 같은 시간대에 처리 중인 다른 요청의 스택도 섞일 수 있음
+    """
+
+    def __init__(self, interval: float = PROFILE_INTERVAL):
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        me = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for tid, frame in sys._current_frames().items():
+                if tid == me:
+                    continue
+                parts: List[str] = []
+                while frame is not None:
+                    code = frame.f_code
+                    parts.append(f"{code.co_name} ({Path(code.co_filename).name}:{frame.f_lineno})")
+                    frame = frame.f_back
+                self.stacks[";".join(reversed(parts))] += 1
+            self.samples += 1
+
+    def dump(self) -> bytes:
+        # flamegraph.pl / speedscope 에서 바로 읽을 수 있는 "stack count" 형식
+        return "".join(f"{s} {n}\n" for s, n in self.stacks.most_common()).encode("utf-8")
+
+
+# -------------------------
+# storage
+# -------------------------
+def _suffix(mode: str) -> str:
+    return ".pstats" if mode == "cprofile" else ".collapsed"
+
+
+def save_profile(profile_id: str, mode: str, body: bytes, meta: Dict[str, Any]) -> Path:
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    path = PROFILE_DIR / f"{profile_id}{_suffix(mode)}"
+    path.write_bytes(body)
+    meta = {**meta, "id": profile_id, "mode": mode, "file": path.name, "bytes": len(body)}
+    (PROFILE_DIR / f"{profile_id}.json").write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+    _prune()
+    return path
+
+
+def _prune() -> None:
+    metas = sorted(PROFILE_DIR.glob("*.json"), key=lambda p: p.stat().st_mtime)
+    for meta_path in metas[: max(0, len(metas) - PROFILE_MAX_FILES)]:
+        for p in PROFILE_DIR.glob(f"{meta_path.stem}.*"):
+            p.unlink(missing_ok=True)
+
+
+def list_profiles() -> List[Dict[str, Any]]:
+    if not PROFILE_DIR.exists():
+        return []
+    out = []
+    for meta_path in sorted(PROFILE_DIR.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True):
+        try:
+            out.append(json.loads(meta_path.read_text(encoding="utf-8")))
+        except (OSError, ValueError):
+            continue
+    return out
+
+
+def get_profile_path(profile_id: str) -> Optional[Path]:
+    if not _ID_RE.match(profile_id):
+        return None
+    for mode in MODES:
+        path = PROFILE_DIR / f"{profile_id}{_suffix(mode)}"
+        if path.exists():
+            return path
+    return None
+
+
+# -------------------------
+# middleware
+# -------------------------
+class ProfilingMiddleware:
+    def __init__(self, app, sample_every: int = PROFILE_SAMPLE_EVERY):
+        self.app = app
+        self.sample_every = sample_every
+        self._counter = itertools.count(1)
+
+    def _requested_mode(self, scope) -> Optional[str]:
+        headers = dict(scope.get("headers") or [])
+        flag = headers.get(b"x-profile", b"").decode("latin-1").strip().lower()
+        if not flag:
+            query = scope.get("query_string", b"").decode("latin-1")
+            m = re.search(r"(?:^|&)profile=([^&]*)", query)
+            flag = m.group(1).lower() if m else ""
+        if flag and flag not in ("0", "false"):
+            token = headers.get(b"x-admin-token", b"").decode("latin-1")
+            if check_admin_token(token):
+                return "cprofile" if flag == "cprofile" else "sample"
+        if self.sample_every > 0 and next(self._counter) % self.sample_every == 0:
+            return "sample"
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        mode = self._requested_mode(scope)
+        if mode is None:
+            await self.app(scope, receive, send)
+            return
+
+        # 파일 id는 항상 서버에서 생성 (클라이언트가 X-Request-ID로 기존 프로파일을 덮어쓰지 못하도록)
+        # X-Request-ID는 meta에만 기록
+        headers = dict(scope.get("headers") or [])
+        rid = headers.get(b"x-request-id", b"").decode("latin-1")
+        profile_id = uuid.uuid4().hex
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                message["headers"] = list(message.get("headers", [])) + [(b"x-profile-id", profile_id.encode("latin-1"))]
+            await send(message)
+
+        if mode == "cprofile" and not _cprofile_lock.acquire(blocking=False):
+            mode = "sample"
+        profiler: Any = cProfile.Profile() if mode == "cprofile" else StackSampler()
+        started_at = datetime.utcnow().isoformat()
+        t0 = time.perf_counter()
+        if mode == "cprofile":
+            profiler.enable()
+        else:
+            profiler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if mode == "cprofile":
+                profiler.disable()
+                _cprofile_lock.release()
+            else:
+                profiler.stop()
+            elapsed = time.perf_counter() - t0
+            meta = {
+                "method": scope["method"],
+                "path": scope["path"],
+                "query": scope.get("query_string", b"").decode("latin-1"),
+                "status": status["code"],
+                "elapsed_ms": round(elapsed * 1000, 3),
+                "created_at": started_at,
+                "request_id": rid if _ID_RE.match(rid) else None,
+            }
+            try:
+                if mode == "cprofile":
+                    profiler.create_stats()
+                    body = marshal.dumps(profiler.stats)  # pstats.Stats(path)로 읽을 수 있는 형식
+                else:
+                    body = profiler.dump()
+                    meta["samples"] = profiler.samples
+                # 파일 쓰기 + prune glob이 이벤트 루프를 막지 않도록 스레드에서
+                await anyio.to_thread.run_sync(save_profile, profile_id, mode, body, meta)
+            except Exception as e:
+                logger.warning(f"failed to store profile {profile_id}: {e}")
+
+
+def add_profiling(app: FastAPI) -> None:
+    """PROFILE_ADMIN_TOKEN 또는 PROFILE_SAMPLE_EVERY가 설정된 경우에만 등록"""
+    if not profiling_enabled():
+        return
+    app.add_middleware(ProfilingMiddleware)
+    logger.info(
+        f"profiling: on-demand={'on' if PROFILE_ADMIN_TOKEN else 'off'}, sample_every={PROFILE_SAMPLE_EVERY}"
+    )
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    orjson으로 직렬화하는 기본 응답 클래스.
+    - 한글을 \\uXXXX로 이스케이프하지 않아 바이트 수가 작고, 표준 json보다 수 배 빠름
+    - datetime / dataclass / numpy 배열도 바로 직렬화
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import logging
+import re
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import OperationalError
+
+logger = logging.getLogger(__name__)
+
+# policies 테이블을 content로 쓰는 external-content FTS5 인덱스
+# - trigram 토크나이저: 띄어쓰기/형태소와 무관하게 부분 문자열 매칭 → 한국어에 적합
+# - 본문은 policies에만 저장되고 FTS에는 인덱스만 유지
+FTS_TABLE = "policies_fts"
+FTS_COLUMNS = ("policy_name", "support_summary", "support_detail")
+
+_CREATE_FTS = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+    policy_name, support_summary, support_detail,
+    content='policies', content_rowid='rowid',
+    tokenize='trigram'
+)
+"""
+
+_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON policies BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, policy_name, support_summary, support_detail)
+        VALUES (new.rowid, new.policy_name, new.support_summary, new.support_detail);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON policies BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, policy_name, support_summary, support_detail)
+        VALUES ('delete', old.rowid, old.policy_name, old.support_summary, old.support_detail);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE ON policies BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, policy_name, support_summary, support_detail)
+        VALUES ('delete', old.rowid, old.policy_name, old.support_summary, old.support_detail);
+        INSERT INTO {FTS_TABLE}(rowid, policy_name, support_summary, support_detail)
+        VALUES (new.rowid, new.policy_name, new.support_summary, new.support_detail);
+    END
+    """,
+]
+
+# trigram은 3글자 미만 토큰을 색인할 수 없음
+MIN_TRIGRAM_LEN = 3
+
+_fts_ready = False
+
+
+def fts_ready() -> bool:
+    return _fts_ready
+
+
+def ensure_policy_fts(conn: Connection) -> bool:
+    """
+    FTS 테이블 + 동기화 트리거 생성(없을 때만).
+    새로 만든 경우에는 기존 policies 행을 한 번 rebuild로 색인한다.
+    SQLite 빌드가 FTS5/trigram을 지원하지 않으면 False (LIKE 검색으로 동작).
+    """
+    global _fts_ready
+    if conn.dialect.name != "sqlite":
+        _fts_ready = False
+        return False
+
+    existed = conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type='table' AND name=:n"),
+        {"n": FTS_TABLE},
+    ).first() is not None
+
+    try:
+        conn.execute(text(_CREATE_FTS))
+        for ddl in _TRIGGERS:
+            conn.execute(text(ddl))
+        if not existed:
+            rebuild_policy_fts(conn)
+    except OperationalError as e:
+        logger.warning(f"FTS5(trigram) unavailable → LIKE 검색 사용 ({e})")
+        _fts_ready = False
+        return False
+
+    _fts_ready = True
+    return True
+
+
+def rebuild_policy_fts(conn: Connection) -> None:
+    """policies 전체 기준으로 FTS 인덱스 재생성 (대량 적재 후 호출)"""
+    conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES('rebuild')"))
+
+
+def split_terms(q: str) -> tuple[list[str], list[str]]:
+    """
+    검색어를 (FTS로 찾을 긴 토큰, LIKE로 보완할 짧은 토큰)으로 분리.
+    예) "청년 월세 지원사업" → (["지원사업"], ["청년", "월세"])
+    """
+    terms = [t for t in re.split(r"\s+", (q or "").strip()) if t]
+    long_terms = [t for t in terms if len(t) >= MIN_TRIGRAM_LEN]
+    short_terms = [t for t in terms if len(t) < MIN_TRIGRAM_LEN]
+    return long_terms, short_terms
+
+
+def to_match_query(terms: list[str]) -> str:
+    """각 토큰을 phrase로 감싸 AND 결합 (FTS5 문법 문자 이스케이프)"""
+    return " AND ".join('"' + t.replace('"', '""') + '"' for t in terms)
@@ -1,22 +1,31 @@
 from __future__ import annotations
 
 from datetime import datetime
-from sqlalchemy import DateTime, String, Text
+from sqlalchemy import DateTime, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
 
 class Policy(Base):
     __tablename__ = "policies"
+    __table_args__ = (
+        # keyset 페이지네이션: ORDER BY updated_at DESC, policy_id DESC
+        Index("ix_policies_updated_at_policy_id", "updated_at", "policy_id"),
+        Index("ix_policies_region_updated_at_policy_id", "region", "updated_at", "policy_id"),
+    )
 
     policy_id: Mapped[str] = mapped_column(String, primary_key=True)
 
     policy_name: Mapped[str] = mapped_column(String, nullable=False, index=True)
     support_summary: Mapped[str | None] = mapped_column(Text, nullable=True)
-    support_detail: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # 대용량 텍스트는 기본 로드에서 제외 (필요한 쿼리에서만 undefer/load_only)
+    support_detail: Mapped[str | None] = mapped_column(Text, nullable=True, deferred=True, deferred_raiseload=True)
 
     region: Mapped[str | None] = mapped_column(String, nullable=True, index=True)
 
-    clean_text: Mapped[str] = mapped_column(Text, nullable=False)
+    clean_text: Mapped[str] = mapped_column(Text, nullable=False, deferred=True, deferred_raiseload=True)
+    # cleaner build_text_bundle 출력: 임베딩 입력(원문 발췌 제외) / 추천·유사 카드용 한 줄 요약
+    embedding_text: Mapped[str | None] = mapped_column(Text, nullable=True, deferred=True, deferred_raiseload=True)
+    card_snippet: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from sqlalchemy import Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+class PolicyChunk(Base):
+    """cleaner 출력(policy_chunks.csv)과 동일한 계약의 섹션 청크 테이블 (QA 인덱스가 policies.clean_text와 함께 읽음)"""
+
+    __tablename__ = "policy_chunks"
+
+    policy_id: Mapped[str] = mapped_column(String, primary_key=True)
+    chunk_no: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    section: Mapped[str] = mapped_column(String, nullable=False)
+    # clean_text 안의 [start, end) 글자 오프셋
+    start: Mapped[int] = mapped_column(Integer, nullable=False)
+    end: Mapped[int] = mapped_column(Integer, nullable=False)
+    tokens: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, Boolean, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+class PolicyEligibility(Base):
+    """cleaner 출력(policy_eligibility.csv)과 동일한 계약의 자격조건 테이블"""
+
+    __tablename__ = "policy_eligibility"
+    __table_args__ = (
+        Index("ix_policy_eligibility_age", "min_age", "max_age"),
+        Index("ix_policy_eligibility_income", "income_rule_type", "income_threshold"),
+    )
+
+    policy_id: Mapped[str] = mapped_column(String, primary_key=True)
+
+    min_age: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    max_age: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    income_rule_type: Mapped[str] = mapped_column(String, nullable=False, default="NONE")  # NONE/AMOUNT/MEDIAN_RATIO
+    income_threshold: Mapped[int | None] = mapped_column(BigInteger, nullable=True)  # 연소득(원)
+    asset_threshold: Mapped[int | None] = mapped_column(BigInteger, nullable=True)  # 원
+
+    is_homeowner_required: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    vehicle_value_limit: Mapped[int | None] = mapped_column(BigInteger, nullable=True)  # 원
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from sqlalchemy import BigInteger, Boolean, Date, DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+class RunPolicyDaily(Base):
+    """정책 × 일자별 추천 횟수 (recommendation_runs 압축 시 누적)"""
+
+    __tablename__ = "run_policy_daily"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    policy_id: Mapped[str] = mapped_column(String, primary_key=True, index=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+class RunProfileDaily(Base):
+    """프로필 구간 × 일자별 실행 수 (연령대/소득구간/주택소유)"""
+
+    __tablename__ = "run_profile_daily"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    age_band: Mapped[str] = mapped_column(String, primary_key=True)
+    income_band: Mapped[str] = mapped_column(String, primary_key=True)
+    is_homeowner: Mapped[bool] = mapped_column(Boolean, primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+class RunArchivePartition(Base):
+    """일자별 컬럼형 아카이브 파일 목록"""
+
+    __tablename__ = "run_archive_partitions"
+
+    path: Mapped[str] = mapped_column(String, primary_key=True)
+    day: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    rows: Mapped[int] = mapped_column(Integer, nullable=False)
+    bytes: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    first_run_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    last_run_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
@@ -1,34 +1,296 @@
 from __future__ import annotations
 
-from typing import Optional
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional, Sequence
+from sqlalchemy import and_, func, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, undefer
+from sqlalchemy.sql.elements import ColumnElement
 
+from ...core.metrics import instrument_repository
+from ..fts import FTS_TABLE, fts_ready, split_terms, to_match_query
 from ..models.policy import Policy
+from ..models.policy_eligibility import PolicyEligibility
 
+
+@dataclass
+class EligibilityFilter:
+    """사용자 조건으로 정책 후보를 DB에서 미리 거르는 필터 (값이 None인 항목은 미적용)"""
+    age: Optional[int] = None
+    annual_income: Optional[int] = None  # 원
+    assets: Optional[int] = None  # 원
+    is_homeless: Optional[bool] = None
+    vehicle_value: Optional[int] = None  # 원
+
+    def is_empty(self) -> bool:
+        return all(
+            v is None
+            for v in (self.age, self.annual_income, self.assets, self.is_homeless, self.vehicle_value)
+        )
+
+    def clauses(self) -> list[ColumnElement[bool]]:
+        """check_eligibility와 같은 기준 (조건이 비어 있으면 통과)"""
+        e = PolicyEligibility
+        out: list[ColumnElement[bool]] = []
+        if self.age is not None:
+            out.append(or_(e.min_age.is_(None), e.min_age <= self.age))
+            out.append(or_(e.max_age.is_(None), e.max_age >= self.age))
+        if self.annual_income is not None:
+            out.append(
+                or_(
+                    func.coalesce(e.income_rule_type, "NONE") != "AMOUNT",
+                    e.income_threshold.is_(None),
+                    e.income_threshold >= self.annual_income,
+                )
+            )
+        if self.assets is not None:
+            out.append(or_(e.asset_threshold.is_(None), e.asset_threshold >= self.assets))
+        if self.is_homeless is False:
+            out.append(func.coalesce(e.is_homeowner_required, False).is_(False))
+        if self.vehicle_value is not None:
+            out.append(or_(e.vehicle_value_limit.is_(None), e.vehicle_value_limit >= self.vehicle_value))
+        return out
+
+
+# -------------------------
+# keyset cursor: (updated_at, policy_id)
+# -------------------------
+def encode_cursor(updated_at: datetime, policy_id: str) -> str:
+    raw = json.dumps([updated_at.isoformat(), policy_id], ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """잘못된 커서는 ValueError"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        updated_at, policy_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(updated_at), str(policy_id)
+    except Exception as e:
+        raise ValueError(f"invalid cursor: {cursor!r}") from e
+
+
+# 목록/검색에서 읽는 요약 컬럼 (support_detail/clean_text는 요청 시에만)
+SUMMARY_COLUMNS = (
+    Policy.policy_id,
+    Policy.policy_name,
+    Policy.support_summary,
+    Policy.region,
+    Policy.updated_at,
+)
+
+
+@instrument_repository()
 class PolicyRepository:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def list_policies(self, *, limit: int = 50, offset: int = 0) -> list[Policy]:
-        stmt = select(Policy).order_by(Policy.updated_at.desc()).limit(limit).offset(offset)
-        return list(self.db.execute(stmt).scalars().all())
+    def _use_fts(self) -> bool:
+        return self.db.bind.dialect.name == "sqlite" and fts_ready()
+
+    @staticmethod
+    def _like_clause(term: str) -> ColumnElement[bool]:
+        pattern = f"%{term}%"
+        return or_(
+            Policy.policy_name.like(pattern),
+            Policy.support_summary.like(pattern),
+            Policy.support_detail.like(pattern),
+        )
+
+    def _text_filter(self, q: str) -> Optional[ColumnElement[bool]]:
+        """
+        검색어 → WHERE 절.
+        - FTS 사용 가능 + 3글자 이상 토큰: FTS 인덱스로 rowid 후보를 먼저 좁힘
+        - 3글자 미만 토큰(trigram 한계) 또는 FTS 미지원: LIKE로 보완
+        """
+        long_terms, short_terms = split_terms(q)
+        if not long_terms and not short_terms:
+            return None
 
-    def get_policy(self, policy_id: str) -> Optional[Policy]:
-        stmt = select(Policy).where(Policy.policy_id == policy_id)
-        return self.db.execute(stmt).scalars().first()
+        clauses: list[ColumnElement[bool]] = []
+        if long_terms and self._use_fts():
+            clauses.append(
+                text(
+                    f"policies.rowid IN (SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :fts_q)"
+                ).bindparams(fts_q=to_match_query(long_terms))
+            )
+        else:
+            short_terms = long_terms + short_terms
+        clauses.extend(self._like_clause(t) for t in short_terms)
+        return and_(*clauses)
+
+    async def list_policies(
+        self,
+        *,
+        limit: int = 50,
+        cursor: Optional[tuple[datetime, str]] = None,
+        q: Optional[str] = None,
+        region: Optional[str] = None,
+        updated_since: Optional[datetime] = None,
+        eligibility: Optional[EligibilityFilter] = None,
+        fields: Sequence[str] = (),
+    ) -> tuple[list[Policy], Optional[str]]:
+        """
+        keyset 페이지네이션 목록 조회.
+        - 정렬: updated_at DESC, policy_id DESC (ix_policies_updated_at_policy_id)
+        - cursor: 이전 페이지 마지막 행의 (updated_at, policy_id) → OFFSET 없이 바로 이어서 읽음
+        - fields: 요약 컬럼 외에 추가로 읽을 대용량 컬럼(support_detail, clean_text)
+        반환: (이번 페이지 정책들, 다음 페이지 커서 또는 None)
+        """
+        extra = [getattr(Policy, f) for f in fields]
+        stmt = select(Policy).options(load_only(*SUMMARY_COLUMNS, *extra, raiseload=True))
+
+        conds: list[ColumnElement[bool]] = []
+        if q:
+            cond = self._text_filter(q)
+            if cond is not None:
+                conds.append(cond)
+        if region:
+            conds.append(Policy.region == region)
+        if updated_since is not None:
+            conds.append(Policy.updated_at >= updated_since)
+        if eligibility is not None and not eligibility.is_empty():
+            stmt = stmt.outerjoin(PolicyEligibility, PolicyEligibility.policy_id == Policy.policy_id)
+            conds.extend(eligibility.clauses())
+        if cursor is not None:
+            last_updated_at, last_policy_id = cursor
+            conds.append(
+                or_(
+                    Policy.updated_at < last_updated_at,
+                    and_(Policy.updated_at == last_updated_at, Policy.policy_id < last_policy_id),
+                )
+            )
 
-    def search_policies(self, q: str, *, limit: int = 50, offset: int = 0) -> list[Policy]:
-        pattern = f"%{q}%"
+        stmt = (
+            stmt.where(*conds)
+            .order_by(Policy.updated_at.desc(), Policy.policy_id.desc())
+            .limit(limit + 1)
+        )
+        rows = list((await self.db.execute(stmt)).scalars().all())
+
+        next_cursor: Optional[str] = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(last.updated_at, last.policy_id)
+        return rows, next_cursor
+
+    async def data_version(self) -> str:
+        """
+        policies 전체의 데이터 버전 (max(updated_at) + 행 수).
+        updated_at 인덱스만 읽으므로 목록 쿼리보다 훨씬 가벼움 → ETag/응답 캐시 키로 사용.
+        """
+        stmt = select(func.max(Policy.updated_at), func.count(Policy.policy_id))
+        max_updated_at, cnt = (await self.db.execute(stmt)).one()
+        return f"{max_updated_at.isoformat() if max_updated_at else '-'}:{cnt}"
+
+    async def get_policy_version(self, policy_id: str) -> Optional[datetime]:
+        """단건 ETag용 updated_at (PK 조회, 대용량 컬럼은 읽지 않음)"""
+        stmt = select(Policy.updated_at).where(Policy.policy_id == policy_id)
+        return (await self.db.execute(stmt)).scalar_one_or_none()
+
+    async def get_policy(self, policy_id: str) -> Optional[Policy]:
         stmt = (
             select(Policy)
-            .where(
-                (Policy.policy_name.like(pattern))
-                | (Policy.support_summary.like(pattern))
-                | (Policy.support_detail.like(pattern))
-            )
+            .options(undefer(Policy.support_detail), undefer(Policy.clean_text))
+            .where(Policy.policy_id == policy_id)
+        )
+        return (await self.db.execute(stmt)).scalars().first()
+
+    async def get_policies_by_ids(self, policy_ids: Sequence[str], *, fields: Sequence[str] = ()) -> list[Policy]:
+        """
+        여러 정책을 IN 쿼리 한 번으로 조회 (N+1 방지).
+        요청한 순서를 유지하고 중복/없는 ID는 건너뛴다.
+        """
+        ids = list(dict.fromkeys(policy_ids))
+        if not ids:
+            return []
+        extra = [getattr(Policy, f) for f in fields]
+        stmt = (
+            select(Policy)
+            .options(load_only(*SUMMARY_COLUMNS, *extra, raiseload=True))
+            .where(Policy.policy_id.in_(ids))
+        )
+        by_id = {p.policy_id: p for p in (await self.db.execute(stmt)).scalars().all()}
+        return [by_id[i] for i in ids if i in by_id]
+
+    async def search_policies(self, q: str, *, limit: int = 50, offset: int = 0) -> list[Policy]:
+        cond = self._text_filter(q)
+        if cond is None:
+            return []
+        stmt = (
+            select(Policy)
+            .options(load_only(*SUMMARY_COLUMNS, Policy.support_detail, raiseload=True))
+            .where(cond)
             .order_by(Policy.updated_at.desc())
             .limit(limit)
             .offset(offset)
         )
-        return list(self.db.execute(stmt).scalars().all())
+        return list((await self.db.execute(stmt)).scalars().all())
+
+    async def search_ranked(self, q: str, *, limit: int = 20) -> list[dict[str, Any]]:
+        """
+        관련도 순 검색 + 하이라이트 snippet.
+        FTS를 쓸 수 없는 경우(짧은 검색어만 있음 / Postgres 등)에는
+        LIKE 결과를 최신순으로 돌려주고 snippet은 파이썬에서 잘라 만든다.
+        """
+        long_terms, short_terms = split_terms(q)
+        if not long_terms and not short_terms:
+            return []
+
+        if long_terms and self._use_fts():
+            params: dict[str, Any] = {"fts_q": to_match_query(long_terms), "limit": limit}
+            like_sql = ""
+            for i, t in enumerate(short_terms):
+                params[f"s{i}"] = f"%{t}%"
+                like_sql += (
+                    f" AND (p.policy_name LIKE :s{i} OR p.support_summary LIKE :s{i}"
+                    f" OR p.support_detail LIKE :s{i})"
+                )
+            sql = text(
+                f"""
+                SELECT p.policy_id, p.policy_name, p.support_summary, p.region,
+                       snippet({FTS_TABLE}, -1, '[', ']', '…', 24) AS snippet,
+                       -bm25({FTS_TABLE}) AS score
+                FROM {FTS_TABLE}
+                JOIN policies AS p ON p.rowid = {FTS_TABLE}.rowid
+                WHERE {FTS_TABLE} MATCH :fts_q{like_sql}
+                ORDER BY bm25({FTS_TABLE})
+                LIMIT :limit
+                """
+            )
+            rows = (await self.db.execute(sql, params)).mappings().all()
+            return [dict(r) for r in rows]
+
+        terms = long_terms + short_terms
+        policies = await self.search_policies(q, limit=limit)
+        return [
+            {
+                "policy_id": p.policy_id,
+                "policy_name": p.policy_name,
+                "support_summary": p.support_summary,
+                "region": p.region,
+                "snippet": _make_snippet(p, terms),
+                "score": None,
+            }
+            for p in policies
+        ]
+
+
+def _make_snippet(p: Policy, terms: list[str], width: int = 40) -> Optional[str]:
+    for body in (p.policy_name, p.support_summary, p.support_detail):
+        if not body:
+            continue
+        for t in terms:
+            i = body.find(t)
+            if i >= 0:
+                s, e = max(0, i - width), min(len(body), i + len(t) + width)
+                return (
+                    ("…" if s > 0 else "")
+                    + body[s:i] + "[" + t + "]" + body[i + len(t):e]
+                    + ("…" if e < len(body) else "")
+                )
+    return None
@@ -4,16 +4,18 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 import json
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...core.metrics import instrument_repository
 from ..models.run_log import RecommendationRun
 
+@instrument_repository()
 class RunRepository:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def create_run(
+    async def create_run(
         self,
         *,
         profile: Dict[str, Any],
@@ -28,14 +30,52 @@ class RunRepository:
             results_json=json.dumps(results, ensure_ascii=False),
         )
         self.db.add(run)
-        self.db.commit()
-        self.db.refresh(run)
+        await self.db.commit()
+        await self.db.refresh(run)
         return run
 
-    def list_runs(self, *, limit: int = 50, offset: int = 0) -> list[RecommendationRun]:
+    async def create_runs_bulk(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        여러 실행 로그를 한 트랜잭션의 multi-row insert로 저장 (write-behind 큐 flush용).
+        rows: {"user_id", "created_at", "profile_json", "results_json"}
+        """
+        if not rows:
+            return 0
+        await self.db.execute(insert(RecommendationRun), rows)
+        await self.db.commit()
+        return len(rows)
+
+    async def list_runs(self, *, limit: int = 50, offset: int = 0) -> list[RecommendationRun]:
         stmt = select(RecommendationRun).order_by(RecommendationRun.created_at.desc()).limit(limit).offset(offset)
-        return list(self.db.execute(stmt).scalars().all())
+        return list((await self.db.execute(stmt)).scalars().all())
+
+    async def oldest_created_at(self, *, before: datetime) -> Optional[datetime]:
+        stmt = select(func.min(RecommendationRun.created_at)).where(RecommendationRun.created_at < before)
+        return (await self.db.execute(stmt)).scalar()
+
+    async def runs_in_range(
+        self, *, start: datetime, end: datetime, after_id: int = 0, limit: int = 5000
+    ) -> list[RecommendationRun]:
+        """[start, end) 구간의 실행 로그를 id 순으로 limit개씩 (압축 작업용)"""
+        stmt = (
+            select(RecommendationRun)
+            .where(
+                RecommendationRun.created_at >= start,
+                RecommendationRun.created_at < end,
+                RecommendationRun.id > after_id,
+            )
+            .order_by(RecommendationRun.id)
+            .limit(limit)
+        )
+        return list((await self.db.execute(stmt)).scalars().all())
+
+    async def delete_runs(self, run_ids: List[int]) -> int:
+        """commit은 호출 측에서 (롤업 반영과 같은 트랜잭션으로 묶기 위해)"""
+        if not run_ids:
+            return 0
+        res = await self.db.execute(delete(RecommendationRun).where(RecommendationRun.id.in_(run_ids)))
+        return res.rowcount or 0
 
-    def get_run(self, run_id: int) -> Optional[RecommendationRun]:
+    async def get_run(self, run_id: int) -> Optional[RecommendationRun]:
         stmt = select(RecommendationRun).where(RecommendationRun.id == run_id)
-        return self.db.execute(stmt).scalars().first()
+        return (await self.db.execute(stmt)).scalars().first()
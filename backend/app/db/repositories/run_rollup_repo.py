@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import desc, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...core.metrics import instrument_repository
+from ..models.run_rollup import RunArchivePartition, RunPolicyDaily, RunProfileDaily
+
+@instrument_repository()
+class RunRollupRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def _insert(self, model):
+        if self.db.bind.dialect.name == "postgresql":
+            return pg_insert(model)
+        return sqlite_insert(model)
+
+    # -------------------------
+    # write (compaction job)
+    # -------------------------
+    async def add_policy_counts(self, day: date, counts: Dict[str, int]) -> None:
+        if not counts:
+            return
+        stmt = self._insert(RunPolicyDaily)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[RunPolicyDaily.day, RunPolicyDaily.policy_id],
+            set_={"count": RunPolicyDaily.count + stmt.excluded.count},
+        )
+        await self.db.execute(stmt, [{"day": day, "policy_id": k, "count": v} for k, v in counts.items()])
+
+    async def add_profile_counts(self, day: date, counts: Dict[Tuple[str, str, bool], int]) -> None:
+        if not counts:
+            return
+        stmt = self._insert(RunProfileDaily)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                RunProfileDaily.day,
+                RunProfileDaily.age_band,
+                RunProfileDaily.income_band,
+                RunProfileDaily.is_homeowner,
+            ],
+            set_={"count": RunProfileDaily.count + stmt.excluded.count},
+        )
+        rows = [
+            {"day": day, "age_band": a, "income_band": i, "is_homeowner": h, "count": v}
+            for (a, i, h), v in counts.items()
+        ]
+        await self.db.execute(stmt, rows)
+
+    async def add_partition(self, **values: Any) -> None:
+        stmt = self._insert(RunArchivePartition).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[RunArchivePartition.path],
+            set_={k: stmt.excluded[k] for k in values if k != "path"},
+        )
+        await self.db.execute(stmt)
+
+    # -------------------------
+    # read (analytics)
+    # -------------------------
+    async def covered_until(self) -> Optional[date]:
+        """롤업에 반영된 마지막 일자 (이후 일자는 아직 hot 테이블에만 있음)"""
+        return (await self.db.execute(select(func.max(RunArchivePartition.day)))).scalar()
+
+    async def top_policies(self, *, since: date, limit: int = 20) -> List[Dict[str, Any]]:
+        total = func.sum(RunPolicyDaily.count).label("count")
+        stmt = (
+            select(RunPolicyDaily.policy_id, total)
+            .where(RunPolicyDaily.day >= since)
+            .group_by(RunPolicyDaily.policy_id)
+            .order_by(desc(total), RunPolicyDaily.policy_id)
+            .limit(limit)
+        )
+        return [dict(r) for r in (await self.db.execute(stmt)).mappings().all()]
+
+    async def profile_distribution(self, *, since: date) -> List[Dict[str, Any]]:
+        total = func.sum(RunProfileDaily.count).label("count")
+        stmt = (
+            select(RunProfileDaily.age_band, RunProfileDaily.income_band, RunProfileDaily.is_homeowner, total)
+            .where(RunProfileDaily.day >= since)
+            .group_by(RunProfileDaily.age_band, RunProfileDaily.income_band, RunProfileDaily.is_homeowner)
+            .order_by(RunProfileDaily.age_band, RunProfileDaily.income_band, RunProfileDaily.is_homeowner)
+        )
+        return [dict(r) for r in (await self.db.execute(stmt)).mappings().all()]
@@ -1,14 +1,13 @@
 from __future__ import annotations
 
 import os
-from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator
+from typing import AsyncGenerator
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 # 1) .env를 '프로젝트 루트'에서 확실히 로드
 ROOT_DIR = Path(__file__).resolve().parents[2]  # backend/app/db/session.py 기준 -> policy_reco/
@@ -17,35 +16,149 @@ load_dotenv(ROOT_DIR / ".env")
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./policy.sqlite3")
 
 # 2) sqlite 파일 경로면 부모 폴더 자동 생성(./data 같은 케이스)
-if DATABASE_URL.startswith("sqlite:///"):
-    db_path = DATABASE_URL.replace("sqlite:///", "")
+if DATABASE_URL.startswith("sqlite:///") and ":memory:" not in DATABASE_URL:
+    db_path = DATABASE_URL.split(":///", 1)[1]
     db_file = (ROOT_DIR / db_path).resolve()
     db_file.parent.mkdir(parents=True, exist_ok=True)
 
-def _make_engine():
-    if DATABASE_URL.startswith("sqlite"):
-        return create_engine(
-            DATABASE_URL,
-            connect_args={"check_same_thread": False},
-            poolclass=StaticPool,
-            future=True,
+# 3) 풀/프라그마 설정 (환경변수로 조정)
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", str(64 * 1024)))
+
+
+def to_async_url(url: str) -> str:
+    """
+    .env에는 기존처럼 동기 URL(sqlite:///..., postgresql://...)을 적고,
+    엔진 생성 시 async 드라이버(aiosqlite / asyncpg)로 바꿔 끼운다.
+    """
+    u = make_url(url)
+    backend = u.get_backend_name()
+    if backend == "sqlite":
+        u = u.set(drivername="sqlite+aiosqlite")
+    elif backend in ("postgresql", "postgres"):
+        u = u.set(drivername="postgresql+asyncpg")
+    return u.render_as_string(hide_password=False)
+
+
+def is_sqlite(url: str = DATABASE_URL) -> bool:
+    return make_url(url).get_backend_name() == "sqlite"
+
+
+def _set_sqlite_pragmas(dbapi_conn, _record) -> None:
+    """
+    커넥션마다 적용되는 SQLite 튜닝.
+    - WAL: 읽기와 쓰기가 서로를 막지 않음(동시 읽기 확장의 핵심)
+    - synchronous=NORMAL: WAL에서는 커밋마다 fsync 하지 않아도 안전
+    - mmap_size / cache_size: 페이지를 메모리에 올려 읽기 I/O 절감
+    """
+    cur = dbapi_conn.cursor()
+    cur.execute("PRAGMA journal_mode=WAL")
+    cur.execute(f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}")
+    cur.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+    cur.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+    cur.execute(f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KB}")
+    cur.execute("PRAGMA temp_store=MEMORY")
+    cur.execute("PRAGMA foreign_keys=ON")
+    cur.close()
+
+
+def _make_engine() -> AsyncEngine:
+    url = to_async_url(DATABASE_URL)
+
+    if is_sqlite():
+        if ":memory:" in DATABASE_URL or DATABASE_URL.rstrip("/") == "sqlite:":
+            # 메모리 DB는 커넥션마다 다른 DB가 되므로 풀 설정 없이 기본(StaticPool) 사용
+            return create_async_engine(url)
+        engine = create_async_engine(
+            url,
+            pool_size=POOL_SIZE,
+            max_overflow=MAX_OVERFLOW,
+            pool_timeout=POOL_TIMEOUT,
+            pool_pre_ping=True,
         )
-    return create_engine(DATABASE_URL, future=True)
+        event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+        return engine
+
+    return create_async_engine(
+        url,
+        pool_size=POOL_SIZE,
+        max_overflow=MAX_OVERFLOW,
+        pool_timeout=POOL_TIMEOUT,
+        pool_recycle=POOL_RECYCLE,
+        pool_pre_ping=True,
+    )
+
 
 engine = _make_engine()
 
-SessionLocal = sessionmaker(
+SessionLocal = async_sessionmaker(
     bind=engine,
     autoflush=False,
-    autocommit=False,
     expire_on_commit=False,
-    class_=Session,
+    class_=AsyncSession,
 )
 
-@contextmanager
-def get_db() -> Generator[Session, None, None]:
-    db = SessionLocal()
-    try:
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI Depends용 세션 제공자 (요청 단위로 풀에서 커넥션 대여/반납)"""
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
+
+
+async def init_db() -> None:
+    """모델 테이블 생성 (없을 때만)"""
+    from .models import Base  # noqa: F401
+    from .models import policy, policy_chunk, policy_eligibility, raw_policy, run_log, run_rollup  # noqa: F401  (metadata 등록)
+    from .fts import ensure_policy_fts
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_add_missing_columns)
+        await conn.run_sync(_create_missing_indexes)
+        await conn.run_sync(ensure_policy_fts)
+
+
+def _add_missing_columns(conn) -> None:
+    """
+    create_all은 기존 테이블에 새로 추가된 컬럼도 만들지 않으므로 nullable 컬럼만 ADD COLUMN으로 보강
+    (NOT NULL 컬럼은 다음 publish의 테이블 교체로 생김)
+    """
+    from sqlalchemy import inspect, text
+
+    from .models import Base
+
+    insp = inspect(conn)
+    prep = conn.dialect.identifier_preparer
+    for table in Base.metadata.sorted_tables:
+        if not insp.has_table(table.name):
+            continue
+        have = {c["name"] for c in insp.get_columns(table.name)}
+        for col in table.columns:
+            if col.name in have or not col.nullable or col.primary_key:
+                continue
+            conn.execute(
+                text(
+                    f"ALTER TABLE {prep.quote(table.name)} ADD COLUMN {prep.quote(col.name)} "
+                    f"{col.type.compile(dialect=conn.dialect)}"
+                )
+            )
+
+
+def _create_missing_indexes(conn) -> None:
+    """create_all은 기존 테이블에 새로 추가된 인덱스를 만들지 않으므로 별도 보강"""
+    from .models import Base
+
+    for table in Base.metadata.sorted_tables:
+        for idx in table.indexes:
+            idx.create(conn, checkfirst=True)
+
+
+async def dispose_db() -> None:
+    await engine.dispose()
@@ -1,19 +1,53 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from .core.admission import add_admission_control
+from .core.compression import add_compression
+from .core.metrics import MetricsMiddleware
+from .core.profiling import add_profiling
+from .core.responses import ORJSONResponse
+from .db.session import dispose_db, init_db
+from .routers import admin
+from .routers import analytics
+from .routers import metrics
 from .routers import policies
 from .routers import recommend
 from .routers import policy_qa
 from .routers import similar
+from .services.run_log_writer import run_log_writer
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await init_db()
+    await run_log_writer.start()
+    yield
+    await run_log_writer.stop()
+    await dispose_db()
+
 
 app = FastAPI(
     title="Policy Recommendation API",
     version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+add_admission_control(app)
+add_compression(app)
+# 가장 바깥에서 측정 (압축 시간까지 포함)
+app.add_middleware(MetricsMiddleware)
+# PROFILE_ADMIN_TOKEN / PROFILE_SAMPLE_EVERY 설정 시에만 등록
+add_profiling(app)
+
 app.include_router(policies.router)
 app.include_router(recommend.router)
 app.include_router(policy_qa.router)
 app.include_router(similar.router)
+app.include_router(analytics.router)
+app.include_router(metrics.router)
+app.include_router(admin.router)
 
 # Optional: root endpoint
 @app.get("/")
@@ -21,4 +55,4 @@ def root():
     return {
         "message": "Policy Recommendation API is running",
         "version": "1.0.0"
-    }
\ No newline at end of file
+    }
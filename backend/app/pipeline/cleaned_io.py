@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from functools import lru_cache
+from typing import Any, Optional, Sequence
+
+import pandas as pd
+
+try:
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError:
+    pq = None
+
+# cleaner 출력(pipeline/cleaner/policies.csv, policy_eligibility.csv) 읽기
+# - run_clean --format parquet로 만든 같은 이름의 .parquet가 있고 pyarrow가 있으면 Parquet 우선
+# - 둘 다 필요한 컬럼만 읽음 (clean_text만 쓰는 QA가 support_detail 등까지 올리지 않도록)
+# - load_cleaned: publish_cleaned로 DB에 적재된 테이블이 있으면 DB 우선 (CLEANED_SOURCE=auto|db|files)
+# - load_chunks: run_clean이 만든 섹션 청크(policy_chunks, clean_text 오프셋)로 QA 문서 구성
+#   청크는 policies와 같은 출처에서만 읽음 (DB clean_text + 파일 청크처럼 다른 실행의 출력을 섞지 않도록)
+#   chunks_version: 청크 내용 해시 → QA 답변 캐시 키 (인덱스가 실제로 만들어진 데이터 기준)
+# - drop_duplicates: run_clean dedup 단계의 policy_dedup.csv 기준으로 대표(canonical)가 아닌 중복 정책 제외
+#   (QA 인덱스 / 서빙 스토어에서 같은 정책이 여러 번 임베딩·추천되지 않도록, CLEANED_DEDUP=0이면 끔)
+CLEANED_SOURCE = os.getenv("CLEANED_SOURCE", "auto").lower()
+CLEANED_DEDUP = os.getenv("CLEANED_DEDUP", "1") != "0"
+
+
+def resolve_cleaned(path: str | os.PathLike) -> str:
+    """실제로 읽을 파일 경로 (.parquet 또는 원래 CSV)"""
+    path = os.fspath(path)
+    parquet_path = os.path.splitext(path)[0] + ".parquet"
+    if pq is not None and os.path.exists(parquet_path):
+        return parquet_path
+    return path
+
+
+def read_cleaned(
+    path: str | os.PathLike,
+    columns: Optional[Sequence[str]] = None,
+    *,
+    encoding: str = "utf-8-sig",
+    dtype: Optional[dict] = None,
+) -> pd.DataFrame:
+    """columns 중 파일에 없는 컬럼은 건너뜀 (필수 컬럼 검사는 호출 측에서)"""
+    src = resolve_cleaned(path)
+    wanted = set(columns) if columns else None
+
+    if src.endswith(".parquet"):
+        names = pq.read_schema(src).names
+        df = pq.read_table(src, columns=[c for c in names if wanted is None or c in wanted]).to_pandas()
+        # region/income_rule_type는 dictionary 인코딩 → category 대신 일반 문자열 컬럼으로
+        for c in df.columns:
+            if isinstance(df[c].dtype, pd.CategoricalDtype):
+                df[c] = df[c].astype(object)
+        for c, t in (dtype or {}).items():
+            if c in df.columns:
+                df[c] = df[c].astype(t)
+        return df
+
+    kw: dict[str, Any] = {"encoding": encoding, "dtype": dtype}
+    if wanted is not None:
+        kw["usecols"] = lambda c: c in wanted
+    return pd.read_csv(src, **kw)
+
+
+@lru_cache(maxsize=1)
+def _sync_engine():
+    from sqlalchemy import create_engine
+
+    from ..db.session import DATABASE_URL
+
+    return create_engine(DATABASE_URL)
+
+
+def read_published(table: str, columns: Optional[Sequence[str]] = None) -> Optional[pd.DataFrame]:
+    """publish된 테이블 읽기. DB 설정이 없거나(스크립트 실행) 테이블이 없거나 비어 있으면 None"""
+    try:
+        from sqlalchemy import inspect, text
+
+        eng = _sync_engine()
+    except ImportError:
+        return None
+    if not inspect(eng).has_table(table):
+        return None
+    names = [c["name"] for c in inspect(eng).get_columns(table)]
+    cols = [c for c in names if not columns or c in columns]
+    prep = eng.dialect.identifier_preparer  # policy_chunks.start/end 등 예약어 컬럼
+    with eng.connect() as conn:
+        df = pd.read_sql(text(f"SELECT {', '.join(prep.quote(c) for c in cols)} FROM {prep.quote(table)}"), conn)
+    if not len(df):
+        return None
+    if "policy_id" in df.columns:
+        # cleaner 출력과 같은 행 순서 (숫자 policy_id 오름차순) → 행 순서 기준 임베딩과 정렬 유지
+        df = df.sort_values("policy_id", key=lambda s: s.astype(str).str.zfill(20), ignore_index=True)
+    return df
+
+
+def load_cleaned(
+    path: str | os.PathLike,
+    columns: Optional[Sequence[str]] = None,
+    *,
+    dtype: Optional[dict] = None,
+) -> tuple[pd.DataFrame, str]:
+    """
+    서빙 경로 공용 로더 → (DataFrame, 출처). 테이블 이름 = 파일 이름 (policies, policy_eligibility)
+    CLEANED_SOURCE=auto: publish된 DB 테이블이 있으면 DB, 없으면 파일 / db: DB만 / files: 파일만
+    """
+    table = os.path.splitext(os.path.basename(os.fspath(path)))[0]
+    if CLEANED_SOURCE != "files":
+        df = read_published(table, columns)
+        if df is not None:
+            for c, t in (dtype or {}).items():
+                if c in df.columns:
+                    df[c] = df[c].astype(t)
+            return df, f"db:{table}"
+        if CLEANED_SOURCE == "db":
+            raise RuntimeError(f"CLEANED_SOURCE=db but table '{table}' is not published")
+    return read_cleaned(path, columns, dtype=dtype), resolve_cleaned(path)
+
+
+def duplicate_ids(path: str | os.PathLike) -> dict[str, str]:
+    """
+    policies 출력과 같은 폴더의 policy_dedup.csv → {대표가 아닌 policy_id: canonical_id}
+    (없거나 CLEANED_DEDUP=0이면 빈 dict)
+    """
+    dedup_path = os.path.join(os.path.dirname(os.fspath(path)), "policy_dedup.csv")
+    if not CLEANED_DEDUP or not os.path.exists(dedup_path):
+        return {}
+    m = pd.read_csv(dedup_path, encoding="utf-8-sig", usecols=["policy_id", "canonical_id"], dtype=str)
+    m = m[m["policy_id"] != m["canonical_id"]]
+    return dict(zip(m["policy_id"], m["canonical_id"]))
+
+
+def drop_duplicates(df: pd.DataFrame, path: str | os.PathLike) -> pd.DataFrame:
+    """대표가 아닌 중복 정책 행 제외 (행 순서 유지)"""
+    dup = duplicate_ids(path)
+    if not dup or "policy_id" not in df.columns:
+        return df
+    return df[~df["policy_id"].astype(str).isin(dup)].reset_index(drop=True)
+
+
+def chunk_texts(policies: pd.DataFrame, chunks: Optional[pd.DataFrame]) -> list[tuple[int, str, str]]:
+    """
+    (policy_id, section, text) 목록. text = clean_text[start:end]
+    청크가 없거나 오프셋이 clean_text와 맞지 않는 정책(다른 실행의 출력, 이전 버전 출력)은 clean_text 전체 1개
+    """
+    spans: dict[int, list[tuple[str, int, int]]] = {}
+    if chunks is not None:
+        for pid, section, start, end in chunks[["policy_id", "section", "start", "end"]].itertuples(index=False):
+            spans.setdefault(int(pid), []).append((str(section), int(start), int(end)))
+
+    out: list[tuple[int, str, str]] = []
+    for pid, text in policies[["policy_id", "clean_text"]].itertuples(index=False):
+        if not isinstance(text, str) or not text:
+            continue
+        pid = int(pid)
+        parts = spans.get(pid, [])
+        if parts and all(text.startswith(f"[{section}]", start) and end <= len(text) for section, start, end in parts):
+            out.extend((pid, section, text[start:end]) for section, start, end in parts)
+        else:
+            out.append((pid, "", text))
+    return out
+
+
+def chunks_version(chunks: Sequence[tuple[int, str, str]]) -> str:
+    """chunk_texts 결과의 내용 해시 (policy_id, section, text 순서 포함)"""
+    h = hashlib.sha256()
+    for pid, section, text in chunks:
+        h.update(f"{pid}\x1f{section}\x1f{text}\x1e".encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def load_chunks(path: str | os.PathLike) -> tuple[list[tuple[int, str, str]], str]:
+    """
+    policies(load_cleaned와 같은 출처, 중복 제외) + policy_chunks → (chunk_texts 결과, 출처)
+    policies를 DB에서 읽었으면 청크도 publish된 policy_chunks 테이블, 파일이면 같은 폴더의 policy_chunks 파일
+    """
+    columns = ["policy_id", "chunk_no", "section", "start", "end"]
+    policies, source = load_cleaned(path, columns=["policy_id", "clean_text"])
+    policies = drop_duplicates(policies, path)
+    chunks = None
+    if source.startswith("db:"):
+        chunks = read_published("policy_chunks", columns)
+    else:
+        chunks_path = os.path.join(os.path.dirname(os.fspath(path)), "policy_chunks.csv")
+        if os.path.exists(resolve_cleaned(chunks_path)):
+            chunks = read_cleaned(chunks_path, columns=columns)
+    if chunks is not None and "chunk_no" in chunks.columns:
+        # DB는 policy_id 순서만 보장 → 정책 안의 청크 순서 복원
+        chunks = chunks.sort_values(["policy_id", "chunk_no"], key=lambda s: s.astype(int), kind="stable")
+    return chunk_texts(policies, chunks), source
@@ -0,0 +1,15 @@
+# 파이프라인 모듈(rag_qa_ver2, rag_filter_ver3)이 쓰는 계측 훅
+# - 백엔드(app 패키지)에서는 app.core.metrics 그대로
+# - 파이프라인 폴더에서 스크립트로 직접 실행하는 경우(app 패키지/fastapi 없음)에는 no-op
+try:
+    from app.core.metrics import INDEX_SIZE, llm_call, timed
+except ImportError:
+    from contextlib import nullcontext
+
+    INDEX_SIZE = None
+
+    def timed(flow: str, stage: str):
+        return nullcontext()
+
+    def llm_call(kind: str = "chat"):
+        return nullcontext()
@@ -6,6 +6,11 @@ from typing import Any, Optional
 
 import pandas as pd
 
+try:
+    from app.pipeline.metrics import timed
+except ImportError:  # 파이프라인 폴더에서 스크립트로 직접 실행하는 경우
+    from metrics import timed
+
 
 # ----------------------------
 # User input schema
@@ -225,7 +230,8 @@ def filter_policies_from_csv(
     Input: policy_eligibility.csv (CSV/TSV)
     Output: user 변수명은 그대로 (age, annual_income, assets) 포함해서 반환
     """
-    df = read_csv_with_fallback(policy_eligibility_csv_path)
+    with timed("recommend", "csv_load"):
+        df = read_csv_with_fallback(policy_eligibility_csv_path)
 
     required_cols = {
         "policy_id",
@@ -252,16 +258,17 @@ def filter_policies_from_csv(
     passed_policies = []
     failed_policies = []
 
-    for row in df.to_dict(orient="records"):
-        ok, explain = check_eligibility(row, user)
-        item = {
-            "policy_id": row.get("policy_id"),
-            "explain": explain,
-        }
-        if ok:
-            passed_policies.append(item)
-        else:
-            failed_policies.append(item)
+    with timed("recommend", "eligibility_filter"):
+        for row in df.to_dict(orient="records"):
+            ok, explain = check_eligibility(row, user)
+            item = {
+                "policy_id": row.get("policy_id"),
+                "explain": explain,
+            }
+            if ok:
+                passed_policies.append(item)
+            else:
+                failed_policies.append(item)
 
     return {
         # ✅ 요구한 user 변수명 그대로 유지
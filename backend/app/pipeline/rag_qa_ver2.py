@@ -1,11 +1,18 @@
 import os
-import pandas as pd
 
 from openai import OpenAI
 
-from llama_index.core import Document, VectorStoreIndex
+from llama_index.core import VectorStoreIndex
+from llama_index.core.schema import TextNode
 from llama_index.embeddings.openai import OpenAIEmbedding
 
+try:
+    from app.pipeline.cleaned_io import chunk_texts, chunks_version, drop_duplicates, load_chunks, read_cleaned
+    from app.pipeline.metrics import INDEX_SIZE, llm_call, timed
+except ImportError:  # 파이프라인 폴더에서 스크립트로 직접 실행하는 경우
+    from cleaned_io import chunk_texts, chunks_version, drop_duplicates, load_chunks, read_cleaned
+    from metrics import INDEX_SIZE, llm_call, timed
+
 '''
 1. 10 line : CSV_PATH
 승훈님의 전처리 데이터(policies.csv, policy_eligibility.csv) 와 연결하는 상대경로 
@@ -17,32 +24,36 @@ EMBED_MODEL_NAME = "text-embedding-3-small"
 GEN_MODEL_NAME = "gpt-4o"
 
 
-def load_documents(csv_path: str) -> list[Document]:
+def load_documents(csv_path: str) -> list[TextNode]:
+    """
+    정책 1건 = 섹션 청크 여러 개 (run_clean이 만든 policy_chunks.csv의 clean_text 오프셋 그대로)
+    청크 출력이 없으면 clean_text 전체를 노드 1개로 사용, 중복 정책(policy_dedup.csv)은 대표만
+    """
     if not os.path.exists(csv_path):
         raise FileNotFoundError(f"CSV 파일을 찾을 수 없습니다: {csv_path}")
 
-    df = pd.read_csv(csv_path, encoding="cp949")
+    df = read_cleaned(csv_path, columns=["policy_id", "clean_text"], encoding="cp949")
 
-    # policies csv 구성 컬럼: policy_id, policy_name, support_summary, support_detail, clean_text
+    # policies csv 구성 컬럼: policy_id, policy_name, support_summary, support_detail, clean_text, ...
     if "policy_id" not in df.columns or "clean_text" not in df.columns:
         raise ValueError("CSV에는 최소 'policy_id', 'clean_text' 컬럼이 필요합니다.")
+    df = drop_duplicates(df, csv_path)
 
-    docs: list[Document] = []
-    for _, row in df.iterrows():
-        text = str(row["clean_text"])
-        doc_id = int(row["policy_id"])
-        docs.append(
-            Document(
-                text=text,
-                metadata={"doc_id": doc_id},
-            )
-        )
-    return docs
+    chunks_path = os.path.join(os.path.dirname(csv_path), "policy_chunks.csv")
+    chunks = None
+    if os.path.exists(chunks_path):
+        chunks = read_cleaned(chunks_path, columns=["policy_id", "section", "start", "end"])
 
+    return [
+        TextNode(text=text, metadata={"doc_id": doc_id, "section": section})
+        for doc_id, section, text in chunk_texts(df, chunks)
+    ]
 
-def build_index(documents: list[Document]) -> VectorStoreIndex:
+
+def build_index(nodes: list[TextNode]) -> VectorStoreIndex:
+    # 이미 섹션 단위로 나뉜 노드 → llama_index splitter로 다시 자르지 않음
     embed_model = OpenAIEmbedding(model=EMBED_MODEL_NAME)
-    return VectorStoreIndex.from_documents(documents, embed_model=embed_model)
+    return VectorStoreIndex(nodes, embed_model=embed_model)
 
 
 def retrieve(index: VectorStoreIndex, query: str, top_k: int = 5):
@@ -55,6 +66,7 @@ def retrieve(index: VectorStoreIndex, query: str, top_k: int = 5):
             {
                 "rank": rank,
                 "doc_id": r.metadata.get("doc_id"),
+                "section": r.metadata.get("section"),
                 "score": float(r.score) if r.score is not None else None,
                 "text": r.text,
             }
@@ -66,12 +78,11 @@ def generate_answer(query: str, hits: list[dict]) -> str:
     client = OpenAI()
 
     # 컨텍스트 구성 (A 플랜: 정책 후보 검색이 목적이라, 텍스트 덩어리 그대로 넣음)
+    # hit = cleaner 섹션 청크 1개 (섹션별 글자 예산 안) → 여기서 다시 자르지 않음
     context_lines = []
     for h in hits:
-        # 너무 길면 비용/토큰이 커질 수 있어 간단히 컷(필요시 조절)
-        snippet = h["text"][:1500]
         context_lines.append(
-            f"[{h['rank']}] (doc_id={h['doc_id']}, score={h['score']})\n{snippet}"
+            f"[{h['rank']}] (doc_id={h['doc_id']}, score={h['score']})\n{h['text']}"
         )
 
     context = "\n\n".join(context_lines)
@@ -127,31 +138,57 @@ if __name__ == "__main__":
 
 from functools import lru_cache
 
+@lru_cache(maxsize=1)
+def load_qa_chunks() -> tuple[list[tuple[int, str, str]], str]:
+    """
+    서버 시작 시 1회만 정책 텍스트 로드(publish된 DB 우선, 없으면 CSV) → (청크, 인덱스 버전)
+    인덱스 버전 = 출처 + 청크 내용 해시 (QA 답변 캐시 키, 재정제/publish로 내용이 바뀌면 달라짐)
+    """
+    with timed("qa", "csv_load"):
+        chunks, source = load_chunks("pipeline/cleaner/policies.csv")
+    return chunks, f"{source}:{chunks_version(chunks)}"
+
+
+def qa_index_version() -> str:
+    """load_rag_engine 인덱스가 만들어진(만들어질) 청크의 버전"""
+    return load_qa_chunks()[1]
+
+
 @lru_cache(maxsize=1)
 def load_rag_engine():
     """
-    서버 시작 시 1회만 CSV 로드 + 인덱스 생성
+    서버 시작 시 1회만 인덱스 생성 (load_qa_chunks와 같은 청크)
     """
-    import pandas as pd
-    from llama_index.core import VectorStoreIndex, Document
+    from llama_index.core import VectorStoreIndex
+    from llama_index.core.schema import TextNode
     from llama_index.llms.openai import OpenAI
 
-    df = pd.read_csv("pipeline/cleaner/policies.csv")
+    chunks, _version = load_qa_chunks()
 
-    documents = []
-    for _, row in df.iterrows():
-        text = row.get("clean_text", "")
-        if not text:
-            continue
-        documents.append(Document(text=text))
+    # cleaner 섹션 청크 그대로 노드로 사용 (청크 출력이 없으면 정책당 clean_text 1개, 중복 정책은 대표만)
+    nodes = [
+        TextNode(text=text, metadata={"doc_id": doc_id, "section": section})
+        for doc_id, section, text in chunks
+    ]
 
-    index = VectorStoreIndex.from_documents(documents)
+    # 노드 임베딩(OpenAI embedding API) 포함, splitter로 다시 자르지 않음
+    with timed("qa", "index_build"), llm_call("embedding"):
+        index = VectorStoreIndex(nodes)
+    if INDEX_SIZE is not None:
+        INDEX_SIZE.set(len(nodes), "qa_documents")
     query_engine = index.as_query_engine(llm=OpenAI(model="gpt-4o"))
 
     return query_engine
 
 
 def ask_policy_question(question: str) -> str:
+    from llama_index.core import QueryBundle
+
     engine = load_rag_engine()
-    response = engine.query(question)
+    query = QueryBundle(question)
+    # engine.query()와 같은 동작을 retrieve / synthesize로 나눠 단계별 시간 측정
+    with timed("qa", "retrieve"), llm_call("embedding"):
+        nodes = engine.retrieve(query)  # 질문 임베딩 + 벡터 검색
+    with timed("qa", "generate"), llm_call("chat"):
+        response = engine.synthesize(query, nodes)  # GPT-4o 응답 생성
     return str(response)
\ No newline at end of file
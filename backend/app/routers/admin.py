@@ -0,0 +1,36 @@
+from typing import Optional
+
+from fastapi import APIRouter, Header
+from fastapi.responses import FileResponse
+
+from ..core.profiling import check_admin_token, get_profile_path, list_profiles
+from ..core.responses import ORJSONResponse
+from ..schemas.common import fail, ok
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+def _forbidden() -> ORJSONResponse:
+    return ORJSONResponse(fail("FORBIDDEN", "invalid admin token"), status_code=403)
+
+
+@router.get("/profiles")
+def profiles(x_admin_token: Optional[str] = Header(None)):
+    """저장된 요청 프로파일 목록 (최신순)"""
+    if not check_admin_token(x_admin_token):
+        return _forbidden()
+    return ok(list_profiles())
+
+
+@router.get("/profiles/{profile_id}")
+def download_profile(profile_id: str, x_admin_token: Optional[str] = Header(None)):
+    """
+    .collapsed: flamegraph.pl / speedscope로 열기
+    .pstats   : python -m pstats <file>
+    """
+    if not check_admin_token(x_admin_token):
+        return _forbidden()
+    path = get_profile_path(profile_id)
+    if path is None:
+        return ORJSONResponse(fail("NOT_FOUND", f"profile not found: {profile_id}"), status_code=404)
+    return FileResponse(path, filename=path.name, media_type="application/octet-stream")
@@ -0,0 +1,42 @@
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db.repositories.run_rollup_repo import RunRollupRepository
+from ..db.session import get_db
+from ..schemas.analytics import ProfileDistribution, TopPolicies
+from ..schemas.common import APIResponse, ok
+
+router = APIRouter(prefix="/analytics", tags=["analytics"])
+
+
+def _since(days: int) -> date:
+    # run_compaction과 같은 UTC 일자 기준 (로그 created_at도 UTC)
+    return datetime.utcnow().date() - timedelta(days=days)
+
+
+# 집계는 압축 작업(run_compaction)이 쌓은 롤업 테이블만 읽음 → 원본 로그 스캔 없음
+# covered_until 이후 일자는 아직 hot 테이블에만 있어 집계에 포함되지 않는다
+@router.get("/top-policies", response_model=APIResponse[TopPolicies])
+async def top_policies(
+    days: int = Query(30, ge=1, le=3650),
+    limit: int = Query(20, ge=1, le=200),
+    db: AsyncSession = Depends(get_db),
+):
+    repo = RunRollupRepository(db)
+    covered_until: Optional[date] = await repo.covered_until()
+    items = await repo.top_policies(since=_since(days), limit=limit)
+    return ok({"items": items, "covered_until": covered_until})
+
+
+@router.get("/profile-distribution", response_model=APIResponse[ProfileDistribution])
+async def profile_distribution(
+    days: int = Query(30, ge=1, le=3650),
+    db: AsyncSession = Depends(get_db),
+):
+    repo = RunRollupRepository(db)
+    covered_until: Optional[date] = await repo.covered_until()
+    items = await repo.profile_distribution(since=_since(days))
+    return ok({"items": items, "covered_until": covered_until})
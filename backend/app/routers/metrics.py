@@ -0,0 +1,11 @@
+from fastapi import APIRouter
+
+from ..core.metrics import metrics_response
+
+router = APIRouter(tags=["metrics"])
+
+
+# Prometheus scrape 대상 (text exposition format)
+@router.get("/metrics", include_in_schema=False)
+def metrics():
+    return metrics_response()
@@ -1,19 +1,136 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..core.http_cache import (
+    etag_matches,
+    json_bytes_response,
+    make_etag,
+    normalized_query,
+    not_modified,
+    policy_response_cache,
+    render_model,
+)
 from ..db.session import get_db
-from ..db.repositories.policy_repo import PolicyRepository
-from ..schemas.common import ok
+from ..db.repositories.policy_repo import EligibilityFilter, PolicyRepository, decode_cursor
+from ..schemas.common import APIResponse, fail, ok
+from ..schemas.policy import (
+    PolicyBatch,
+    PolicyBatchRequest,
+    PolicyDetail,
+    PolicyPage,
+    PolicySearchHit,
+    parse_fields,
+    to_detail,
+    to_list_item,
+)
 
 router = APIRouter(prefix="/policies", tags=["policies"])
 
-@router.get("")
-def list_policies(db: Session = Depends(get_db)):
+@router.get("", response_model=APIResponse[PolicyPage], response_model_exclude_unset=True)
+async def list_policies(
+    request: Request,
+    q: Optional[str] = Query(None, description="정책명/요약/상세 검색어"),
+    region: Optional[str] = None,
+    updated_since: Optional[datetime] = None,
+    age: Optional[int] = Query(None, ge=0, le=120),
+    annual_income: Optional[int] = Query(None, ge=0, description="연소득(원)"),
+    assets: Optional[int] = Query(None, ge=0, description="총자산(원)"),
+    is_homeless: Optional[bool] = None,
+    vehicle_value: Optional[int] = Query(None, ge=0, description="차량가액(원)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(20, ge=1, le=100),
+    fields: Optional[str] = Query(None, description="추가 필드(콤마 구분): support_detail, clean_text"),
+    db: AsyncSession = Depends(get_db),
+):
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        return fail("INVALID_CURSOR", str(e))
+    try:
+        extra = parse_fields(fields)
+    except ValueError as e:
+        return fail("INVALID_FIELDS", str(e))
+
+    repo = PolicyRepository(db)
+
+    # 1) 데이터 버전 기반 ETag → 변경 없으면 304 (목록 쿼리/직렬화 생략)
+    version = await repo.data_version()
+    query = normalized_query(request)
+    etag = make_etag("policies", version, query)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    # 2) 같은 버전 + 같은 쿼리는 렌더링된 바이트 재사용
+    cache_key = ("policies", query, version)
+    body = policy_response_cache.get(cache_key)
+    if body is not None:
+        return json_bytes_response(body, etag)
+
+    data, next_cursor = await repo.list_policies(
+        limit=limit,
+        cursor=after,
+        q=q,
+        region=region,
+        updated_since=updated_since,
+        eligibility=EligibilityFilter(
+            age=age,
+            annual_income=annual_income,
+            assets=assets,
+            is_homeless=is_homeless,
+            vehicle_value=vehicle_value,
+        ),
+        fields=extra,
+    )
+    body = render_model(
+        APIResponse[PolicyPage],
+        ok({"items": [to_list_item(p, extra) for p in data], "next_cursor": next_cursor}),
+        exclude_unset=True,
+    )
+    policy_response_cache.put(cache_key, body)
+    return json_bytes_response(body, etag)
+
+@router.get("/search", response_model=APIResponse[list[PolicySearchHit]])
+async def search_policies(
+    q: str = Query(..., min_length=1, description="검색어 (공백으로 구분된 토큰은 AND)"),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+):
     repo = PolicyRepository(db)
-    data = repo.list_policies()
-    return ok([p.__dict__ for p in data])
+    return ok(await repo.search_ranked(q, limit=limit))
+
+@router.post("/batch", response_model=APIResponse[PolicyBatch], response_model_exclude_unset=True)
+async def get_policies_batch(payload: PolicyBatchRequest, db: AsyncSession = Depends(get_db)):
+    """추천/유사 결과 화면용: ID 목록 → 정책 카드 목록 (요청 순서 유지, 쿼리 1번)"""
+    try:
+        extra = parse_fields(payload.fields)
+    except ValueError as e:
+        return fail("INVALID_FIELDS", str(e))
+
+    policies = await PolicyRepository(db).get_policies_by_ids(payload.ids, fields=extra)
+    found = {p.policy_id for p in policies}
+    missing = [i for i in dict.fromkeys(payload.ids) if i not in found]
+    return ok({"items": [to_list_item(p, extra) for p in policies], "missing": missing})
 
-@router.get("/{policy_id}")
-def get_policy(policy_id: str, db: Session = Depends(get_db)):
+@router.get("/{policy_id}", response_model=APIResponse[PolicyDetail])
+async def get_policy(policy_id: str, request: Request, db: AsyncSession = Depends(get_db)):
     repo = PolicyRepository(db)
-    policy = repo.get_policy(policy_id)
-    return ok(policy.__dict__ if policy else None)
+
+    updated_at = await repo.get_policy_version(policy_id)
+    if updated_at is None:
+        return ok(None)
+
+    etag = make_etag("policy", policy_id, updated_at.isoformat())
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    cache_key = ("policy", policy_id, updated_at)
+    body = policy_response_cache.get(cache_key)
+    if body is None:
+        policy = await repo.get_policy(policy_id)
+        if policy is None:
+            return ok(None)
+        body = render_model(APIResponse[PolicyDetail], ok(to_detail(policy)))
+        policy_response_cache.put(cache_key, body)
+    return json_bytes_response(body, etag)
@@ -1,9 +1,12 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from app.core.admission import admit, get_limiter
+from app.schemas.qa import QARequest, QAResponse
 from app.services.orchestration.qa_flow import run_policy_qa
 
 router = APIRouter()
 
-@router.post("/policy-qa")
-def policy_qa(payload: dict):
-    question = payload.get("question")
-    return run_policy_qa(question)
+@router.post("/policy-qa", response_model=QAResponse, dependencies=[Depends(admit("policy_qa"))])
+async def policy_qa(payload: QARequest):
+    # LLM 호출은 blocking → 기본 스레드풀 대신 이 엔드포인트 전용 스레드 상한에서 실행
+    # (QA가 몰려도 다른 sync 엔드포인트가 스레드를 기다리지 않음)
+    return await get_limiter("policy_qa").run_sync(run_policy_qa, payload.question)
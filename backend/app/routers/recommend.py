@@ -1,11 +1,32 @@
-from fastapi import APIRouter
-from ..schemas.recommend import RecommendRequest
-from ..schemas.common import ok
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..core.admission import admit, get_limiter
+from ..db.session import get_db
+from ..schemas.recommend import RecommendItem, RecommendRequest
+from ..schemas.common import APIResponse, ok
 from ..services.orchestration.recommend_flow import recommend_flow
+from ..services.policy_cards import attach_policy_cards
+from ..services.run_log_writer import run_log_writer
 
 router = APIRouter(prefix="/recommend", tags=["recommend"])
 
-@router.post("")
-def recommend(req: RecommendRequest):
-    results = recommend_flow(req.dict())
+@router.post(
+    "",
+    response_model=APIResponse[list[RecommendItem]],
+    response_model_exclude_unset=True,
+    dependencies=[Depends(admit("recommend"))],
+)
+async def recommend(
+    req: RecommendRequest,
+    include_cards: bool = Query(False, description="각 항목에 정책 카드(policy) 포함"),
+    db: AsyncSession = Depends(get_db),
+):
+    profile = req.dict()
+    # 추천 계산(sync)은 이벤트 루프를 막지 않도록 이 엔드포인트 전용 스레드 상한에서 실행
+    results = await get_limiter("recommend").run_sync(recommend_flow, profile)
+    # 실행 로그는 write-behind 큐에 넣기만 하고 바로 응답
+    await run_log_writer.enqueue(profile=profile, results=results)
+    if include_cards:
+        # 로그에는 카드 없이 저장되도록 복사본에 붙임
+        return ok(await attach_policy_cards(db, [dict(r) for r in results]))
     return ok(results)
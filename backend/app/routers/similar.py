@@ -1,10 +1,27 @@
-from fastapi import APIRouter
-from ..schemas.common import ok
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..core.admission import admit, get_limiter
+from ..db.session import get_db
+from ..schemas.common import APIResponse, ok
+from ..schemas.similar import SimilarItem
 from ..services.orchestration.similar_flow import similar_flow
+from ..services.policy_cards import attach_policy_cards
 
 router = APIRouter(prefix="/similar", tags=["similar"])
 
-@router.get("/{policy_id}")
-def similar(policy_id: str):
-    results = similar_flow(policy_id)
+@router.get(
+    "/{policy_id}",
+    response_model=APIResponse[list[SimilarItem]],
+    response_model_exclude_unset=True,
+    dependencies=[Depends(admit("similar"))],
+)
+async def similar(
+    policy_id: str,
+    include_cards: bool = Query(False, description="각 항목에 정책 카드(policy) 포함"),
+    db: AsyncSession = Depends(get_db),
+):
+    # 유사 정책 조회(sync)는 이벤트 루프를 막지 않도록 이 엔드포인트 전용 스레드 상한에서 실행
+    results = await get_limiter("similar").run_sync(similar_flow, policy_id)
+    if include_cards:
+        results = await attach_policy_cards(db, [dict(r) for r in results])
     return ok(results)
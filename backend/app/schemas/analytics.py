@@ -0,0 +1,23 @@
+from datetime import date
+from typing import Optional
+
+from pydantic import BaseModel
+
+class PolicyCount(BaseModel):
+    policy_id: str
+    count: int
+
+class ProfileBucketCount(BaseModel):
+    age_band: str
+    income_band: str
+    is_homeowner: bool
+    count: int
+
+class TopPolicies(BaseModel):
+    items: list[PolicyCount]
+    # 롤업에 반영된 마지막 일자 (이후 일자는 아직 hot 테이블에만 있음)
+    covered_until: Optional[date] = None
+
+class ProfileDistribution(BaseModel):
+    items: list[ProfileBucketCount]
+    covered_until: Optional[date] = None
@@ -1,17 +1,20 @@
 from pydantic import BaseModel
-from typing import Any, Optional
+from typing import Any, Generic, Optional, TypeVar
+
+T = TypeVar("T")
 
 class ErrorResponse(BaseModel):
     code: str
     message: str
 
-class APIResponse(BaseModel):
+class APIResponse(BaseModel, Generic[T]):
     success: bool
-    data: Optional[Any] = None
+    data: Optional[T] = None
     error: Optional[ErrorResponse] = None
 
-def ok(data):
-    return APIResponse(success=True, data=data, error=None)
+# ok()/fail()은 dict를 돌려주고, 검증은 라우트의 response_model(APIResponse[...])에서 한 번만 수행
+def ok(data: Any) -> dict:
+    return {"success": True, "data": data, "error": None}
 
-def fail(code: str, message: str):
-    return APIResponse(success=False, data=None, error=ErrorResponse(code=code, message=message))
+def fail(code: str, message: str) -> dict:
+    return {"success": False, "data": None, "error": {"code": code, "message": message}}
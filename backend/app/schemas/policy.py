@@ -0,0 +1,73 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+# 목록 응답에 기본으로 싣는 요약 컬럼 / fields= 로만 추가되는 대용량 컬럼
+SUMMARY_FIELDS = ("policy_id", "policy_name", "support_summary", "region", "updated_at")
+DETAIL_FIELDS = ("support_detail", "clean_text")
+# 추천/유사 결과의 정책 카드(include_cards=true) = 요약 컬럼 + cleaner가 만든 한 줄 요약
+CARD_FIELDS = (*SUMMARY_FIELDS, "card_snippet")
+# POST /policies/batch 한 번에 조회할 수 있는 최대 ID 수
+BATCH_MAX_IDS = 100
+
+class PolicySummary(BaseModel):
+    policy_id: str
+    policy_name: str
+    support_summary: Optional[str] = None
+    region: Optional[str] = None
+    updated_at: datetime
+
+class PolicyCard(PolicySummary):
+    card_snippet: Optional[str] = None
+
+class PolicyListItem(PolicySummary):
+    # fields=support_detail,clean_text 로 요청했을 때만 채워짐
+    support_detail: Optional[str] = None
+    clean_text: Optional[str] = None
+
+class PolicyDetail(PolicySummary):
+    support_detail: Optional[str] = None
+    clean_text: Optional[str] = None
+
+class PolicyPage(BaseModel):
+    items: list[PolicyListItem]
+    next_cursor: Optional[str] = None
+
+class PolicyBatchRequest(BaseModel):
+    ids: list[str] = Field(..., min_length=1, max_length=BATCH_MAX_IDS)
+    fields: Optional[str] = Field(None, description="추가 필드(콤마 구분): support_detail, clean_text")
+
+class PolicyBatch(BaseModel):
+    # 요청한 순서대로 (중복 ID는 한 번만)
+    items: list[PolicyListItem]
+    missing: list[str]
+
+class PolicySearchHit(BaseModel):
+    policy_id: str
+    policy_name: str
+    support_summary: Optional[str] = None
+    region: Optional[str] = None
+    snippet: Optional[str] = None
+    score: Optional[float] = None
+
+def parse_fields(fields: Optional[str]) -> tuple[str, ...]:
+    """'support_detail,clean_text' → ('support_detail', 'clean_text'). 허용되지 않은 필드는 ValueError"""
+    if not fields:
+        return ()
+    requested = tuple(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = [f for f in requested if f not in DETAIL_FIELDS]
+    if unknown:
+        raise ValueError(f"unknown fields: {unknown} (allowed: {list(DETAIL_FIELDS)})")
+    return requested
+
+# 검증/직렬화는 라우트의 response_model에서 한 번만 하므로 여기서는 dict로만 투영
+def to_list_item(policy, fields: tuple[str, ...] = ()) -> dict:
+    """로드된 컬럼만 읽음 (요청하지 않은 필드는 response_model_exclude_unset으로 응답에서 제외)"""
+    return {f: getattr(policy, f) for f in (*SUMMARY_FIELDS, *fields)}
+
+def to_card(policy) -> dict:
+    return {f: getattr(policy, f) for f in CARD_FIELDS}
+
+def to_detail(policy) -> dict:
+    return {f: getattr(policy, f) for f in (*SUMMARY_FIELDS, *DETAIL_FIELDS)}
@@ -2,3 +2,6 @@ from pydantic import BaseModel
 
 class QARequest(BaseModel):
     question: str
+
+class QAResponse(BaseModel):
+    answer: str
@@ -1,5 +1,7 @@
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional
+
+from .policy import PolicyCard
 
 class RecommendRequest(BaseModel):
     age: int
@@ -17,3 +19,5 @@ class RecommendItem(BaseModel):
     rank: int
     matched_conditions: List[str]
     unmatched_conditions: List[str]
+    # include_cards=true 로 요청했을 때만 채워짐
+    policy: Optional[PolicyCard] = None
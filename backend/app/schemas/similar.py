@@ -0,0 +1,12 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from .policy import PolicyCard
+
+class SimilarItem(BaseModel):
+    policy_id: str
+    policy_name: str
+    similarity_score: float
+    # include_cards=true 로 요청했을 때만 채워짐
+    policy: Optional[PolicyCard] = None
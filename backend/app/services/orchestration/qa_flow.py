@@ -1,8 +1,23 @@
-from app.pipeline.rag_qa_ver2 import ask_policy_question
+from app.core.metrics import timed
+from app.pipeline.rag_qa_ver2 import ask_policy_question, qa_index_version
+from app.services.shared_cache import cache_key, shared_cache
+
+
+def _qa_cache_key(question: str) -> str:
+    # 공백만 다른 질문은 같은 답을 재사용, QA 인덱스가 만들어진 청크(출처 + 내용 해시)가 바뀌면 키도 바뀜
+    return cache_key("qa", qa_index_version(), " ".join(question.split()))
 
 
 def run_policy_qa(question: str):
-    answer = ask_policy_question(question)
+    key = _qa_cache_key(question)
+    with timed("qa", "shared_cache"):
+        cached = shared_cache.get(key)
+    if cached is not None:
+        return {"answer": cached.decode("utf-8")}
+
+    with timed("qa", "total"):
+        answer = ask_policy_question(question)
+    shared_cache.set(key, answer.encode("utf-8"))
     return {
         "answer": answer
     }
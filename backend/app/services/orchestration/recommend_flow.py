@@ -1,14 +1,30 @@
 from typing import List, Dict, Any
 
+from ...core.metrics import timed
+from ..serving_store import get_serving_store
+
 def recommend_flow(profile: Dict[str, Any], top_k: int = 5) -> List[Dict[str, Any]]:
-    # TODO: replace with real matcher integration
-    return [
-        {
-            "policy_id": "P-0001",
-            "policy_name": "샘플 정책",
-            "score": 90.0,
-            "rank": 1,
-            "matched_conditions": ["연령 조건 충족"],
-            "unmatched_conditions": []
-        }
-    ]
+    with timed("recommend", "total"):
+        # 서빙 스토어(mmap)에 자격 조건 배열이 있으면 전체 정책에 한 번에 적용
+        store = get_serving_store()
+        if store is not None:
+            is_homeowner = profile.get("is_homeowner")
+            mask = store.eligible_mask(
+                age=profile.get("age"),
+                annual_income=profile.get("income_annual"),
+                assets=profile.get("assets_total"),
+                is_homeless=None if is_homeowner is None else not is_homeowner,
+                vehicle_value=profile.get("vehicle_value"),
+            )
+            return store.rank_eligible(mask, top_k=top_k)
+        # TODO: replace with real matcher integration
+        return [
+            {
+                "policy_id": "P-0001",
+                "policy_name": "샘플 정책",
+                "score": 90.0,
+                "rank": 1,
+                "matched_conditions": ["연령 조건 충족"],
+                "unmatched_conditions": []
+            }
+        ]
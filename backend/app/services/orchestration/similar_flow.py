@@ -1,11 +1,19 @@
 from typing import List, Dict
 
+from ...core.metrics import timed
+from ..serving_store import get_serving_store
+
 def similar_flow(policy_id: str, top_k: int = 5) -> List[Dict]:
-    # TODO: connect vector similarity
-    return [
-        {
-            "policy_id": "P-0002",
-            "policy_name": "유사 정책",
-            "similarity_score": 0.85
-        }
-    ]
+    with timed("similar", "total"):
+        # 서빙 스토어(mmap)에 미리 계산된 이웃 테이블이 있으면 그대로 사용
+        store = get_serving_store()
+        if store is not None and store.neighbors_idx is not None:
+            return store.neighbors(policy_id, top_k=top_k)
+        # TODO: connect vector similarity
+        return [
+            {
+                "policy_id": "P-0002",
+                "policy_name": "유사 정책",
+                "similarity_score": 0.85
+            }
+        ]
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db.repositories.policy_repo import PolicyRepository
+from ..schemas.policy import to_card
+
+
+async def attach_policy_cards(db: AsyncSession, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    추천/유사 결과의 각 항목에 정책 카드(요약 컬럼 + card_snippet)를 "policy" 키로 붙임.
+    카드는 IN 쿼리 한 번으로 읽고, DB에 없는 정책은 policy 없이 그대로 둔다.
+    """
+    if not items:
+        return items
+    policies = await PolicyRepository(db).get_policies_by_ids(
+        [str(it["policy_id"]) for it in items], fields=("card_snippet",)
+    )
+    cards = {p.policy_id: to_card(p) for p in policies}
+    for it in items:
+        card = cards.get(str(it["policy_id"]))
+        if card is not None:
+            it["policy"] = card
+    return items
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+import pandas as pd
+from sqlalchemy import MetaData, Table, text
+from sqlalchemy.engine import Connection
+
+from ..db.fts import ensure_policy_fts, fts_ready, rebuild_policy_fts
+from ..db.models.policy import Policy
+from ..db.models.policy_chunk import PolicyChunk
+from ..db.models.policy_eligibility import PolicyEligibility
+from ..db.session import dispose_db, engine, init_db
+from ..pipeline.cleaned_io import read_cleaned, resolve_cleaned
+
+logger = logging.getLogger(__name__)
+
+# cleaner 출력 → DB 일괄 적재 (publish)
+# - policies / policy_eligibility / policy_chunks 모두 인덱스 없는 staging 테이블에 executemany로 적재한 뒤
+#   한 트랜잭션 안에서 기존 테이블 DROP → staging RENAME → 인덱스 생성 (swap)
+# - 실패하면 전체 롤백 → 서빙 쪽은 항상 직전 publish 결과 또는 새 결과 중 하나만 봄
+# - policy_chunks는 policies.clean_text 오프셋이므로 같이 교체 (청크 출력이 없으면 빈 테이블 → QA는 정책당 clean_text 1개)
+# - SQLite: swap 후 FTS 트리거 재생성 + rebuild (policies_fts는 policies를 content로 사용)
+# - Postgres: RENAME은 PK 제약/인덱스 이름(policies__staging_pkey)을 그대로 두므로 swap에서 <table>_pkey로 되돌림
+#   (안 그러면 다음 publish의 staging CREATE가 "already exists"로 실패)
+ROOT_DIR = Path(__file__).resolve().parents[3]
+CLEANER_DIR = ROOT_DIR / "pipeline" / "cleaner"
+PUBLISH_BATCH = int(os.getenv("PUBLISH_BATCH", "5000"))
+STAGING_SUFFIX = "__staging"
+
+INCOME_RULES = {"NONE", "AMOUNT", "MEDIAN_RATIO"}
+ELIG_INT_COLUMNS = ("min_age", "max_age", "income_threshold", "asset_threshold", "vehicle_value_limit")
+CHUNK_INT_COLUMNS = ("chunk_no", "start", "end", "tokens")
+
+
+# -------------------------
+# rows
+# -------------------------
+def _opt_str(v: Any) -> str | None:
+    if v is None or (not isinstance(v, str) and pd.isna(v)):
+        return None
+    s = str(v)
+    return s if s.strip() else None
+
+
+def _opt_int(v: Any) -> int | None:
+    if v is None or pd.isna(v):
+        return None
+    return int(float(v))
+
+
+def _to_bool(v: Any) -> bool:
+    if isinstance(v, str):
+        return v.strip().upper() in ("TRUE", "T", "Y", "YES", "1")
+    return bool(v) if pd.notna(v) else False
+
+
+def _to_naive_utc(v: Any) -> datetime:
+    """cleaner updated_at(ISO, UTC offset 포함) → DateTime 컬럼용 naive UTC"""
+    dt = datetime.fromisoformat(str(v))
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+def policy_rows(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    out = []
+    for r in df.to_dict(orient="records"):
+        out.append(
+            {
+                "policy_id": str(r["policy_id"]),
+                "policy_name": str(r["policy_name"]),
+                "support_summary": _opt_str(r.get("support_summary")),
+                "support_detail": _opt_str(r.get("support_detail")),
+                "region": _opt_str(r.get("region")),
+                "clean_text": _opt_str(r.get("clean_text")) or "",
+                "embedding_text": _opt_str(r.get("embedding_text")),
+                "card_snippet": _opt_str(r.get("card_snippet")),
+                "updated_at": _to_naive_utc(r["updated_at"]),
+            }
+        )
+    return out
+
+
+def chunk_rows(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    out = []
+    for r in df.to_dict(orient="records"):
+        row: Dict[str, Any] = {c: int(r[c]) for c in CHUNK_INT_COLUMNS}
+        row.update(policy_id=str(r["policy_id"]), section=str(r["section"]))
+        out.append(row)
+    return out
+
+
+def eligibility_rows(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    out = []
+    for r in df.to_dict(orient="records"):
+        rule = (_opt_str(r.get("income_rule_type")) or "NONE").upper()
+        if rule not in INCOME_RULES:
+            raise ValueError(f"Contract violation: invalid income_rule_type={rule!r} (policy_id={r['policy_id']})")
+        row: Dict[str, Any] = {c: _opt_int(r.get(c)) for c in ELIG_INT_COLUMNS}
+        row.update(
+            policy_id=str(r["policy_id"]),
+            income_rule_type=rule,
+            is_homeowner_required=_to_bool(r.get("is_homeowner_required")),
+        )
+        out.append(row)
+    return out
+
+
+# -------------------------
+# staging + swap
+# -------------------------
+def _pk_name(table_name: str) -> str:
+    """Postgres 기본 PK 이름 규칙 (모델에 naming_convention이 없으므로 create_all도 같은 이름)"""
+    return f"{table_name}_pkey"
+
+
+def _staging_table(table: Table) -> Table:
+    """같은 컬럼/PK(이름 고정: <staging>_pkey), 인덱스 없음 (적재가 끝난 뒤 swap에서 원래 이름으로 생성)"""
+    cols = []
+    for c in table.columns:
+        col = c._copy()
+        col.index = None
+        col.unique = None
+        cols.append(col)
+    staging = Table(table.name + STAGING_SUFFIX, MetaData(), *cols)
+    staging.primary_key.name = _pk_name(staging.name)
+    return staging
+
+
+def _load_staging(conn: Connection, table: Table, rows: List[Dict[str, Any]], batch: int) -> Table:
+    staging = _staging_table(table)
+    staging.drop(conn, checkfirst=True)  # 이전 실패로 남은 staging 정리
+    staging.create(conn)
+    for start in range(0, len(rows), batch):
+        conn.execute(staging.insert(), rows[start:start + batch])
+    return staging
+
+
+def _swap(conn: Connection, table: Table, staging: Table) -> None:
+    prep = conn.dialect.identifier_preparer
+    conn.execute(text(f"DROP TABLE IF EXISTS {prep.quote(table.name)}"))
+    conn.execute(text(f"ALTER TABLE {prep.quote(staging.name)} RENAME TO {prep.quote(table.name)}"))
+    if conn.dialect.name == "postgresql":
+        # PK 인덱스 이름은 RENAME TABLE을 따라가지 않음 → 원래 이름으로 (제약 이름을 바꾸면 인덱스도 같이 바뀜)
+        conn.execute(
+            text(
+                f"ALTER TABLE {prep.quote(table.name)} RENAME CONSTRAINT "
+                f"{prep.quote(staging.primary_key.name)} TO {prep.quote(table.primary_key.name or _pk_name(table.name))}"
+            )
+        )
+    for idx in table.indexes:
+        idx.create(conn)
+
+
+def publish_sync(
+    conn: Connection,
+    policies: List[Dict[str, Any]],
+    eligibility: List[Dict[str, Any]],
+    batch: int = PUBLISH_BATCH,
+    chunks: Sequence[Dict[str, Any]] = (),
+) -> None:
+    """conn의 트랜잭션 안에서 staging 적재 → swap (commit은 호출 측)"""
+    tables = (
+        (Policy.__table__, policies),
+        (PolicyEligibility.__table__, eligibility),
+        (PolicyChunk.__table__, list(chunks)),
+    )
+    staged = [(table, _load_staging(conn, table, rows, batch)) for table, rows in tables]
+    for table, staging in staged:
+        _swap(conn, table, staging)
+
+    # 테이블을 새로 만들었으므로 FTS 트리거가 사라짐 → 다시 만들고 전체 재색인
+    if ensure_policy_fts(conn) and fts_ready():
+        rebuild_policy_fts(conn)
+
+
+async def publish(
+    policies_path: Path = CLEANER_DIR / "policies.csv",
+    eligibility_path: Path = CLEANER_DIR / "policy_eligibility.csv",
+    chunks_path: Path = CLEANER_DIR / "policy_chunks.csv",
+    *,
+    batch: int = PUBLISH_BATCH,
+) -> Dict[str, Any]:
+    """
+    cleaner 출력(CSV 또는 같은 이름의 Parquet)을 policies / policy_eligibility / policy_chunks에 publish.
+    빈 출력은 publish하지 않음 (실수로 서빙 데이터를 비우지 않도록), 청크 출력은 없어도 됨
+    """
+    t0 = time.perf_counter()
+    pol = read_cleaned(policies_path, dtype={"policy_id": str})
+    elig = read_cleaned(eligibility_path, dtype={"policy_id": str})
+
+    policies = policy_rows(pol)
+    eligibility = eligibility_rows(elig)
+    chunks: List[Dict[str, Any]] = []
+    if Path(resolve_cleaned(chunks_path)).exists():
+        chunks = chunk_rows(read_cleaned(chunks_path, dtype={"policy_id": str}))
+    if not policies:
+        raise ValueError(f"refusing to publish empty policies: {policies_path}")
+
+    ids = {r["policy_id"] for r in policies}
+    if len(ids) != len(policies):
+        raise ValueError("Contract violation: duplicated policy_id in policies")
+    orphans = sorted({r["policy_id"] for r in eligibility} - ids)
+    if orphans:
+        raise ValueError(f"Contract violation: eligibility rows without policy: {orphans[:10]}")
+    orphans = sorted({r["policy_id"] for r in chunks} - ids)
+    if orphans:
+        raise ValueError(f"Contract violation: chunk rows without policy: {orphans[:10]}")
+
+    await init_db()
+    async with engine.begin() as conn:
+        await conn.run_sync(publish_sync, policies, eligibility, batch, chunks)
+
+    return {
+        "policies": len(policies),
+        "eligibility": len(eligibility),
+        "chunks": len(chunks),
+        "seconds": round(time.perf_counter() - t0, 3),
+    }
+
+
+# -------------------------
+# CLI
+# -------------------------
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="cleaner 출력 → policies / policy_eligibility / policy_chunks 테이블 일괄 publish")
+    ap.add_argument("--policies", default=str(CLEANER_DIR / "policies.csv"))
+    ap.add_argument("--eligibility", default=str(CLEANER_DIR / "policy_eligibility.csv"))
+    ap.add_argument("--chunks", default=str(CLEANER_DIR / "policy_chunks.csv"), help="없으면 빈 policy_chunks로 publish")
+    ap.add_argument("--batch", type=int, default=PUBLISH_BATCH, help="executemany 1회 행 수")
+    return ap.parse_args()
+
+
+async def _amain(args: argparse.Namespace) -> Dict[str, Any]:
+    try:
+        return await publish(Path(args.policies), Path(args.eligibility), Path(args.chunks), batch=args.batch)
+    finally:
+        await dispose_db()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    args = parse_args()
+    stats = asyncio.run(_amain(args))
+    print(f"[INFO] Published {stats['policies']} policies / {stats['eligibility']} eligibility rows / "
+          f"{stats['chunks']} chunks in {stats['seconds']}s")
+
+
+if __name__ == "__main__":
+    main()
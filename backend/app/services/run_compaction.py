@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gzip
+import json
+import logging
+import os
+from collections import Counter
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from ..db.models.run_log import RecommendationRun
+from ..db.repositories.run_repo import RunRepository
+from ..db.repositories.run_rollup_repo import RunRollupRepository
+from ..db.session import ROOT_DIR, SessionLocal, dispose_db, init_db
+
+logger = logging.getLogger(__name__)
+
+RUN_ARCHIVE_DIR = Path(os.getenv("RUN_ARCHIVE_DIR", str(ROOT_DIR / "data" / "run_archive")))
+RUN_HOT_DAYS = int(os.getenv("RUN_HOT_DAYS", "7"))
+RUN_COMPACT_CHUNK = int(os.getenv("RUN_COMPACT_CHUNK", "5000"))
+
+# pyarrow가 있으면 Parquet(zstd), 없으면 컬럼 단위 JSON + gzip
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError:
+    pa = None
+    pq = None
+
+ARCHIVE_COLUMNS = ("id", "user_id", "created_at", "profile_json", "results_json")
+
+
+# -------------------------
+# profile bucket
+# -------------------------
+def age_band(age: Any) -> str:
+    try:
+        a = int(age)
+    except (TypeError, ValueError):
+        return "unknown"
+    if a < 20:
+        return "<20"
+    if a >= 60:
+        return "60+"
+    return f"{a // 10 * 10}s"
+
+
+_INCOME_EDGES = [(20_000_000, "<20M"), (40_000_000, "20-40M"), (60_000_000, "40-60M"), (80_000_000, "60-80M")]
+
+
+def income_band(income_annual: Any) -> str:
+    try:
+        v = int(income_annual)
+    except (TypeError, ValueError):
+        return "unknown"
+    for edge, label in _INCOME_EDGES:
+        if v < edge:
+            return label
+    return "80M+"
+
+
+def profile_bucket(profile: Dict[str, Any]) -> Tuple[str, str, bool]:
+    return (
+        age_band(profile.get("age")),
+        income_band(profile.get("income_annual")),
+        bool(profile.get("is_homeowner")),
+    )
+
+
+# -------------------------
+# archive writer
+# -------------------------
+def _columns(runs: List[RecommendationRun]) -> Dict[str, list]:
+    return {
+        "id": [r.id for r in runs],
+        "user_id": [r.user_id for r in runs],
+        "created_at": [r.created_at.isoformat() for r in runs],
+        "profile_json": [r.profile_json for r in runs],
+        "results_json": [r.results_json for r in runs],
+    }
+
+
+def write_partition(archive_dir: Path, day: date, runs: List[RecommendationRun]) -> Path:
+    """
+    하루치 실행 로그 청크를 컬럼형 파일 1개로 저장.
+    경로: {archive_dir}/day=YYYY-MM-DD/part-{first_id}-{last_id}.{parquet|json.gz}
+    같은 청크를 다시 쓰면 같은 경로를 덮어씀 → 작업이 중간에 죽어도 재실행 안전
+    """
+    part_dir = archive_dir / f"day={day.isoformat()}"
+    part_dir.mkdir(parents=True, exist_ok=True)
+    stem = f"part-{runs[0].id}-{runs[-1].id}"
+    cols = _columns(runs)
+
+    if pq is not None:
+        path = part_dir / f"{stem}.parquet"
+        table = pa.table(cols)
+        pq.write_table(
+            table,
+            path,
+            compression="zstd",
+            use_dictionary=["user_id", "profile_json"],
+        )
+    else:
+        path = part_dir / f"{stem}.json.gz"
+        with gzip.open(path, "wt", encoding="utf-8", compresslevel=9) as f:
+            json.dump(cols, f, ensure_ascii=False, separators=(",", ":"))
+    return path
+
+
+def read_partition(path: Path) -> Dict[str, list]:
+    """아카이브 파일 → 컬럼 dict (원본 로그 확인/재집계용)"""
+    path = Path(path)
+    if path.suffix == ".parquet":
+        if pq is None:
+            raise RuntimeError("pyarrow is required to read parquet partitions")
+        return pq.read_table(path).to_pydict()
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# -------------------------
+# compaction
+# -------------------------
+def _rollup(runs: List[RecommendationRun]) -> Tuple[Counter, Counter]:
+    policy_counts: Counter = Counter()
+    profile_counts: Counter = Counter()
+    for r in runs:
+        try:
+            profile = json.loads(r.profile_json) or {}
+        except (TypeError, ValueError):
+            profile = {}
+        try:
+            results = json.loads(r.results_json) or []
+        except (TypeError, ValueError):
+            results = []
+        profile_counts[profile_bucket(profile)] += 1
+        for item in results:
+            pid = item.get("policy_id") if isinstance(item, dict) else None
+            if pid:
+                policy_counts[str(pid)] += 1
+    return policy_counts, profile_counts
+
+
+async def compact_day(
+    day: date,
+    *,
+    archive_dir: Path = RUN_ARCHIVE_DIR,
+    chunk_size: int = RUN_COMPACT_CHUNK,
+    session_factory=SessionLocal,
+) -> Dict[str, int]:
+    """
+    하루치 실행 로그를 청크 단위로 아카이브 → 롤업 누적 → hot 테이블에서 삭제.
+    청크마다 (롤업 upsert + 파티션 등록 + 삭제)를 한 트랜잭션으로 커밋하므로
+    중간에 실패해도 이미 옮긴 청크만 반영되고 나머지는 다음 실행에서 이어서 처리된다.
+    """
+    start = datetime.combine(day, time.min)
+    end = start + timedelta(days=1)
+    stats = {"runs": 0, "partitions": 0, "bytes": 0}
+    after_id = 0
+
+    while True:
+        async with session_factory() as db:
+            runs = await RunRepository(db).runs_in_range(start=start, end=end, after_id=after_id, limit=chunk_size)
+            if not runs:
+                break
+
+            path = await asyncio.to_thread(write_partition, archive_dir, day, runs)
+            size = path.stat().st_size
+            policy_counts, profile_counts = _rollup(runs)
+
+            rollups = RunRollupRepository(db)
+            await rollups.add_policy_counts(day, dict(policy_counts))
+            await rollups.add_profile_counts(day, dict(profile_counts))
+            await rollups.add_partition(
+                path=str(path),
+                day=day,
+                rows=len(runs),
+                bytes=size,
+                first_run_id=runs[0].id,
+                last_run_id=runs[-1].id,
+                archived_at=datetime.utcnow(),
+            )
+            await RunRepository(db).delete_runs([r.id for r in runs])
+            await db.commit()
+
+            after_id = runs[-1].id
+            stats["runs"] += len(runs)
+            stats["partitions"] += 1
+            stats["bytes"] += size
+    return stats
+
+
+async def compact_runs(
+    *,
+    older_than_days: int = RUN_HOT_DAYS,
+    archive_dir: Path = RUN_ARCHIVE_DIR,
+    chunk_size: int = RUN_COMPACT_CHUNK,
+    session_factory=SessionLocal,
+) -> Dict[str, int]:
+    """
+    created_at이 (오늘 - older_than_days) 이전인 실행 로그를 일자별로 압축.
+    hot 테이블(recommendation_runs)에는 최근 older_than_days일치만 남는다.
+    """
+    cutoff = datetime.combine(datetime.utcnow().date() - timedelta(days=older_than_days), time.min)
+    total = {"days": 0, "runs": 0, "partitions": 0, "bytes": 0}
+
+    while True:
+        async with session_factory() as db:
+            oldest = await RunRepository(db).oldest_created_at(before=cutoff)
+        if oldest is None:
+            break
+        day_stats = await compact_day(
+            oldest.date(), archive_dir=archive_dir, chunk_size=chunk_size, session_factory=session_factory
+        )
+        total["days"] += 1
+        for k in ("runs", "partitions", "bytes"):
+            total[k] += day_stats[k]
+        logger.info(f"compacted {oldest.date()}: {day_stats}")
+    return total
+
+
+# -------------------------
+# CLI
+# -------------------------
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="recommendation_runs → 일자별 컬럼형 아카이브 + 롤업")
+    ap.add_argument("--older-than-days", type=int, default=RUN_HOT_DAYS)
+    ap.add_argument("--archive-dir", default=str(RUN_ARCHIVE_DIR))
+    ap.add_argument("--chunk-size", type=int, default=RUN_COMPACT_CHUNK)
+    return ap.parse_args()
+
+
+async def _amain(args: argparse.Namespace) -> Dict[str, int]:
+    await init_db()
+    try:
+        return await compact_runs(
+            older_than_days=args.older_than_days,
+            archive_dir=Path(args.archive_dir),
+            chunk_size=args.chunk_size,
+        )
+    finally:
+        await dispose_db()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    args = parse_args()
+    stats = asyncio.run(_amain(args))
+    print(f"[INFO] Compacted {stats['runs']} runs over {stats['days']} days "
+          f"→ {stats['partitions']} partitions ({stats['bytes']:,} bytes) in {args.archive_dir}")
+
+
+if __name__ == "__main__":
+    main()
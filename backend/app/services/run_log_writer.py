@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from ..core.metrics import REGISTRY, Counter, Gauge
+from ..db.repositories.run_repo import RunRepository
+from ..db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+RUN_LOG_MAX_QUEUE = int(os.getenv("RUN_LOG_MAX_QUEUE", "10000"))
+RUN_LOG_BATCH_SIZE = int(os.getenv("RUN_LOG_BATCH_SIZE", "200"))
+RUN_LOG_FLUSH_INTERVAL = float(os.getenv("RUN_LOG_FLUSH_INTERVAL", "1.0"))
+# 큐가 가득 찼을 때: drop(즉시 버림) | block(최대 RUN_LOG_ENQUEUE_TIMEOUT초 대기 후 버림)
+RUN_LOG_OVERFLOW = os.getenv("RUN_LOG_OVERFLOW", "drop")
+RUN_LOG_ENQUEUE_TIMEOUT = float(os.getenv("RUN_LOG_ENQUEUE_TIMEOUT", "0.05"))
+
+
+class RunLogWriter:
+    """
+    추천 실행 로그(RecommendationRun) write-behind 큐.
+    - 요청 경로에서는 큐에 넣기만 하고 바로 반환
+    - 백그라운드 태스크가 batch_size개가 모이거나 flush_interval이 지나면
+      한 트랜잭션의 multi-row insert로 저장
+    - 큐 크기 상한(max_queue)으로 메모리 제한, 초과 시 overflow 정책에 따라 버림
+    - stop() 시 남은 항목을 모두 flush
+    """
+
+    def __init__(
+        self,
+        *,
+        session_factory=SessionLocal,
+        max_queue: int = RUN_LOG_MAX_QUEUE,
+        batch_size: int = RUN_LOG_BATCH_SIZE,
+        flush_interval: float = RUN_LOG_FLUSH_INTERVAL,
+        overflow: str = RUN_LOG_OVERFLOW,
+        enqueue_timeout: float = RUN_LOG_ENQUEUE_TIMEOUT,
+    ):
+        if overflow not in ("drop", "block"):
+            raise ValueError(f"overflow must be 'drop' or 'block': {overflow}")
+        self.session_factory = session_factory
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.enqueue_timeout = enqueue_timeout
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+        self.stats = {"enqueued": 0, "written": 0, "dropped": 0, "failed": 0, "flushes": 0}
+
+    # -------------------------
+    # lifecycle
+    # -------------------------
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._stopping = False
+        self._task = asyncio.create_task(self._run(), name="run-log-writer")
+
+    async def stop(self) -> None:
+        """남은 로그를 모두 저장하고 종료"""
+        if self._task is None:
+            return
+        self._stopping = True
+        await self._task
+        self._task = None
+        logger.info(f"run log writer stopped: {self.stats}")
+
+    # -------------------------
+    # enqueue (요청 경로)
+    # -------------------------
+    async def enqueue(
+        self,
+        *,
+        profile: Dict[str, Any],
+        results: List[Dict[str, Any]],
+        user_id: Optional[str] = None,
+    ) -> bool:
+        """큐에 넣고 바로 반환. 버려졌으면 False"""
+        if self._queue is None or self._stopping:
+            self.stats["dropped"] += 1
+            return False
+
+        item = (user_id, datetime.utcnow(), profile, results)
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            if self.overflow == "drop":
+                self.stats["dropped"] += 1
+                return False
+            try:
+                await asyncio.wait_for(self._queue.put(item), timeout=self.enqueue_timeout)
+            except asyncio.TimeoutError:
+                self.stats["dropped"] += 1
+                return False
+
+        self.stats["enqueued"] += 1
+        return True
+
+    def qsize(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    # -------------------------
+    # background flush
+    # -------------------------
+    async def _run(self) -> None:
+        assert self._queue is not None
+        while True:
+            batch = await self._collect_batch()
+            if batch:
+                await self._flush(batch)
+            if self._stopping and self._queue.empty():
+                return
+
+    async def _collect_batch(self) -> list:
+        """batch_size개가 모이거나 flush_interval이 지날 때까지 모음"""
+        assert self._queue is not None
+        batch: list = []
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=min(timeout, 0.1)))
+            except asyncio.TimeoutError:
+                if self._stopping:
+                    break
+                continue
+        # 이미 쌓여 있는 건 기다리지 않고 같이 가져감
+        while len(batch) < self.batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _flush(self, batch: list) -> None:
+        rows = [
+            {
+                "user_id": user_id,
+                "created_at": created_at,
+                "profile_json": json.dumps(profile, ensure_ascii=False),
+                "results_json": json.dumps(results, ensure_ascii=False),
+            }
+            for user_id, created_at, profile, results in batch
+        ]
+        try:
+            async with self.session_factory() as db:
+                written = await RunRepository(db).create_runs_bulk(rows)
+            self.stats["written"] += written
+            self.stats["flushes"] += 1
+        except Exception as e:
+            # 로그 저장 실패가 서비스 장애로 번지지 않도록 배치를 버리고 기록만 남김
+            self.stats["failed"] += len(rows)
+            logger.warning(f"run log flush failed ({len(rows)} rows dropped): {e}")
+
+
+run_log_writer = RunLogWriter()
+
+REGISTRY.register(
+    Gauge("run_log_queue_size", "Run logs waiting to be written", collect=lambda: [((), run_log_writer.qsize())])
+)
+REGISTRY.register(
+    Counter(
+        "run_log_events_total",
+        "Run log writer events (enqueued/written/dropped/failed/flushes)",
+        ("event",),
+        collect=lambda: [((k,), v) for k, v in run_log_writer.stats.items()],
+    )
+)
@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import shutil
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..core.metrics import INDEX_SIZE
+from ..pipeline.cleaned_io import duplicate_ids, load_cleaned
+
+logger = logging.getLogger(__name__)
+
+# 워커 간 공유되는 읽기 전용 서빙 아티팩트
+# - 모든 배열은 .npy로 저장하고 np.load(mmap_mode="r")로 연다
+#   → 여러 uvicorn 워커가 같은 파일을 매핑하면 OS page cache의 같은 페이지를 공유 (워커 수만큼 RAM이 늘지 않음)
+# - 텍스트는 utf-8 blob 1개 + offset 배열 (행마다 파이썬 str 객체를 들고 있지 않음)
+ROOT_DIR = Path(__file__).resolve().parents[3]
+SERVING_DIR = Path(os.getenv("SERVING_DIR", str(ROOT_DIR / "data" / "serving")))
+NEIGHBOR_K = int(os.getenv("SERVING_NEIGHBOR_K", "20"))
+
+INCOME_RULES = ("NONE", "AMOUNT", "MEDIAN_RATIO")
+ELIGIBILITY_COLUMNS = ("min_age", "max_age", "income_threshold", "asset_threshold", "vehicle_value_limit")
+ELIGIBILITY_READ_COLUMNS = ("policy_id", *ELIGIBILITY_COLUMNS, "income_rule_type", "is_homeowner_required")
+
+
+# -------------------------
+# build
+# -------------------------
+def _file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _source_sha256(source: str, df: pd.DataFrame) -> str:
+    """파일이면 파일 해시, publish된 DB 테이블이면 읽은 내용의 해시"""
+    if source.startswith("db:"):
+        return hashlib.sha256(df.to_csv(index=False).encode("utf-8")).hexdigest()
+    return _file_sha256(Path(source))
+
+
+def _to_bool(v: Any) -> bool:
+    if isinstance(v, str):
+        return v.strip().upper() in ("TRUE", "T", "Y", "YES", "1")
+    return bool(v) if pd.notna(v) else False
+
+
+def _normalize_rows(m: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(m, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (m / norms).astype(np.float32)
+
+
+def _write_blob(out_dir: Path, name: str, values) -> None:
+    encoded = [("" if pd.isna(v) else str(v)).encode("utf-8") for v in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(b) for b in encoded])
+    (out_dir / f"{name}.bin").write_bytes(b"".join(encoded))
+    np.save(out_dir / f"{name}_offsets.npy", offsets)
+
+
+def compute_neighbors(emb: np.ndarray, k: int, block: int = 1024) -> tuple[np.ndarray, np.ndarray]:
+    """코사인 유사도 top-k 이웃 (자기 자신 제외). 메모리를 위해 block 단위로 계산"""
+    n = emb.shape[0]
+    k = max(0, min(k, n - 1))
+    idx = np.zeros((n, k), dtype=np.int32)
+    score = np.zeros((n, k), dtype=np.float32)
+    if k == 0:
+        return idx, score
+    for s in range(0, n, block):
+        sims = emb[s:s + block] @ emb.T
+        rows = np.arange(sims.shape[0])
+        sims[rows, rows + s] = -np.inf
+        part = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+        part_scores = np.take_along_axis(sims, part, axis=1)
+        order = np.argsort(-part_scores, axis=1)
+        idx[s:s + block] = np.take_along_axis(part, order, axis=1)
+        score[s:s + block] = np.take_along_axis(part_scores, order, axis=1)
+    return idx, score
+
+
+def build_serving_store(
+    policies_csv: Path,
+    eligibility_csv: Path,
+    out_dir: Path = SERVING_DIR,
+    *,
+    embeddings_npy: Optional[Path] = None,
+    neighbor_k: int = NEIGHBOR_K,
+) -> Dict[str, Any]:
+    """
+    policies.csv / policy_eligibility.csv (publish된 DB 테이블이 있으면 DB) (+ 선택: policies 행 순서와 같은 임베딩 행렬 .npy)
+    → out_dir 아래 mmap용 아티팩트.
+    policy_dedup.csv가 있으면 대표가 아닌 중복 정책은 빼고 빌드 (추천/유사 정책에 같은 정책이 여러 번 나오지 않도록)
+    임베딩은 전체 policies 행 순서 또는 중복 제외 후 행 순서 둘 다 허용.
+    새 디렉터리를 만든 뒤 교체하므로, 이미 이전 파일을 매핑한 워커는 재시작 전까지 이전 버전을 안전하게 계속 읽는다.
+    """
+    pol, pol_src = load_cleaned(
+        policies_csv, columns=["policy_id", "policy_name", "clean_text", "embedding_text"], dtype={"policy_id": str}
+    )
+    elig, elig_src = load_cleaned(eligibility_csv, columns=ELIGIBILITY_READ_COLUMNS, dtype={"policy_id": str})
+    policies_sha = _source_sha256(pol_src, pol)
+    dup = duplicate_ids(policies_csv)
+    keep = ~pol["policy_id"].astype(str).isin(dup).to_numpy()
+    all_rows = len(pol)
+    pol = pol[keep].reset_index(drop=True)
+    elig = pol[["policy_id"]].merge(elig, on="policy_id", how="left")
+
+    tmp = out_dir.with_name(out_dir.name + ".tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+
+    ids = pol["policy_id"].astype(str).to_numpy()
+    np.save(tmp / "policy_ids.npy", ids.astype(f"<U{max(1, max(len(i) for i in ids))}"))
+
+    # 텍스트 blob: 임베딩 입력(embedding_text, 없는 행/이전 출력은 clean_text) → --embeddings도 같은 텍스트로 계산
+    texts = pol["clean_text"] if "clean_text" in pol else pd.Series([None] * len(pol))
+    if "embedding_text" in pol:
+        texts = pol["embedding_text"].fillna(texts)
+    _write_blob(tmp, "texts", texts)
+    _write_blob(tmp, "names", pol["policy_name"] if "policy_name" in pol else [""] * len(pol))
+
+    # 자격 조건 배열 (결측 = NaN)
+    for col in ELIGIBILITY_COLUMNS:
+        np.save(tmp / f"{col}.npy", pd.to_numeric(elig.get(col), errors="coerce").to_numpy(dtype=np.float64))
+    rule = elig.get("income_rule_type").fillna("NONE").astype(str).str.upper()
+    np.save(tmp / "income_rule.npy", np.array([INCOME_RULES.index(r) if r in INCOME_RULES else 0 for r in rule], dtype=np.int8))
+    np.save(tmp / "homeowner_required.npy", np.array([_to_bool(v) for v in elig.get("is_homeowner_required")], dtype=bool))
+
+    manifest: Dict[str, Any] = {
+        "created_at": datetime.utcnow().isoformat(),
+        "rows": int(len(ids)),
+        "duplicates_dropped": int(all_rows - len(ids)),
+        "sources": {
+            "policies": policies_sha,
+            "eligibility": _source_sha256(elig_src, elig),
+        },
+    }
+
+    # 빠진 중복 ID → 대표 ID (중복 ID로 조회해도 대표 정책의 이웃을 돌려주도록)
+    if all_rows != len(ids):
+        alias = sorted(dup.items())
+        np.save(tmp / "alias_ids.npy", np.array([a for a, _ in alias]))
+        np.save(tmp / "alias_canonical.npy", np.array([c for _, c in alias]))
+        manifest["sources"]["dedup"] = _file_sha256(Path(policies_csv).with_name("policy_dedup.csv"))
+
+    if embeddings_npy is not None:
+        emb = np.load(embeddings_npy)
+        if emb.shape[0] == all_rows and all_rows != len(ids):
+            emb = emb[keep]
+        if emb.shape[0] != len(ids):
+            raise ValueError(f"embedding rows({emb.shape[0]}) != policies({len(ids)})")
+        emb = _normalize_rows(emb)
+        np.save(tmp / "embeddings.npy", emb)
+        nb_idx, nb_score = compute_neighbors(emb, neighbor_k)
+        np.save(tmp / "neighbors_idx.npy", nb_idx)
+        np.save(tmp / "neighbors_score.npy", nb_score)
+        manifest["sources"]["embeddings"] = _file_sha256(embeddings_npy)
+        manifest["embedding_dim"] = int(emb.shape[1])
+        manifest["neighbor_k"] = int(nb_idx.shape[1])
+
+    manifest["version"] = hashlib.sha256(
+        json.dumps(manifest["sources"], sort_keys=True).encode("utf-8")
+    ).hexdigest()[:16]
+    (tmp / "manifest.json").write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    old = out_dir.with_name(out_dir.name + ".old")
+    shutil.rmtree(old, ignore_errors=True)
+    if out_dir.exists():
+        out_dir.rename(old)
+    tmp.rename(out_dir)
+    shutil.rmtree(old, ignore_errors=True)
+    return manifest
+
+
+# -------------------------
+# read (워커마다 mmap)
+# -------------------------
+class _Blob:
+    """utf-8 blob + offset 배열 → i번째 문자열 (필요할 때만 디코딩)"""
+
+    def __init__(self, path: Path, name: str):
+        self.offsets = np.load(path / f"{name}_offsets.npy", mmap_mode="r")
+        # 크기 0 파일은 mmap 불가
+        self._data = np.memmap(path / f"{name}.bin", dtype=np.uint8, mode="r") if self.offsets[-1] > 0 else None
+
+    def __getitem__(self, i: int) -> str:
+        if self._data is None:
+            return ""
+        s, e = int(self.offsets[i]), int(self.offsets[i + 1])
+        return bytes(self._data[s:e]).decode("utf-8")
+
+
+class ServingStore:
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.manifest: Dict[str, Any] = json.loads((self.path / "manifest.json").read_text(encoding="utf-8"))
+        self.version: str = self.manifest["version"]
+
+        def load(name: str) -> Optional[np.ndarray]:
+            p = self.path / f"{name}.npy"
+            return np.load(p, mmap_mode="r") if p.exists() else None
+
+        self.policy_ids = load("policy_ids")
+        self.texts = _Blob(self.path, "texts")
+        self.names = _Blob(self.path, "names")
+        self.columns = {c: load(c) for c in ELIGIBILITY_COLUMNS}
+        self.income_rule = load("income_rule")
+        self.homeowner_required = load("homeowner_required")
+        self.embeddings = load("embeddings")
+        self.neighbors_idx = load("neighbors_idx")
+        self.neighbors_score = load("neighbors_score")
+        self._index = {pid: i for i, pid in enumerate(self.policy_ids.tolist())}
+        alias_ids, alias_canonical = load("alias_ids"), load("alias_canonical")
+        if alias_ids is not None and alias_canonical is not None:
+            for a, c in zip(alias_ids.tolist(), alias_canonical.tolist()):
+                if c in self._index:
+                    self._index.setdefault(a, self._index[c])
+
+    def __len__(self) -> int:
+        return len(self.policy_ids)
+
+    def index_of(self, policy_id: str) -> Optional[int]:
+        return self._index.get(str(policy_id))
+
+    def text(self, i: int) -> str:
+        return self.texts[i]
+
+    def name(self, i: int) -> str:
+        return self.names[i]
+
+    def eligible_mask(
+        self,
+        *,
+        age: Optional[int] = None,
+        annual_income: Optional[int] = None,
+        assets: Optional[int] = None,
+        is_homeless: Optional[bool] = None,
+        vehicle_value: Optional[int] = None,
+    ) -> np.ndarray:
+        """EligibilityFilter(DB 필터)와 같은 기준을 전체 정책에 한 번에 적용 (정책 조건 결측은 통과, None인 사용자 값은 미적용)"""
+        c = self.columns
+        mask = np.ones(len(self), dtype=bool)
+        if age is not None:
+            mask &= ~(c["min_age"] > age)
+            mask &= ~(c["max_age"] < age)
+        if annual_income is not None:
+            amount = self.income_rule == INCOME_RULES.index("AMOUNT")
+            mask &= ~(amount & (c["income_threshold"] < annual_income))
+        if assets is not None:
+            mask &= ~(c["asset_threshold"] < assets)
+        if is_homeless is False:
+            mask &= ~self.homeowner_required
+        if vehicle_value is not None:
+            mask &= ~(c["vehicle_value_limit"] < vehicle_value)
+        return mask
+
+    def _explicit_conditions(self) -> Dict[str, np.ndarray]:
+        """정책별로 명시된(결측이 아닌) 자격 조건 → eligible_mask를 통과했다면 사용자가 충족한 조건"""
+        c = self.columns
+        return {
+            "연령 조건 충족": ~(np.isnan(c["min_age"]) & np.isnan(c["max_age"])),
+            "소득 조건 충족": (self.income_rule == INCOME_RULES.index("AMOUNT")) & ~np.isnan(c["income_threshold"]),
+            "자산 조건 충족": ~np.isnan(c["asset_threshold"]),
+            "무주택 조건 충족": np.asarray(self.homeowner_required, dtype=bool),
+            "차량가액 조건 충족": ~np.isnan(c["vehicle_value_limit"]),
+        }
+
+    def rank_eligible(self, mask: np.ndarray, top_k: int = 5) -> List[Dict[str, Any]]:
+        """
+        eligible_mask를 통과한 정책을 충족한 명시 조건 수가 많은 순으로 (조건이 구체적일수록 사용자에게 맞춘 정책)
+        같은 수면 빌드 순서 유지
+        """
+        conds = self._explicit_conditions()
+        matched = np.zeros(len(self), dtype=np.int64)
+        for arr in conds.values():
+            matched += arr
+        candidates = np.flatnonzero(mask)
+        order = candidates[np.argsort(-matched[candidates], kind="stable")][:top_k]
+        return [
+            {
+                "policy_id": str(self.policy_ids[i]),
+                "policy_name": self.names[i],
+                "score": round(100.0 * int(matched[i]) / len(conds), 1),
+                "rank": rank,
+                "matched_conditions": [label for label, arr in conds.items() if arr[i]],
+                "unmatched_conditions": [],
+            }
+            for rank, i in enumerate(order.tolist(), start=1)
+        ]
+
+    def neighbors(self, policy_id: str, top_k: int = 5) -> List[Dict[str, Any]]:
+        """미리 계산된 이웃 테이블 조회 (임베딩 없이 빌드했으면 빈 리스트)"""
+        i = self.index_of(policy_id)
+        if i is None or self.neighbors_idx is None:
+            return []
+        idx = self.neighbors_idx[i, :top_k]
+        score = self.neighbors_score[i, :top_k]
+        return [
+            {"policy_id": str(self.policy_ids[j]), "policy_name": self.names[j], "similarity_score": float(s)}
+            for j, s in zip(idx.tolist(), score.tolist())
+        ]
+
+
+@lru_cache(maxsize=1)
+def get_serving_store() -> Optional[ServingStore]:
+    """SERVING_DIR에 빌드된 아티팩트가 없으면 None (호출 측은 기존 경로로 동작)"""
+    if not (SERVING_DIR / "manifest.json").exists():
+        return None
+    store = ServingStore(SERVING_DIR)
+    INDEX_SIZE.set(len(store), "serving_policies")
+    logger.info(f"serving store mapped: {SERVING_DIR} (version={store.version}, rows={len(store)})")
+    return store
+
+
+# -------------------------
+# CLI
+# -------------------------
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="policies / eligibility → mmap 서빙 아티팩트")
+    ap.add_argument("--policies", default=str(ROOT_DIR / "pipeline" / "cleaner" / "policies.csv"))
+    ap.add_argument("--eligibility", default=str(ROOT_DIR / "pipeline" / "cleaner" / "policy_eligibility.csv"))
+    ap.add_argument("--embeddings", help="optional: policies.csv 행 순서와 같은 (N, D) 임베딩 .npy")
+    ap.add_argument("--neighbor-k", type=int, default=NEIGHBOR_K)
+    ap.add_argument("--out", default=str(SERVING_DIR))
+    return ap.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    manifest = build_serving_store(
+        Path(args.policies),
+        Path(args.eligibility),
+        Path(args.out),
+        embeddings_npy=Path(args.embeddings) if args.embeddings else None,
+        neighbor_k=args.neighbor_k,
+    )
+    print(f"[INFO] Saved → {args.out} (version={manifest['version']}, rows={manifest['rows']})")
+
+
+if __name__ == "__main__":
+    main()
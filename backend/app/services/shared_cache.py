@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from ..core.metrics import REGISTRY, Counter
+
+# 워커 간 공유 캐시 (QA 답변 등 계산 비용이 큰 결과)
+# - 같은 호스트의 모든 uvicorn 워커가 하나의 SQLite 파일(WAL)을 공유
+# - 한 워커가 계산한 답을 다른 워커가 그대로 재사용 → LLM 호출 수가 워커 수에 비례해 늘지 않음
+ROOT_DIR = Path(__file__).resolve().parents[3]
+SHARED_CACHE_PATH = Path(os.getenv("SHARED_CACHE_PATH", str(ROOT_DIR / "data" / "cache" / "shared_cache.sqlite3")))
+SHARED_CACHE_TTL = float(os.getenv("SHARED_CACHE_TTL", str(24 * 3600)))
+SHARED_CACHE_MAX_ENTRIES = int(os.getenv("SHARED_CACHE_MAX_ENTRIES", "20000"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    expires_at REAL NOT NULL
+)
+"""
+
+
+def cache_key(namespace: str, *parts: str) -> str:
+    h = hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+    return f"{namespace}:{h}"
+
+
+class SharedCache:
+    def __init__(self, path: Path = SHARED_CACHE_PATH, ttl: float = SHARED_CACHE_TTL, max_entries: int = SHARED_CACHE_MAX_ENTRIES):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _conn(self) -> sqlite3.Connection:
+        # sqlite3 커넥션은 스레드 간 공유하지 않음 (QA는 스레드풀에서 실행)
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[bytes]:
+        row = self._conn().execute(
+            "SELECT value FROM cache WHERE key = ? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row[0]
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        conn = self._conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, value, time.time() + (ttl if ttl is not None else self.ttl)),
+        )
+        self._writes += 1
+        if self._writes % 500 == 0:
+            self.prune()
+
+    def prune(self) -> None:
+        """만료 항목 삭제 + 상한 초과 시 만료가 가까운 것부터 삭제"""
+        conn = self._conn()
+        conn.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+        conn.execute(
+            "DELETE FROM cache WHERE key IN ("
+            " SELECT key FROM cache ORDER BY expires_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+
+shared_cache = SharedCache()
+
+REGISTRY.register(
+    Counter(
+        "shared_cache_requests_total",
+        "Shared (cross-worker) cache lookups by result in this worker",
+        ("result",),
+        collect=lambda: [(("hit",), shared_cache.hits), (("miss",), shared_cache.misses)],
+    )
+)
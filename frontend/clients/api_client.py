@@ -2,6 +2,31 @@ import requests
 
 BASE_URL = "http://localhost:8000"
 
+# ETag 재검증 캐시: (path, params) → (etag, body)
+# 서버가 304를 주면 다시 내려받지 않고 이전 body 재사용
+_ETAG_CACHE_MAX = 256
+_etag_cache = {}
+
+
+def _get_json_revalidated(path, params=None, timeout=10):
+    key = (path, tuple(sorted((params or {}).items())))
+    cached = _etag_cache.get(key)
+    headers = {"If-None-Match": cached[0]} if cached else {}
+
+    r = requests.get(f"{BASE_URL}{path}", params=params, headers=headers, timeout=timeout)
+    if r.status_code == 304 and cached:
+        return cached[1]
+    r.raise_for_status()
+    body = r.json()
+
+    etag = r.headers.get("ETag")
+    if etag:
+        _etag_cache.pop(key, None)
+        _etag_cache[key] = (etag, body)
+        while len(_etag_cache) > _ETAG_CACHE_MAX:
+            _etag_cache.pop(next(iter(_etag_cache)))
+    return body
+
 
 def health():
     try:
@@ -12,18 +37,43 @@ def health():
         return {"error": str(e)}
 
 
-def get_policies():
+def get_policies(params=None):
+    """
+    params: q, region, updated_since, age, annual_income, assets,
+            is_homeless, vehicle_value, cursor, limit (모두 선택)
+    검색/필터/페이지네이션은 서버에서 처리 → 한 페이지 분량만 받음
+    """
+    params = {k: v for k, v in (params or {}).items() if v not in (None, "", 0)}
+    try:
+        return _get_json_revalidated("/policies", params=params, timeout=10)
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def get_policy(policy_id):
+    try:
+        return _get_json_revalidated(f"/policies/{policy_id}", timeout=10)
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def get_policies_batch(ids, fields=None):
+    """정책 카드 여러 개를 요청 1번으로 (요청한 순서대로, 없는 ID는 data.missing)"""
+    payload = {"ids": list(ids)}
+    if fields:
+        payload["fields"] = fields
     try:
-        r = requests.get(f"{BASE_URL}/policies", timeout=10)
+        r = requests.post(f"{BASE_URL}/policies/batch", json=payload, timeout=10)
         r.raise_for_status()
         return r.json()
     except Exception as e:
         return {"error": str(e)}
 
 
-def recommend(payload):
+def recommend(payload, include_cards=False):
+    params = {"include_cards": "true"} if include_cards else None
     try:
-        r = requests.post(f"{BASE_URL}/recommend", json=payload, timeout=15)
+        r = requests.post(f"{BASE_URL}/recommend", json=payload, params=params, timeout=15)
         r.raise_for_status()
         return r.json()
     except Exception as e:
@@ -39,9 +89,10 @@ def policy_qa(payload):
         return {"error": str(e)}
 
 
-def similar(policy_id):
+def similar(policy_id, include_cards=False):
+    params = {"include_cards": "true"} if include_cards else None
     try:
-        r = requests.get(f"{BASE_URL}/similar/{policy_id}", timeout=10)
+        r = requests.get(f"{BASE_URL}/similar/{policy_id}", params=params, timeout=10)
         r.raise_for_status()
         return r.json()
     except Exception as e:
@@ -3,7 +3,12 @@ import streamlit as st
 def policy_card(policy: dict):
     """A simple white card with blue accent."""
     title = policy.get("policy_name") or policy.get("title") or "정책명 없음"
-    summary = policy.get("summary") or policy.get("support_summary") or "요약 없음"
+    # 추천/유사 결과(include_cards=true)는 "policy" 카드의 card_snippet(cleaner 한 줄 요약) 우선
+    card = policy.get("policy") or {}
+    summary = (
+        card.get("card_snippet") or policy.get("card_snippet") or policy.get("summary")
+        or policy.get("support_summary") or card.get("support_summary") or "요약 없음"
+    )
     score = policy.get("score")
 
     st.markdown(
@@ -2,42 +2,75 @@ import streamlit as st
 from clients.api_client import get_policies
 from components.cards import policy_card
 
+PAGE_SIZE = 20
+
+
+def _reset_pages():
+    # 검색 조건이 바뀌면 첫 페이지부터 다시 (필터만 바뀐 경우 검색 버튼을 다시 눌러야 조회)
+    st.session_state["policy_search_cursors"] = [None]
+    st.session_state["policy_search_active"] = False
+
+
 def render():
     st.markdown("### 🔎 정책 검색")
 
+    if "policy_search_cursors" not in st.session_state:
+        _reset_pages()
+
     # --- 검색 입력 ---
     col1, col2 = st.columns([3,1])
 
     with col1:
-        keyword = st.text_input("정책명 또는 키워드 검색")
+        keyword = st.text_input("정책명 또는 키워드 검색", on_change=_reset_pages)
 
     with col2:
-        search_btn = st.button("검색")
+        if st.button("검색", on_click=_reset_pages):
+            # 버튼 값은 한 번만 True → 페이지 이동(st.rerun) 후에도 결과가 유지되도록 세션에 기록
+            st.session_state["policy_search_active"] = True
 
     # --- 필터 ---
     with st.expander("고급 필터"):
-        age = st.number_input("연령 (선택)", min_value=0, max_value=120, value=0)
-        income = st.number_input("월소득 (선택)", min_value=0, value=0)
+        region = st.text_input("지역 (선택)", on_change=_reset_pages)
+        age = st.number_input("연령 (선택)", min_value=0, max_value=120, value=0, on_change=_reset_pages)
+        income = st.number_input("월소득 (만원, 선택)", min_value=0, value=0, on_change=_reset_pages)
 
-    # --- 데이터 호출 ---
-    if search_btn or keyword:
-        data = get_policies()
+    # --- 데이터 호출 (검색/필터/페이지네이션은 서버에서) ---
+    if st.session_state["policy_search_active"] or keyword:
+        cursors = st.session_state["policy_search_cursors"]
+        params = {
+            "q": keyword.strip(),
+            "region": region.strip(),
+            "age": int(age) or None,
+            "annual_income": int(income) * 10000 * 12 or None,
+            "cursor": cursors[-1],
+            "limit": PAGE_SIZE,
+        }
+        data = get_policies(params)
 
-        policies = data.get("results", data) if isinstance(data, dict) else data
+        # 성공 응답에도 "error": null 이 포함되므로 키가 아니라 값으로 판단
+        if data.get("error") or not data.get("success"):
+            st.error(f"정책 조회 실패: {data['error']}" if data.get("error") else "정책 조회 실패")
+            return
 
-        # 키워드 필터 (프론트 단 필터링)
-        if keyword:
-            policies = [
-                p for p in policies
-                if keyword.lower() in (p.get("policy_name","").lower()
-                                       + p.get("summary","").lower())
-            ]
+        page = data.get("data") or {}
+        policies = page.get("items", [])
+        next_cursor = page.get("next_cursor")
 
         if not policies:
             st.warning("검색 결과 없음")
             return
 
-        st.markdown(f"총 {len(policies)}건")
+        st.markdown(f"{len(cursors)}페이지 · {len(policies)}건")
 
         for p in policies:
-            policy_card(p)
\ No newline at end of file
+            policy_card(p)
+
+        prev_col, next_col = st.columns(2)
+        with prev_col:
+            if len(cursors) > 1 and st.button("이전 페이지"):
+                cursors.pop()
+                st.rerun()
+        with next_col:
+            if next_cursor and st.button("다음 페이지"):
+                cursors.append(next_cursor)
+                st.rerun()
@@ -9,8 +9,11 @@ def render():
     profile = profile_form()
 
     if profile:
-        result = recommend(profile)
-        policies = result.get("results", [])
+        result = recommend(profile, include_cards=True)
+        if result.get("error") or not result.get("success"):
+            st.error(f"추천 실패: {result['error']}" if result.get("error") else "추천 실패")
+            return
+        policies = result.get("data") or []
 
         if not policies:
             st.warning("추천 결과 없음")
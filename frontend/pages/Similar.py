@@ -9,8 +9,11 @@ def render():
 
     if st.button("조회"):
         if policy_id:
-            result = similar(policy_id)
-            policies = result.get("results", [])
+            result = similar(policy_id, include_cards=True)
+            if result.get("error") or not result.get("success"):
+                st.error(f"유사 정책 조회 실패: {result['error']}" if result.get("error") else "유사 정책 조회 실패")
+                return
+            policies = result.get("data") or []
 
             if not policies:
                 st.info("유사 정책 결과가 없습니다.")
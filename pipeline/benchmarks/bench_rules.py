@@ -0,0 +1,322 @@
+# bench_rules.py
+# ------------------------------------------------------------
+# 배치 파이프라인 핫 함수 마이크로벤치마크
+#   - 대상: parse_age / parse_income / parse_assets / parse_car, parse_all(룰 엔진),
+#           build_clean_text, build_text_bundle, extract_sections_from_raw_text, check_eligibility
+#   - 코퍼스(고정):
+#       detail : data_collection/parsing/detail_parsing.csv (행별 본문)
+#       merged : data_collection/data_merge/merged_policies.csv (짧은 요약)
+#       synth_<size> : detail 본문을 seed 고정으로 섞어 이어 붙인 긴 텍스트 (10KB, 1MB …)
+#   - 측정: ops/sec (호출 수 / 경과 시간), MB/s, 호출당 tracemalloc peak(KB)
+#   - 회귀 검사: --baseline 과 비교해 ops/sec 하락 또는 peak 증가가 --threshold 를 넘으면 exit 1
+#
+# 실행 (repo 루트에서):
+#   python pipeline/benchmarks/bench_rules.py --save-baseline pipeline/benchmarks/baseline.json
+#   python pipeline/benchmarks/bench_rules.py --baseline pipeline/benchmarks/baseline.json --threshold 0.25
+#   python pipeline/benchmarks/bench_rules.py --sizes 10KB,1MB,4MB --only parse_income
+# ------------------------------------------------------------
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(HERE, "..", ".."))
+for p in (PROJECT_ROOT, os.path.join(PROJECT_ROOT, "backend")):
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+from pipeline.cleaner.build_clean_text import build_clean_text, build_text_bundle  # noqa: E402
+from pipeline.cleaner.rules.engine import parse_all  # noqa: E402
+from pipeline.cleaner.rules.parse_age import parse_age  # noqa: E402
+from pipeline.cleaner.rules.parse_assets import parse_assets  # noqa: E402
+from pipeline.cleaner.rules.parse_car import parse_car  # noqa: E402
+from pipeline.cleaner.rules.parse_income import parse_income  # noqa: E402
+
+DETAIL_CSV = os.path.join(PROJECT_ROOT, "data_collection", "parsing", "detail_parsing.csv")
+MERGED_CSV = os.path.join(PROJECT_ROOT, "data_collection", "data_merge", "merged_policies.csv")
+ELIG_CSV = os.path.join(PROJECT_ROOT, "pipeline", "cleaner", "policy_eligibility.csv")
+PARSER_PY = os.path.join(PROJECT_ROOT, "data_collection", "parsing", "parser.py")
+
+TEXT_COLS = ["eligibility", "benefit", "apply_process", "apply_period", "full_text"]
+SEED = 20240101
+
+
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", default="10KB,1MB", help="합성 코퍼스 크기 (콤마 구분, KB/MB 단위)")
+    ap.add_argument("--min-time", type=float, default=0.5, help="케이스당 최소 측정 시간(초)")
+    ap.add_argument("--only", help="특정 함수만 실행 (콤마 구분)")
+    ap.add_argument("--baseline", help="비교할 baseline JSON")
+    ap.add_argument("--threshold", type=float, default=0.25, help="허용 회귀 비율 (0.25 = 25%%)")
+    ap.add_argument("--save-baseline", help="결과를 baseline JSON으로 저장")
+    ap.add_argument("--json", help="optional: 결과를 JSON 파일로 저장")
+    return ap.parse_args()
+
+
+def parse_size(s: str) -> int:
+    s = s.strip().upper()
+    for unit, mul in (("MB", 1024 * 1024), ("KB", 1024), ("B", 1)):
+        if s.endswith(unit):
+            return int(float(s[: -len(unit)]) * mul)
+    return int(s)
+
+
+# -------------------------
+# corpora
+# -------------------------
+def _cell(v: Any) -> str:
+    if v is None or (isinstance(v, float) and pd.isna(v)):
+        return ""
+    return str(v).strip()
+
+
+def load_detail_rows() -> List[Dict[str, Any]]:
+    df = pd.read_csv(DETAIL_CSV, encoding="utf-8-sig")
+    return df.astype(object).where(pd.notna(df), None).to_dict(orient="records")
+
+
+def load_merged_rows() -> List[Dict[str, Any]]:
+    df = pd.read_csv(MERGED_CSV, encoding="utf-8-sig")
+    return df.astype(object).where(pd.notna(df), None).to_dict(orient="records")
+
+
+def rule_text(row: Dict[str, Any]) -> str:
+    """run_clean의 text_for_rules와 같은 방식으로 섹션을 이어 붙임"""
+    return "\n".join(t for t in (_cell(row.get(c)) for c in TEXT_COLS) if t)
+
+
+def synth_text(pool: List[str], size: int, seed: int = SEED) -> str:
+    """pool의 본문을 seed 고정으로 섞어 size(UTF-8 바이트)까지 이어 붙임"""
+    rnd = random.Random(seed)
+    parts: List[str] = []
+    total = 0
+    while total < size:
+        t = rnd.choice(pool)
+        parts.append(t)
+        total += len(t.encode("utf-8")) + 1
+    text = "\n".join(parts)
+    return text.encode("utf-8")[:size].decode("utf-8", errors="ignore")
+
+
+def build_corpora(sizes: List[int]) -> Dict[str, Dict[str, Any]]:
+    detail = load_detail_rows()
+    merged = load_merged_rows()
+
+    detail_texts = [t for t in (rule_text(r) for r in detail) if t]
+    merged_texts = [
+        t for t in ("\n".join(_cell(r.get(c)) for c in ("정책명", "대상", "요약")).strip() for r in merged) if t
+    ]
+    raw_texts = [t for t in (_cell(r.get("full_text")) for r in detail) if t]
+
+    corpora: Dict[str, Dict[str, Any]] = {
+        "detail": {"texts": detail_texts, "raw": raw_texts, "rows": detail},
+        "merged": {"texts": merged_texts, "raw": merged_texts, "rows": merged},
+    }
+    for size in sizes:
+        label = f"synth_{size // 1024}KB" if size < 1024 * 1024 else f"synth_{size // (1024 * 1024)}MB"
+        text = synth_text(detail_texts, size)
+        raw = synth_text(raw_texts, size, seed=SEED + 1)
+        row = dict(detail[0])
+        for c in TEXT_COLS:
+            row[c] = synth_text(detail_texts, size // len(TEXT_COLS), seed=SEED + len(c))
+        corpora[label] = {"texts": [text], "raw": [raw], "rows": [row]}
+    return corpora
+
+
+def load_extract_sections() -> Optional[Callable[[str], Dict[str, str]]]:
+    """parser.py는 requests/bs4를 import하므로, 없으면 해당 케이스만 건너뜀"""
+    try:
+        spec = importlib.util.spec_from_file_location("bench_parser", PARSER_PY)
+        mod = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+        spec.loader.exec_module(mod)  # type: ignore[union-attr]
+        return mod.extract_sections_from_raw_text
+    except ImportError as e:
+        print(f"[WARN] extract_sections_from_raw_text skipped ({e})")
+        return None
+
+
+def load_check_eligibility():
+    from app.pipeline.rag_filter_ver3 import UserProfile, check_eligibility
+
+    df = pd.read_csv(ELIG_CSV, encoding="utf-8-sig")
+    rows = df.astype(object).where(pd.notna(df), None).to_dict(orient="records")
+    users = [
+        UserProfile(age=27, annual_income=32_000_000, assets=50_000_000, is_homeless=True, vehicle_value=0),
+        UserProfile(age=35, annual_income=70_000_000, assets=300_000_000, is_homeless=False, vehicle_value=30_000_000),
+        UserProfile(age=22),
+    ]
+    pairs = [(r, u) for u in users for r in rows]
+    return check_eligibility, pairs
+
+
+# -------------------------
+# measurement
+# -------------------------
+def measure(fn: Callable[[Any], Any], inputs: List[Any], nbytes: int, min_time: float) -> Dict[str, Any]:
+    # 1) 처리량: 입력 전체를 한 바퀴씩, min_time을 넘길 때까지 반복
+    calls = 0
+    t0 = time.perf_counter()
+    while True:
+        for x in inputs:
+            fn(x)
+        calls += len(inputs)
+        elapsed = time.perf_counter() - t0
+        if elapsed >= min_time:
+            break
+    rounds = calls // len(inputs)
+
+    # 2) 할당: 호출 1회당 tracemalloc peak (측정 오버헤드가 커서 처리량과 분리)
+    peaks: List[int] = []
+    tracemalloc.start()
+    try:
+        for x in inputs:
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            fn(x)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(max(0, peak - base))
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "inputs": len(inputs),
+        "calls": calls,
+        "ops_per_sec": round(calls / elapsed, 2),
+        "mb_per_sec": round(nbytes * rounds / elapsed / (1024 * 1024), 3) if nbytes else None,
+        "peak_kb_mean": round(sum(peaks) / len(peaks) / 1024, 2),
+        "peak_kb_max": round(max(peaks) / 1024, 2),
+    }
+
+
+def run_benchmarks(corpora: Dict[str, Dict[str, Any]], only: Optional[set], min_time: float) -> List[Dict[str, Any]]:
+    text_fns: Dict[str, Callable[[Any], Any]] = {
+        "parse_age": parse_age,
+        "parse_income": parse_income,
+        "parse_assets": parse_assets,
+        "parse_car": parse_car,
+        "parse_all": parse_all,  # 룰 엔진: 위 4개를 한 번에
+    }
+    results: List[Dict[str, Any]] = []
+
+    def want(name: str) -> bool:
+        return not only or name in only
+
+    def add(name: str, corpus: str, fn, inputs, nbytes: int) -> None:
+        if not inputs:
+            return
+        r = measure(fn, inputs, nbytes, min_time)
+        results.append({"case": f"{name}/{corpus}", **r})
+        print(f"[INFO] {name:<32} {corpus:<12} {r['ops_per_sec']:>12,.1f} ops/s")
+
+    extract_sections = load_extract_sections() if want("extract_sections_from_raw_text") else None
+
+    for corpus, c in corpora.items():
+        text_bytes = sum(len(t.encode("utf-8")) for t in c["texts"])
+        for name, fn in text_fns.items():
+            if want(name):
+                add(name, corpus, fn, c["texts"], text_bytes)
+        row_bytes = sum(len(_cell(v).encode("utf-8")) for r in c["rows"] for v in r.values())
+        if want("build_clean_text"):
+            add("build_clean_text", corpus, build_clean_text, c["rows"], row_bytes)
+        if want("build_text_bundle"):
+            add("build_text_bundle", corpus, build_text_bundle, c["rows"], row_bytes)
+        if extract_sections is not None:
+            raw_bytes = sum(len(t.encode("utf-8")) for t in c["raw"])
+            add("extract_sections_from_raw_text", corpus, extract_sections, c["raw"], raw_bytes)
+
+    if want("check_eligibility"):
+        check_eligibility, pairs = load_check_eligibility()
+        add("check_eligibility", "eligibility", lambda p: check_eligibility(*p), pairs, 0)
+
+    return results
+
+
+# -------------------------
+# baseline 비교
+# -------------------------
+def compare(results: List[Dict[str, Any]], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    base = {r["case"]: r for r in baseline.get("results", [])}
+    regressions: List[str] = []
+    for r in results:
+        b = base.get(r["case"])
+        if not b:
+            continue
+        speed = r["ops_per_sec"] / b["ops_per_sec"] - 1 if b["ops_per_sec"] else 0.0
+        mem = r["peak_kb_max"] / b["peak_kb_max"] - 1 if b["peak_kb_max"] else 0.0
+        r["delta_ops"] = round(speed, 4)
+        r["delta_peak"] = round(mem, 4)
+        if speed < -threshold:
+            regressions.append(f"{r['case']}: ops/sec {b['ops_per_sec']:,.1f} → {r['ops_per_sec']:,.1f} ({speed:+.1%})")
+        if mem > threshold:
+            regressions.append(f"{r['case']}: peak {b['peak_kb_max']:,.1f}KB → {r['peak_kb_max']:,.1f}KB ({mem:+.1%})")
+    return regressions
+
+
+def print_table(results: List[Dict[str, Any]]) -> None:
+    has_delta = any("delta_ops" in r for r in results)
+    header = f"{'case':<46} {'ops/s':>12} {'MB/s':>9} {'peak KB':>10}"
+    if has_delta:
+        header += f" {'Δops':>8} {'Δpeak':>8}"
+    print()
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        mbs = f"{r['mb_per_sec']:.2f}" if r["mb_per_sec"] is not None else "-"
+        line = f"{r['case']:<46} {r['ops_per_sec']:>12,.1f} {mbs:>9} {r['peak_kb_max']:>10,.1f}"
+        if has_delta:
+            d_ops = f"{r['delta_ops']:+.1%}" if "delta_ops" in r else "-"
+            d_peak = f"{r['delta_peak']:+.1%}" if "delta_peak" in r else "-"
+            line += f" {d_ops:>8} {d_peak:>8}"
+        print(line)
+
+
+def main() -> None:
+    args = parse_args()
+    sizes = [parse_size(s) for s in args.sizes.split(",") if s.strip()]
+    only = {s.strip() for s in args.only.split(",")} if args.only else None
+
+    corpora = build_corpora(sizes)
+    results = run_benchmarks(corpora, only, args.min_time)
+
+    regressions: List[str] = []
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+
+    print_table(results)
+
+    report = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "sizes": sizes,
+        "min_time": args.min_time,
+        "results": results,
+    }
+    for path in (args.save_baseline, args.json):
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            print(f"[INFO] Saved → {path}")
+
+    if regressions:
+        print(f"\n[FAIL] {len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for line in regressions:
+            print(f"  - {line}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# check_dedup.py
+# ------------------------------------------------------------
+# 중복 정책 클러스터(dedup.py) 회귀 검사 — 합성 텍스트로 기대 클러스터를 고정
+#   - chain : A≈B, B≈C 이지만 A와 C는 threshold 미만 → C가 A(대표)에 묶이면 안 됨
+#             (전이적 union-find만 쓰면 C가 추천/QA에서 조용히 빠짐)
+#   - copies: 같은 정책이 여러 포털에서 그대로 들어온 경우 → 한 클러스터, LSH 후보 쌍은 버킷당 k-1개
+#   - 하나라도 기대와 다르면 exit 1
+#
+# 실행 (repo 루트에서):
+#   python pipeline/benchmarks/check_dedup.py
+# ------------------------------------------------------------
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(HERE, "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from pipeline.cleaner.dedup import THRESHOLD, Deduper, estimated_jaccard  # noqa: E402
+
+SYLLABLES = "가나다라마바사아자차카타파하거너더러머버서어저처커터퍼허고노도로모보소오조초"
+
+
+def _words(rnd: random.Random, n: int) -> List[str]:
+    return ["".join(rnd.choice(SYLLABLES) for _ in range(3)) for _ in range(n)]
+
+
+def _replace(rnd: random.Random, words: List[str], start: int, end: int) -> List[str]:
+    out = list(words)
+    out[start:end] = _words(rnd, end - start)
+    return out
+
+
+def _run(texts: List[str]) -> Tuple[Dict[int, int], Dict[str, Any], List[np.ndarray]]:
+    """(policy_id → canonical_id, 리포트, 서명). policy_id는 1부터 입력 순서대로"""
+    d = Deduper()
+    d.count_lines(texts)
+    ids = range(1, len(texts) + 1)
+    d.add(ids, [f"P{i}" for i in ids], texts)
+    sigs = [d.hasher.signature(t, d.boilerplate) for t in texts]
+    table, report = d.finish()
+    return dict(zip(table["policy_id"], table["canonical_id"])), report, sigs
+
+
+def check_chain() -> List[str]:
+    rnd = random.Random(1)
+    base = _words(rnd, 200)
+    a = base + ["끝"]  # 가장 긴 텍스트 → 대표
+    b = _replace(rnd, base, 0, 20)
+    c = _replace(rnd, b, 180, 200)
+    canonical, _, s = _run([" ".join(w) for w in (a, b, c)])
+    j_ab, j_bc, j_ac = (estimated_jaccard(s[0], s[1]), estimated_jaccard(s[1], s[2]), estimated_jaccard(s[0], s[2]))
+    errors = []
+    if not (j_ab >= THRESHOLD and j_bc >= THRESHOLD and j_ac < THRESHOLD):
+        errors.append(f"chain fixture drifted: J(A,B)={j_ab:.3f} J(B,C)={j_bc:.3f} J(A,C)={j_ac:.3f}")
+    if canonical[2] != 1:
+        errors.append(f"chain: B should join A, got canonical={canonical[2]}")
+    if canonical[3] == 1:
+        errors.append(f"chain: C merged into A although J(A,C)={j_ac:.3f} < {THRESHOLD}")
+    return errors
+
+
+def check_copies(k: int = 6) -> List[str]:
+    rnd = random.Random(2)
+    text = " ".join(_words(rnd, 200))
+    other = " ".join(_words(rnd, 200))
+    canonical, report, _ = _run([text] * k + [other])
+    errors = []
+    if any(canonical[i] != 1 for i in range(1, k + 1)):
+        errors.append(f"copies: expected all {k} copies under policy 1, got {canonical}")
+    if canonical[k + 1] != k + 1:
+        errors.append(f"copies: unrelated policy merged into {canonical[k + 1]}")
+    if report["candidate_pairs"] != k - 1:
+        errors.append(f"copies: expected {k - 1} candidate pairs (first member links), got {report['candidate_pairs']}")
+    return errors
+
+
+def main() -> None:
+    errors = check_chain() + check_copies()
+    if errors:
+        print(f"[FAIL] {len(errors)} check(s) failed")
+        for e in errors:
+            print(f"  - {e}")
+        sys.exit(1)
+    print("[INFO] OK: dedup chain / copies checks passed")
+
+
+if __name__ == "__main__":
+    main()
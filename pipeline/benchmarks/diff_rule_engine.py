@@ -0,0 +1,156 @@
+# diff_rule_engine.py
+# ------------------------------------------------------------
+# 룰 엔진(parse_all) / 현재 개별 parse_* vs 고정된 baseline 구현(reference_rules.py) 차분 검증 + 속도 비교
+#   - 코퍼스: repo의 CSV 전부 (정책 본문 컬럼 / run_clean의 text_for_rules 조합 / clean_text)
+#             + seed 고정 fuzz 텍스트 (룰 리터럴 조각 + 숫자 + 공백/개행 + 일반 문자 랜덤 조합)
+#   - 기준은 룰 엔진/공유 컨텍스트 도입 전 parse_*의 고정 복사본 → 현재 parse_*(FullContext, parse_money_to_won 재작성)의 회귀도 잡음
+#   - age/income/assets/car 결과(dict)가 하나라도 다르면 exit 1
+#
+# 실행 (repo 루트에서):
+#   python pipeline/benchmarks/diff_rule_engine.py
+#   python pipeline/benchmarks/diff_rule_engine.py --fuzz 20000 --show 5
+# ------------------------------------------------------------
+
+from __future__ import annotations
+
+import argparse
+import glob
+import os
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+import pandas as pd
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(HERE, "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from pipeline.benchmarks import reference_rules  # noqa: E402
+from pipeline.cleaner.rules.engine import parse_all  # noqa: E402
+from pipeline.cleaner.rules.parse_age import parse_age  # noqa: E402
+from pipeline.cleaner.rules.parse_assets import parse_assets  # noqa: E402
+from pipeline.cleaner.rules.parse_car import parse_car  # noqa: E402
+from pipeline.cleaner.rules.parse_income import parse_income  # noqa: E402
+
+# 기준: baseline parse_* 고정 복사본
+REFERENCE: Dict[str, Callable[[str], Dict[str, Any]]] = {
+    "age": reference_rules.parse_age,
+    "income": reference_rules.parse_income,
+    "assets": reference_rules.parse_assets,
+    "car": reference_rules.parse_car,
+}
+# 검증 대상 1: 현재 개별 parse_* (속도 비교의 기준이기도 함)
+CURRENT: Dict[str, Callable[[str], Dict[str, Any]]] = {
+    "age": parse_age,
+    "income": parse_income,
+    "assets": parse_assets,
+    "car": parse_car,
+}
+RULE_TEXT_COLS = ["eligibility", "benefit", "apply_process", "apply_period", "raw_text"]
+
+# fuzz 조각: 룰 리터럴/경계 케이스 위주
+FUZZ_PIECES = [
+    "만", "세", "이상", "이하", "미만", "초과", "이내", "~", "-", "–", "—", "%", ",", " ", "  ", "\n", "\t",
+    "기준", "중위", "소득", "중위소득", "중위 소득", "도시근로자", "월평균", "평균", "연", "월", "연소득", "월 소득",
+    "만원", "원", "억", "분위", "인", "총", "순", "자산", "재산", "차량", "자동차", "가액", "미보유", "무소유",
+    "대상", "및", "(", ")", ".", "가구", "청년", "a", "B", "·", "１", "٣",
+]
+
+
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--fuzz", type=int, default=5000, help="fuzz 텍스트 개수")
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--show", type=int, default=3, help="불일치 예시 출력 개수")
+    return ap.parse_args()
+
+
+def _cell(v: Any) -> str:
+    if v is None or (isinstance(v, float) and pd.isna(v)):
+        return ""
+    return str(v)
+
+
+def load_repo_texts() -> List[Tuple[str, str]]:
+    """(출처, 텍스트) — repo의 CSV 전부에서 문자열 컬럼 + run_clean 방식 조합"""
+    texts: List[Tuple[str, str]] = []
+    for path in sorted(glob.glob(os.path.join(PROJECT_ROOT, "**", "*.csv"), recursive=True)):
+        try:
+            df = pd.read_csv(path, encoding="utf-8-sig", dtype=str)
+        except Exception as e:
+            print(f"[WARN] skip {path}: {e}")
+            continue
+        rel = os.path.relpath(path, PROJECT_ROOT)
+        for col in df.columns:
+            for i, v in enumerate(df[col].tolist()):
+                s = _cell(v)
+                if s.strip():
+                    texts.append((f"{rel}:{col}:{i}", s))
+        if all(c in df.columns for c in ("eligibility", "benefit")):
+            for i, row in enumerate(df.to_dict(orient="records")):
+                s = "\n".join(t for t in (_cell(row.get(c)).strip() for c in RULE_TEXT_COLS) if t)
+                if s:
+                    texts.append((f"{rel}:text_for_rules:{i}", s))
+    return texts
+
+
+def fuzz_texts(n: int, seed: int) -> List[Tuple[str, str]]:
+    rnd = random.Random(seed)
+    out: List[Tuple[str, str]] = []
+    for i in range(n):
+        parts = []
+        for _ in range(rnd.randint(1, 40)):
+            r = rnd.random()
+            if r < 0.3:
+                parts.append(str(rnd.choice([rnd.randint(0, 9), rnd.randint(10, 99), rnd.randint(100, 99999)])))
+            elif r < 0.35:
+                parts.append(f"{rnd.randint(1, 999):,}")
+            else:
+                parts.append(rnd.choice(FUZZ_PIECES))
+        out.append((f"fuzz:{i}", "".join(parts)))
+    return out
+
+
+def main() -> None:
+    args = parse_args()
+    cases = load_repo_texts() + fuzz_texts(args.fuzz, args.seed)
+    print(f"[INFO] texts: {len(cases)} (repo CSV + fuzz {args.fuzz})")
+
+    # (출처, 대상, 룰, 텍스트)
+    mismatches: List[Tuple[str, str, str, str]] = []
+    t_cur = 0.0
+    t_engine = 0.0
+    for origin, text in cases:
+        expected = {k: fn(text) for k, fn in REFERENCE.items()}
+        t0 = time.perf_counter()
+        current = {k: fn(text) for k, fn in CURRENT.items()}
+        t1 = time.perf_counter()
+        actual = parse_all(text)
+        t2 = time.perf_counter()
+        t_cur += t1 - t0
+        t_engine += t2 - t1
+        for k in REFERENCE:
+            if expected[k] != current[k]:
+                mismatches.append((origin, "parse_*", k, text))
+            if expected[k] != actual[k]:
+                mismatches.append((origin, "parse_all", k, text))
+
+    print(f"[INFO] parse_* x4 : {t_cur:.3f}s")
+    print(f"[INFO] parse_all  : {t_engine:.3f}s (x{t_cur / t_engine if t_engine else 0:.2f})")
+
+    if mismatches:
+        print(f"[FAIL] {len(mismatches)} mismatch(es) vs baseline reference")
+        for origin, target, rule, text in mismatches[: args.show]:
+            got = CURRENT[rule](text) if target == "parse_*" else parse_all(text)[rule]
+            print(f"  - {origin} [{target}:{rule}]: {text[:120]!r}")
+            print(f"      expected: {REFERENCE[rule](text)}")
+            print(f"      actual  : {got}")
+        sys.exit(1)
+    print("[INFO] OK: parse_all == parse_* == baseline reference for all texts")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,353 @@
+# reference_rules.py
+# ------------------------------------------------------------
+# diff_rule_engine.py의 기준(golden) 구현: 룰 엔진/공유 컨텍스트 도입 전(baseline) parse_* 와 utils를 그대로 고정한 복사본
+#   - pipeline/cleaner/rules 쪽을 고쳐도 이 파일은 바뀌지 않으므로 새 구현의 회귀를 잡을 수 있음
+#   - 룰의 의미를 의도적으로 바꿀 때만 이 파일도 함께 수정할 것
+# ------------------------------------------------------------
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List, Optional
+
+
+# -------------------------
+# utils
+# -------------------------
+def norm_text(text: str) -> str:
+    if text is None:
+        return ""
+    t = str(text)
+    t = t.replace("\r\n", "\n").replace("\r", "\n")
+    # 공백 정리
+    t = re.sub(r"[ \t]+", " ", t)
+    t = re.sub(r"\n{3,}", "\n\n", t)
+    return t.strip()
+
+
+def find_all(pattern: str, text: str, flags: int = re.IGNORECASE) -> List[re.Match]:
+    return list(re.finditer(pattern, text, flags))
+
+
+def to_int_safe(s: str) -> Optional[int]:
+    s = re.sub(r"[^\d]", "", s)
+    if not s:
+        return None
+    try:
+        return int(s)
+    except Exception:
+        return None
+
+
+def parse_money_to_won(s: str) -> Optional[int]:
+    """
+    한국어 금액 표현을 '원' 단위 int로 근사 변환.
+    지원: 만/억 + 숫자(정수). (소수는 버림)
+    예)
+      "200만원" -> 2_000_000
+      "1억" -> 100_000_000
+      "1억 2천만원" 같은 복합은 1차 버전에선 부분 매칭만 될 수 있음.
+    """
+    if not s:
+        return None
+    s = s.replace(",", "").replace(" ", "")
+
+    # 1) 억 단위
+    m = re.search(r"(\d+)\s*억", s)
+    total = 0
+    if m:
+        v = to_int_safe(m.group(1))
+        if v is not None:
+            total += v * 100_000_000
+
+    # 2) 만 단위
+    m2 = re.search(r"(\d+)\s*만", s)
+    if m2:
+        v2 = to_int_safe(m2.group(1))
+        if v2 is not None:
+            total += v2 * 10_000
+
+    # 3) 원/천원/만원/백만원/천만원 등 숫자원 (간단 처리)
+    m3 = re.search(r"(\d+)\s*원", s)
+    if m3:
+        v3 = to_int_safe(m3.group(1))
+        if v3 is not None:
+            total += v3
+
+    return total if total > 0 else None
+
+
+def result_template(entity: str) -> Dict[str, Any]:
+    return {
+        "entity": entity,
+        "constraints": [],     # 조건 리스트
+        "notes": [],           # 애매한 문구/추가정보
+        "evidence": [],        # (필요 시) 매칭된 원문 조각
+    }
+
+
+# -------------------------
+# parse_age
+# -------------------------
+def parse_age(text: str) -> Dict[str, Any]:
+    """
+    반환 포맷:
+    {
+      "entity": "age",
+      "constraints": [
+        {"type":"min", "value":19},
+        {"type":"max", "value":34},
+        {"type":"range", "min":19, "max":34},
+        {"type":"exact", "value":65},
+      ],
+      "notes": [...],
+      "evidence": [...]
+    }
+    """
+    t = norm_text(text)
+    out = result_template("age")
+    if not t:
+        return out
+
+    # 패턴들
+    patterns = [
+        # 만 19세 이상 / 19세 이상
+        (r"(만\s*)?(\d{1,2})\s*세\s*이상", "min"),
+        # 만 34세 이하 / 34세 이하
+        (r"(만\s*)?(\d{1,2})\s*세\s*이하", "max"),
+        # 만 19세 ~ 34세 / 19세~34세 / 19-34세
+        (r"(만\s*)?(\d{1,2})\s*세?\s*(?:~|-|–|—)\s*(만\s*)?(\d{1,2})\s*세", "range"),
+        # 65세 (이상/이하 없이 단독은 exact로 두되 note)
+        (r"(만\s*)?(\d{1,2})\s*세\b", "maybe_exact"),
+    ]
+
+    used_spans = set()
+
+    # range 우선
+    for m in re.finditer(patterns[2][0], t, re.IGNORECASE):
+        a = to_int_safe(m.group(2))
+        b = to_int_safe(m.group(4))
+        if a is None or b is None:
+            continue
+        out["constraints"].append({"type": "range", "min": min(a, b), "max": max(a, b)})
+        out["evidence"].append(m.group(0))
+        used_spans.add(m.span())
+
+    # min/max
+    for pat, typ in [patterns[0], patterns[1]]:
+        for m in re.finditer(pat, t, re.IGNORECASE):
+            # range에 포함된 span이면 스킵(대충)
+            if any(_overlap(m.span(), s) for s in used_spans):
+                continue
+            v = to_int_safe(m.group(2))
+            if v is None:
+                continue
+            out["constraints"].append({"type": typ, "value": v})
+            out["evidence"].append(m.group(0))
+
+    # maybe_exact: 다른 조건이 하나도 없을 때만 참고
+    if not out["constraints"]:
+        for m in re.finditer(patterns[3][0], t, re.IGNORECASE):
+            v = to_int_safe(m.group(2))
+            if v is None:
+                continue
+            out["constraints"].append({"type": "exact", "value": v})
+            out["notes"].append("단독 'N세' 표현은 문맥상 정확조건이 아닐 수 있음")
+            out["evidence"].append(m.group(0))
+            break
+
+    return out
+
+
+def _overlap(a, b) -> bool:
+    return not (a[1] <= b[0] or b[1] <= a[0])
+
+
+# -------------------------
+# parse_income
+# -------------------------
+def parse_income(text: str) -> Dict[str, Any]:
+    t = norm_text(text)
+    out = result_template("income")
+    if not t:
+        return out
+
+    # 내부 유틸
+    def _op_to_maxmin(op: str) -> Optional[str]:
+        op = (op or "").strip()
+        if op in ("이하", "미만", "이내"):
+            return "max"
+        if op in ("이상", "초과"):
+            return "min"
+        return None
+
+    def _append_constraint(ctype: str, value: int, op: Optional[str], ev: str) -> None:
+        # 중복 방지(같은 type/value/op가 이미 있으면 스킵)
+        key = (ctype, int(value), op or "")
+        for c in out["constraints"]:
+            if isinstance(c, dict) and (c.get("type"), c.get("value"), c.get("op", "")) == key:
+                return
+        payload = {"type": ctype, "value": int(value)}
+        if op:
+            payload["op"] = op
+        out["constraints"].append(payload)
+        out["evidence"].append(ev)
+
+    # ---------------------------------------------------------------------
+    # 1) 중위소득 % (가장 우선/명확)
+    # ---------------------------------------------------------------------
+    # 예: 기준 중위소득 150% 이하, 중위 소득 120% 이내, 중위소득 100% 이상
+    for m in re.finditer(
+        r"(?:기준\s*)?중위\s*소득\s*(\d{1,3})\s*%\s*(이하|미만|이내|이상|초과)",
+        t,
+        re.IGNORECASE,
+    ):
+        p = to_int_safe(m.group(1))
+        if p is None:
+            continue
+        op_word = m.group(2)
+        mm = _op_to_maxmin(op_word)
+        if mm == "max":
+            _append_constraint("median_percent_max", p, "max", m.group(0))
+        elif mm == "min":
+            _append_constraint("median_percent_min", p, "min", m.group(0))
+
+    # ---------------------------------------------------------------------
+    # 2) 비-중위소득 % (평균/기준/도시근로자월평균/그냥 소득)
+    # ---------------------------------------------------------------------
+    # 예: 도시근로자 월평균소득 120% 이하, 평균소득 80% 이하, 소득 70% 이내
+    # "중위소득"은 위에서 이미 처리하므로 제외(negative lookahead)
+    for m in re.finditer(
+        r"(?!.*중위\s*소득)"
+        r"(?:도시근로자\s*월평균\s*)?(?:평균\s*)?(?:기준\s*)?소득\s*(\d{1,3})\s*%\s*(이하|미만|이내|이상|초과)",
+        t,
+        re.IGNORECASE,
+    ):
+        p = to_int_safe(m.group(1))
+        if p is None:
+            continue
+        op_word = m.group(2)
+        mm = _op_to_maxmin(op_word)
+        if mm == "max":
+            _append_constraint("percent_max", p, "max", m.group(0))
+        elif mm == "min":
+            _append_constraint("percent_min", p, "min", m.group(0))
+
+    # ---------------------------------------------------------------------
+    # 3) 금액 조건: 연소득/월소득
+    # ---------------------------------------------------------------------
+    # 예: 연소득 6,000만원 이하 / 월소득 300만원 미만 / 연 소득 50000000원 이하
+    for m in re.finditer(
+        r"(연\s*소득|월\s*소득)\s*([0-9][0-9,]*)\s*(만원|원)\s*(이하|미만|이내|이상|초과)",
+        t,
+        re.IGNORECASE,
+    ):
+        kind = (m.group(1) or "").replace(" ", "")  # '연소득' / '월소득'
+        amount_num = m.group(2)
+        unit = m.group(3)
+        op_word = m.group(4)
+
+        won = parse_money_to_won(f"{amount_num}{unit}")
+        if won is None:
+            continue
+
+        mm = _op_to_maxmin(op_word)
+        if "연" in kind:
+            if mm == "max":
+                _append_constraint("annual_max_won", won, "max", m.group(0))
+            elif mm == "min":
+                _append_constraint("annual_min_won", won, "min", m.group(0))
+        else:
+            if mm == "max":
+                _append_constraint("monthly_max_won", won, "max", m.group(0))
+            elif mm == "min":
+                _append_constraint("monthly_min_won", won, "min", m.group(0))
+
+    # ---------------------------------------------------------------------
+    # 4) 분위(소득분위/분위) - 단순
+    # ---------------------------------------------------------------------
+    for m in re.finditer(r"(\d{1,2})\s*분위", t, re.IGNORECASE):
+        v = to_int_safe(m.group(1))
+        if v is None:
+            continue
+        # 보통 1~10이 합리적. 범위를 벗어나면 note로만 남김.
+        if 1 <= v <= 10:
+            _append_constraint("decile", v, None, m.group(0))
+        else:
+            out["notes"].append(f"분위 값 범위가 비정상일 수 있음: {m.group(0)}")
+            out["evidence"].append(m.group(0))
+
+    # ---------------------------------------------------------------------
+    # 5) 애매/복잡한 패턴은 notes로만 남김(가구원수별 등)
+    # ---------------------------------------------------------------------
+    # 예: "1인 120%, 2인 110%..." 같은 경우: 숫자/%가 여러 개 붙는 패턴
+    if re.search(r"\d+인\s*\d{1,3}\s*%", t):
+        out["notes"].append("가구원수별 소득% 조건이 포함되어 있을 수 있음(추후 확장 필요)")
+
+    return out
+
+
+# -------------------------
+# parse_assets
+# -------------------------
+def parse_assets(text: str) -> Dict[str, Any]:
+    """
+    자산: '총자산/재산/순자산' 상한 중심.
+    """
+    t = norm_text(text)
+    out = result_template("assets")
+    if not t:
+        return out
+
+    # 예: 총자산 3억원 이하 / 재산 2억 이하 / 순자산 5천만원 미만
+    for m in re.finditer(
+        r"(총\s*자산|순\s*자산|재산)\s*([0-9][0-9, ]*(?:억|만|원|만원)?)\s*(이하|미만)",
+        t,
+        re.IGNORECASE,
+    ):
+        label = m.group(1).replace(" ", "")
+        money = m.group(2)
+        won = parse_money_to_won(money)
+        if won is None:
+            # "3억원" 같은 케이스: 숫자+억+원 혼합 방어
+            won = parse_money_to_won(money.replace("원", ""))
+        if won is None:
+            continue
+        out["constraints"].append({"type": "max_won", "value": won, "field": label})
+        out["evidence"].append(m.group(0))
+
+    return out
+
+
+# -------------------------
+# parse_car
+# -------------------------
+def parse_car(text: str) -> Dict[str, Any]:
+    """
+    차량: '차량가액/자동차가액' 상한, '차량 미보유' 등.
+    """
+    t = norm_text(text)
+    out = result_template("car")
+    if not t:
+        return out
+
+    # 미보유/무소유
+    for m in re.finditer(r"(차량|자동차)\s*(미보유|무소유)", t, re.IGNORECASE):
+        out["constraints"].append({"type": "must_not_own", "value": True})
+        out["evidence"].append(m.group(0))
+
+    # 차량가액 N 이하/미만
+    for m in re.finditer(
+        r"(차량\s*가액|자동차\s*가액|차량가액|자동차가액)\s*([0-9][0-9, ]*(?:억|만|원|만원)?)\s*(이하|미만)",
+        t,
+        re.IGNORECASE,
+    ):
+        money = m.group(2)
+        won = parse_money_to_won(money)
+        if won is None:
+            won = parse_money_to_won(money.replace("원", ""))
+        if won is None:
+            continue
+        out["constraints"].append({"type": "value_max_won", "value": won})
+        out["evidence"].append(m.group(0))
+
+    return out
@@ -6,15 +6,24 @@ build_clean_text.py
 - policies.csv(또는 DB dump)의 여러 필드를 합쳐 RAG/검색/임베딩용 clean_text 생성
 - __MISSING__ 같은 결측 표시값 제거
 - 과도하게 긴 raw_text는 일부만 포함(섹션별 예산 방식으로 제한)
+- build_text_bundle: 같은 섹션으로 임베딩 텍스트 / 카드 요약 / 섹션 청크(오프셋, 토큰 수)까지 1회에 생성
 """
 
 from __future__ import annotations
 
+import math
 import re
-from typing import Any, Dict, Iterable, List
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Tuple
+
+try:
+    import tiktoken  # type: ignore
+except ImportError:
+    tiktoken = None
 
 
 MISSING_VALUE = "__MISSING__"
+TOKEN_ENCODING = "cl100k_base"  # text-embedding-3-small 토크나이저 (tiktoken 없으면 근사치)
 
 
 # -------------------------
@@ -50,49 +59,59 @@ def _first_non_empty(row: Dict[str, Any], keys: Iterable[str]) -> str:
     return ""
 
 
+
+
 # -------------------------
-# main (budget version)
+# tokens (text-embedding-3-small 기준)
 # -------------------------
-def build_clean_text(
-    row: Dict[str, Any],
-    *,
-    max_chars: int = 6000,
-    include_raw_excerpt: bool = True,
-) -> str:
-    """
-    섹션별 예산(budget) 방식으로 clean_text 생성.
-    - 각 섹션마다 최대 글자 수를 배정해 중요한 섹션이 뒤에서 잘려 사라지지 않게 함.
-    - 최종 결과는 max_chars를 넘지 않게 보장.
+def _count_tokens_estimate(text: str) -> int:
+    """tiktoken이 없을 때 근사: ASCII 4글자 ≈ 1토큰, 한글 등 비ASCII 1글자 ≈ 1토큰"""
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return (len(text) - ascii_chars) + math.ceil(ascii_chars / 4)
 
-    포함 섹션:
-    - [메타] 정책명/대상/요약
-    - [지원대상] eligibility
-    - [지원내용] benefit
-    - [신청방법] apply_process
-    - [신청기간] apply_period
-    - [원문 일부] raw_text (옵션)
 
-    max_chars: 최종 clean_text 최대 길이
-    include_raw_excerpt: 원문 일부 포함 여부
-    """
+@lru_cache(maxsize=1)
+def _encoding():
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding(TOKEN_ENCODING)
+    except Exception:  # 인코딩 파일을 받을 수 없는 환경(오프라인 등)
+        return None
 
-    def clip(v: Any, n: int) -> str:
-        s = _clean_str(v)
-        if not s or n <= 0:
-            return ""
-        return s[:n].rstrip()
-
-    # 섹션별 글자 예산(필요하면 조정)
-    budgets = {
-        "meta": 500,
-        "eligibility": 1400,
-        "benefit": 1600,
-        "apply_process": 800,
-        "apply_period": 400,
-        "raw": 1200,  # include_raw_excerpt=True일 때만 사용
-    }
 
-    parts: List[str] = []
+def count_tokens(text: str) -> int:
+    enc = _encoding()
+    if enc is None:
+        return _count_tokens_estimate(text)
+    return len(enc.encode(text, disallowed_special=()))
+
+
+# -------------------------
+# sections (budget version)
+# -------------------------
+# 섹션별 글자 예산(필요하면 조정)
+BUDGETS = {
+    "meta": 500,
+    "eligibility": 1400,
+    "benefit": 1600,
+    "apply_process": 800,
+    "apply_period": 400,
+    "raw": 1200,  # include_raw_excerpt=True일 때만 사용
+}
+RAW_SECTION = "원문 일부"
+
+
+def _clip(v: Any, n: int) -> str:
+    s = _clean_str(v)
+    if not s or n <= 0:
+        return ""
+    return s[:n].rstrip()
+
+
+def _sections(row: Dict[str, Any], include_raw_excerpt: bool) -> List[Tuple[str, str]]:
+    """(섹션 제목, 본문) 목록. 값이 없는 섹션은 제외, 순서 고정"""
+    sections: List[Tuple[str, str]] = []
 
     # 1) 메타
     policy_name = _first_non_empty(row, ["policy_name", "정책명", "servNm"])
@@ -107,37 +126,125 @@ def build_clean_text(
     if summary:
         header_bits.append(f"요약: {summary}")
 
-    meta = clip("\n".join(header_bits).strip(), budgets["meta"])
+    meta = _clip("\n".join(header_bits).strip(), BUDGETS["meta"])
     if meta:
-        parts.append("[메타]\n" + meta)
+        sections.append(("메타", meta))
 
     # 2) 핵심 섹션들(각 섹션은 예산 안에서만 포함)
-    eligibility = clip(row.get("eligibility"), budgets["eligibility"])
-    if eligibility:
-        parts.append("[지원대상]\n" + eligibility)
-
-    benefit = clip(row.get("benefit"), budgets["benefit"])
-    if benefit:
-        parts.append("[지원내용]\n" + benefit)
-
-    apply_process = clip(row.get("apply_process"), budgets["apply_process"])
-    if apply_process:
-        parts.append("[신청방법]\n" + apply_process)
-
-    apply_period = clip(row.get("apply_period"), budgets["apply_period"])
-    if apply_period:
-        parts.append("[신청기간]\n" + apply_period)
+    for title, key in (
+        ("지원대상", "eligibility"),
+        ("지원내용", "benefit"),
+        ("신청방법", "apply_process"),
+        ("신청기간", "apply_period"),
+    ):
+        body = _clip(row.get(key), BUDGETS[key])
+        if body:
+            sections.append((title, body))
 
     # 3) 원문 일부(마지막, 예산 제한)
     if include_raw_excerpt:
-        raw = clip(row.get("raw_text"), budgets["raw"])
+        raw = _clip(row.get("raw_text"), BUDGETS["raw"])
         if raw:
-            parts.append("[원문 일부]\n" + raw)
+            sections.append((RAW_SECTION, raw))
+
+    return sections
+
 
+def _assemble(sections: List[Tuple[str, str]], max_chars: int) -> Tuple[str, List[Tuple[str, int, int]]]:
+    """섹션 join + 섹션별 (제목, start, end) 오프셋. max_chars로 잘리면 오프셋도 잘린 텍스트 기준"""
+    parts: List[str] = []
+    spans: List[Tuple[str, int, int]] = []
+    pos = 0
+    for title, body in sections:
+        part = f"[{title}]\n{body}"
+        if parts:
+            pos += 2  # "\n\n"
+        parts.append(part)
+        spans.append((title, pos, pos + len(part)))
+        pos += len(part)
+
+    # 모든 섹션이 "["로 시작하고 본문은 rstrip 되어 있으므로 strip은 앞쪽 오프셋을 바꾸지 않음
     text = "\n\n".join(parts).strip()
 
-    # 4) 최종 길이 제한(안전장치)
+    # 최종 길이 제한(안전장치)
     if max_chars and len(text) > max_chars:
         text = text[:max_chars].rstrip()
+        spans = [(title, start, min(end, len(text))) for title, start, end in spans if start < len(text)]
+    return text, spans
+
+
+def _card_snippet(row: Dict[str, Any], n: int) -> str:
+    """정책 카드용 한 줄 요약: 요약 → 지원내용 → 지원대상 순, n자 넘으면 단어 경계에서 자르고 '…'"""
+    s = _first_non_empty(row, ["support_summary", "summary", "요약", "servDgst", "benefit", "eligibility"])
+    s = re.sub(r"\s+", " ", s).strip()
+    if len(s) <= n:
+        return s
+    cut = s[:n]
+    space = cut.rfind(" ")
+    if space >= n // 2:
+        cut = cut[:space]
+    return cut.rstrip(" ,./·-") + "…"
 
+
+# -------------------------
+# main
+# -------------------------
+def build_clean_text(
+    row: Dict[str, Any],
+    *,
+    max_chars: int = 6000,
+    include_raw_excerpt: bool = True,
+) -> str:
+    """
+    섹션별 예산(budget) 방식으로 clean_text 생성.
+    - 각 섹션마다 최대 글자 수를 배정해 중요한 섹션이 뒤에서 잘려 사라지지 않게 함.
+    - 최종 결과는 max_chars를 넘지 않게 보장.
+
+    포함 섹션:
+    - [메타] 정책명/대상/요약
+    - [지원대상] eligibility
+    - [지원내용] benefit
+    - [신청방법] apply_process
+    - [신청기간] apply_period
+    - [원문 일부] raw_text (옵션)
+
+    max_chars: 최종 clean_text 최대 길이
+    include_raw_excerpt: 원문 일부 포함 여부
+    """
+    text, _spans = _assemble(_sections(row, include_raw_excerpt), max_chars)
     return text
+
+
+def build_text_bundle(
+    row: Dict[str, Any],
+    *,
+    max_chars: int = 6000,
+    include_raw_excerpt: bool = True,
+    snippet_chars: int = 120,
+) -> Dict[str, Any]:
+    """
+    섹션을 한 번만 만들어 cleaner 출력에 필요한 텍스트를 모두 생성.
+    - clean_text     : build_clean_text와 같은 문자열
+    - embedding_text : clean_text에서 [원문 일부] 제외 (구조화 섹션과 중복되는 원문 노이즈 제거,
+                       원문 말고 본문 섹션이 없으면 원문 포함)
+    - card_snippet   : 정책 카드용 한 줄 요약 (snippet_chars자 이내)
+    - chunks         : 섹션 단위 청크 [{section, start, end, tokens}] (start/end는 clean_text 오프셋)
+    """
+    sections = _sections(row, include_raw_excerpt)
+    text, spans = _assemble(sections, max_chars)
+
+    if any(title not in ("메타", RAW_SECTION) for title, _ in sections):
+        embedding_text, _ = _assemble([s for s in sections if s[0] != RAW_SECTION], max_chars)
+    else:
+        embedding_text = text
+
+    chunks = [
+        {"section": title, "start": start, "end": end, "tokens": count_tokens(text[start:end])}
+        for title, start, end in spans
+    ]
+    return {
+        "clean_text": text,
+        "embedding_text": embedding_text,
+        "card_snippet": _card_snippet(row, snippet_chars),
+        "chunks": chunks,
+    }
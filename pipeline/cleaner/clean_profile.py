@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+clean_profile.py
+
+run_clean 단계별 계측 (--profile)
+- 단계: read_csv / rules.<룰 이름> (context, cache 포함) / support_text / build_clean_text / write_output / dedup / save_state
+- 행 단위: 정제 시간 상위 N개 행 + 룰 입력 텍스트 길이
+- 워커(--workers)는 자기 CleanProfile을 dict로 돌려주고 부모가 merge → 행 단계 시간은 워커 합산(CPU 시간에 가까움)
+- summary 표 + JSON 리포트, baseline 리포트 대비 처리량(cleaned/s) 하락 검사
+  (rows/s는 재사용/캐시 hit 행까지 세므로 비교하지 않음, 실행 모드(full/stream/rule_cache/workers)가 다르면 비교 거부)
+"""
+
+from __future__ import annotations
+
+import heapq
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# 표 출력 순서 (없는 단계는 건너뜀, 목록에 없는 단계는 뒤에 이름순)
+STAGE_ORDER = ("read_csv", "rules", "support_text", "build_clean_text", "write_output", "dedup", "save_state")
+# baseline과 같아야 처리량을 비교할 수 있는 실행 모드
+MODE_KEYS = ("full", "stream", "rule_cache", "workers")
+
+
+class CleanProfile:
+    def __init__(self, top_n: int = 10) -> None:
+        self.top_n = top_n
+        self.seconds: Dict[str, float] = defaultdict(float)
+        self.calls: Counter = Counter()
+        # 엔진/캐시가 직접 누적하는 룰별 시간 (키: context/cache/age/income/…)
+        self.rules: Dict[str, float] = defaultdict(float)
+        self.rule_calls = 0
+        self._slowest: List[Tuple[float, str, int]] = []  # (seconds, policy_id, text_len) min-heap
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] += time.perf_counter() - t0
+            self.calls[name] += 1
+
+    def add_row(self, policy_id: Any, seconds: float, text_len: int) -> None:
+        item = (seconds, str(policy_id), int(text_len))
+        if len(self._slowest) < self.top_n:
+            heapq.heappush(self._slowest, item)
+        elif item > self._slowest[0]:
+            heapq.heapreplace(self._slowest, item)
+
+    # ---- 워커 → 부모 ----
+    def take(self) -> Dict[str, Any]:
+        """dict로 꺼낸 뒤 초기화 (청크마다 부모로 전달)"""
+        out = {
+            "seconds": dict(self.seconds),
+            "calls": dict(self.calls),
+            "rules": dict(self.rules),
+            "rule_calls": self.rule_calls,
+            "slowest": list(self._slowest),
+        }
+        self.seconds.clear()
+        self.calls.clear()
+        self.rules.clear()
+        self.rule_calls = 0
+        self._slowest = []
+        return out
+
+    def merge(self, part: Dict[str, Any]) -> None:
+        for k, v in part.get("seconds", {}).items():
+            self.seconds[k] += v
+        self.calls.update(part.get("calls", {}))
+        for k, v in part.get("rules", {}).items():
+            self.rules[k] += v
+        self.rule_calls += part.get("rule_calls", 0)
+        for seconds, policy_id, text_len in part.get("slowest", []):
+            self.add_row(policy_id, seconds, text_len)
+
+    # ---- 출력 ----
+    def stage_rows(self) -> List[Tuple[str, int, float]]:
+        """(단계, 호출 수, 초). rules는 룰별 하위 단계로 펼침"""
+        names = [n for n in STAGE_ORDER if n in self.seconds]
+        names += sorted(n for n in self.seconds if n not in STAGE_ORDER)
+        rows: List[Tuple[str, int, float]] = []
+        for n in names:
+            rows.append((n, int(self.calls[n]), self.seconds[n]))
+            if n == "rules":
+                for r, sec in self.rules.items():
+                    rows.append((f"  rules.{r}", self.rule_calls, sec))
+        return rows
+
+    def slowest(self) -> List[Dict[str, Any]]:
+        return [
+            {"policy_id": pid, "seconds": round(sec, 6), "text_len": n}
+            for sec, pid, n in sorted(self._slowest, reverse=True)
+        ]
+
+    def report(
+        self, *, rows: int, cleaned: int, wall_seconds: float, workers: int, full: bool, stream: bool, rule_cache: bool
+    ) -> Dict[str, Any]:
+        return {
+            "rows": rows,
+            "cleaned": cleaned,
+            "workers": workers,
+            "full": full,
+            "stream": stream,
+            "rule_cache": rule_cache,
+            "wall_seconds": round(wall_seconds, 6),
+            "rows_per_sec": round(rows / wall_seconds, 3) if wall_seconds > 0 else None,
+            "cleaned_per_sec": round(cleaned / wall_seconds, 3) if wall_seconds > 0 and cleaned else None,
+            "stages": [
+                {"stage": n.strip(), "calls": c, "seconds": round(s, 6)}
+                for n, c, s in self.stage_rows()
+            ],
+            "slowest_rows": self.slowest(),
+        }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    total = sum(s["seconds"] for s in report["stages"] if not s["stage"].startswith("rules."))
+    lines = [
+        f"{'stage':<28}{'calls':>8}{'total s':>12}{'ms/call':>10}{'share':>8}",
+        "-" * 66,
+    ]
+    for s in report["stages"]:
+        indent = "  " if s["stage"].startswith("rules.") else ""
+        per_call = s["seconds"] * 1000 / s["calls"] if s["calls"] else 0.0
+        share = s["seconds"] / total if total else 0.0
+        lines.append(
+            f"{indent + s['stage']:<28}{s['calls']:>8,}{s['seconds']:>12.3f}{per_call:>10.3f}{share:>8.1%}"
+        )
+    lines.append("-" * 66)
+    lines.append(
+        f"rows={report['rows']:,} cleaned={report['cleaned']:,} workers={report['workers']} "
+        f"full={report['full']} stream={report['stream']} rule_cache={report['rule_cache']} "
+        f"wall={report['wall_seconds']:.3f}s → {report['rows_per_sec'] or 0:,.1f} rows/s, "
+        f"{report['cleaned_per_sec'] or 0:,.1f} cleaned/s"
+    )
+    if report["slowest_rows"]:
+        lines.append("")
+        lines.append(f"slowest rows (top {len(report['slowest_rows'])}):")
+        for r in report["slowest_rows"]:
+            lines.append(f"  policy_id={r['policy_id']:<8} {r['seconds'] * 1000:>9.2f} ms  text_len={r['text_len']:,}")
+    return "\n".join(lines)
+
+
+def mode_mismatch(report: Dict[str, Any], baseline: Dict[str, Any]) -> Optional[str]:
+    """실행 모드가 baseline과 다르면 메시지 (모드가 없는 이전 리포트도 비교 불가)"""
+    diff = [f"{k}={baseline.get(k)!r}→{report.get(k)!r}" for k in MODE_KEYS if baseline.get(k) != report.get(k)]
+    if diff:
+        return f"run mode differs from baseline ({', '.join(diff)}); re-run with the same options or re-save the baseline"
+    return None
+
+
+def check_throughput(report: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> Optional[str]:
+    """
+    실제로 정제한 행 기준 처리량(cleaned/s)이 baseline 대비 threshold 넘게 떨어지거나
+    실행 모드가 다르면 메시지, 아니면 None (양쪽 중 정제한 행이 없으면 비교하지 않음)
+    """
+    msg = mode_mismatch(report, baseline)
+    if msg:
+        return msg
+    base = baseline.get("cleaned_per_sec")
+    cur = report.get("cleaned_per_sec")
+    if not base or cur is None:
+        return None
+    change = cur / base - 1.0
+    if change < -threshold:
+        return (
+            f"throughput {cur:,.1f} cleaned/s is {-change:.0%} below baseline {base:,.1f} cleaned/s "
+            f"(threshold {threshold:.0%})"
+        )
+    return None
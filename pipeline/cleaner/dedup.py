@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+"""
+dedup.py
+
+중복 정책 탐지 (MinHash + LSH)
+- 같은 정책이 서울주거포털/복지로 양쪽에서 들어오거나 이름만 바뀐 변형으로 들어오면
+  임베딩/인덱스/추천에 여러 번 나타남 → 대표 정책(canonical) 1개로 묶음
+- 1차 패스: clean_text 줄 단위 문서 빈도 → 많은 정책에 공통인 줄(포털 메뉴/푸터 등 boilerplate)은 비교에서 제외
+  (같은 포털에서 온 서로 다른 정책이 메뉴 텍스트만으로 중복 판정되지 않도록)
+- 2차 패스: 정규화(섹션 헤더/boilerplate 줄 제거, 공백 압축, 소문자) → 글자 k-shingle → MinHash 서명(num_perm개)
+- LSH banding: 서명을 bands개 구간으로 나눠 한 구간이라도 같으면 후보 (버킷마다 첫 멤버와만 연결 → 버킷 크기에 선형)
+- 후보 쌍은 서명 일치 비율(추정 Jaccard) >= threshold 일 때만 연결 → union-find로 연결 요소
+- 연결 요소 안에서 대표 기준 클러스터: 대표를 정하고 대표와의 추정 Jaccard >= threshold 인 정책만 묶음,
+  남은 정책끼리 같은 방식 반복 (A≈B, B≈C 라도 A와 C가 다르면 C는 A에 묶이지 않음)
+- 대표: clean_text가 가장 긴 정책 (정보가 가장 많음), 같으면 작은 policy_id
+
+출력
+- policy_dedup.csv  : policy_id, canonical_id, cluster_size, similarity (모든 정책, 단독이면 canonical_id = 자기 자신)
+- dedup_report.json : 2개 이상 묶인 클러스터 목록 (대표/멤버 이름, 추정 유사도) + 요약
+
+run_clean이 출력 저장 후 run_dedup()으로 실행 (출력을 청크 단위로 2번 읽음 → --stream에서도 서명/줄 빈도만 메모리에 유지)
+단독 실행: python pipeline/cleaner/dedup.py [--policies pipeline/cleaner/policies.csv] [--threshold 0.8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+import zlib
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+DEDUP_COLS = ["policy_id", "canonical_id", "cluster_size", "similarity"]
+
+SHINGLE_K = 5
+NUM_PERM = 128
+BANDS = 16  # rows/band = 8 → 후보가 될 확률이 50%인 유사도 ≈ (1/16)^(1/8) ≈ 0.71
+THRESHOLD = 0.8
+SEED = 20240611
+# 정책 수의 2% 이상(최소 10개)에 나오는 줄은 boilerplate로 보고 shingle에서 제외
+BOILERPLATE_RATIO = 0.02
+BOILERPLATE_MIN_DOCS = 10
+
+_PRIME = (1 << 31) - 1  # a·h + b 가 uint64 안에서 넘치지 않도록 31bit 소수
+_SHINGLE_BASE = np.uint64(1_000_003)
+_SECTION_HEADER = re.compile(r"^\[[^\]\n]{1,20}\]$", re.M)
+_WS = re.compile(r"\s+")
+
+
+# -------------------------
+# signature
+# -------------------------
+def _lines(text: str) -> Iterator[Tuple[int, str]]:
+    """(줄 해시, 정규화된 줄). 섹션 헤더([메타] 등, 모든 정책 공통)와 빈 줄은 제외"""
+    for line in _SECTION_HEADER.sub("", text or "").split("\n"):
+        line = _WS.sub(" ", line).strip().lower()
+        if line:
+            yield zlib.crc32(line.encode("utf-8")), line
+
+
+def normalize_for_shingles(text: str, boilerplate: frozenset = frozenset()) -> str:
+    """boilerplate 줄(해시)을 뺀 나머지 줄을 공백 1개로 이어 붙임"""
+    return " ".join(line for key, line in _lines(text) if key not in boilerplate)
+
+
+def shingle_hashes(text: str, k: int = SHINGLE_K) -> np.ndarray:
+    """글자 k-shingle 해시 (중복 제거, < _PRIME). 다항식 해시를 numpy로 한 번에 계산"""
+    codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    if len(codes) == 0:
+        return np.zeros(0, dtype=np.uint64)
+    if len(codes) < k:
+        k = len(codes)
+    n = len(codes) - k + 1
+    h = np.zeros(n, dtype=np.uint64)
+    for j in range(k):  # uint64 오버플로는 2^64 mod 연산과 같음 (결정적)
+        h = h * _SHINGLE_BASE + codes[j:j + n]
+    return np.unique(h % np.uint64(_PRIME))
+
+
+class MinHasher:
+    """h_i(x) = (a_i·x + b_i) mod p, 서명 = 각 i에 대한 shingle 해시 최솟값"""
+
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = SEED) -> None:
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self._a = rng.integers(1, _PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _PRIME, size=num_perm, dtype=np.uint64)
+
+    def signature(self, text: str, boilerplate: frozenset = frozenset()) -> np.ndarray:
+        h = shingle_hashes(normalize_for_shingles(text, boilerplate))
+        if len(h) == 0:
+            return np.full(self.num_perm, _PRIME, dtype=np.uint32)  # 빈 텍스트: 어떤 텍스트와도 후보가 되지 않음
+        sig = ((self._a[:, None] * h[None, :] + self._b[:, None]) % np.uint64(_PRIME)).min(axis=1)
+        return sig.astype(np.uint32)
+
+
+# -------------------------
+# LSH + cluster
+# -------------------------
+def lsh_candidates(signatures: np.ndarray, bands: int = BANDS) -> set:
+    """
+    (i, j) 후보 쌍 (i < j). 한 band의 서명 구간이 완전히 같은 행끼리.
+    버킷의 모든 쌍 대신 첫 멤버와의 k-1개만 (완전 복제본은 모든 band에서 같은 버킷 → O(k²) 방지),
+    나머지 연결은 threshold 확인 후 union-find가 이어 줌
+    """
+    n, num_perm = signatures.shape
+    if num_perm % bands:
+        raise ValueError(f"num_perm({num_perm}) must be divisible by bands({bands})")
+    rows = num_perm // bands
+    empty = (signatures == _PRIME).all(axis=1)
+    pairs: set = set()
+    for b in range(bands):
+        buckets: Dict[bytes, List[int]] = defaultdict(list)
+        band = np.ascontiguousarray(signatures[:, b * rows:(b + 1) * rows])
+        for i in range(n):
+            if not empty[i]:
+                buckets[band[i].tobytes()].append(i)
+        for members in buckets.values():
+            first = members[0]
+            for m in members[1:]:
+                pairs.add((first, m))
+    return pairs
+
+
+def estimated_jaccard(a: np.ndarray, b: np.ndarray) -> float:
+    return float(np.count_nonzero(a == b)) / len(a)
+
+
+def _find(parent: List[int], i: int) -> int:
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+class Deduper:
+    """count_lines()로 전체 줄 빈도 → add()로 청크 단위 서명 → finish()에서 LSH → 클러스터"""
+
+    def __init__(
+        self,
+        *,
+        num_perm: int = NUM_PERM,
+        bands: int = BANDS,
+        threshold: float = THRESHOLD,
+        seed: int = SEED,
+    ) -> None:
+        self.hasher = MinHasher(num_perm, seed)
+        self.bands = bands
+        self.threshold = threshold
+        self._ids: List[int] = []
+        self._names: List[str] = []
+        self._lengths: List[int] = []
+        self._sigs: List[np.ndarray] = []
+        self._line_df: Counter = Counter()
+        self._docs_counted = 0
+        self._boilerplate: Optional[frozenset] = None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def count_lines(self, texts: Iterable[Any]) -> None:
+        """1차 패스: 줄 문서 빈도 (add() 전에 전체 텍스트에 대해 호출)"""
+        for text in texts:
+            self._line_df.update({key for key, _ in _lines(text if isinstance(text, str) else "")})
+            self._docs_counted += 1
+
+    @property
+    def boilerplate(self) -> frozenset:
+        if self._boilerplate is None:
+            min_docs = max(BOILERPLATE_MIN_DOCS, int(self._docs_counted * BOILERPLATE_RATIO))
+            self._boilerplate = frozenset(k for k, c in self._line_df.items() if c >= min_docs)
+            self._line_df = Counter()  # 더 이상 필요 없음
+        return self._boilerplate
+
+    def add(self, policy_ids: Iterable[Any], names: Iterable[Any], texts: Iterable[Any]) -> None:
+        for pid, name, text in zip(policy_ids, names, texts):
+            text = text if isinstance(text, str) else ""
+            self._ids.append(int(pid))
+            self._names.append("" if name is None or (not isinstance(name, str) and pd.isna(name)) else str(name))
+            self._lengths.append(len(text))
+            self._sigs.append(self.hasher.signature(text, self.boilerplate))
+
+    def _split_by_head(self, members: List[int], sigs: np.ndarray) -> List[List[int]]:
+        """
+        연결 요소 → 클러스터 목록 (각 클러스터의 첫 원소가 대표).
+        union-find 연결은 전이적이라 대표와 직접 비슷하지 않은 정책까지 이어질 수 있으므로,
+        대표와의 추정 Jaccard >= threshold 인 정책만 묶고 나머지로 다시 반복
+        """
+        remaining = sorted(members, key=lambda i: (-self._lengths[i], self._ids[i]))
+        out: List[List[int]] = []
+        while remaining:
+            head, rest = remaining[0], remaining[1:]
+            cluster = [head]
+            remaining = []
+            for i in rest:
+                (cluster if estimated_jaccard(sigs[i], sigs[head]) >= self.threshold else remaining).append(i)
+            out.append(cluster)
+        return out
+
+    def finish(self) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """(policy_dedup 표, 리포트 dict)"""
+        t0 = time.perf_counter()
+        n = len(self._ids)
+        sigs = np.vstack(self._sigs) if self._sigs else np.zeros((0, self.hasher.num_perm), dtype=np.uint32)
+
+        candidates = lsh_candidates(sigs, self.bands) if n else set()
+        parent = list(range(n))
+        matched = 0
+        for i, j in candidates:
+            if estimated_jaccard(sigs[i], sigs[j]) >= self.threshold:
+                matched += 1
+                ri, rj = _find(parent, i), _find(parent, j)
+                if ri != rj:
+                    parent[rj] = ri
+
+        components: Dict[int, List[int]] = defaultdict(list)
+        for i in range(n):
+            components[_find(parent, i)].append(i)
+
+        canonical = list(range(n))
+        similarity = [1.0] * n
+        groups: List[List[int]] = []
+        for members in components.values():
+            groups.extend(self._split_by_head(members, sigs))
+
+        clusters: List[Dict[str, Any]] = []
+        for members in groups:
+            if len(members) == 1:
+                continue
+            head = members[0]
+            for i in members:
+                canonical[i] = head
+                similarity[i] = 1.0 if i == head else round(estimated_jaccard(sigs[i], sigs[head]), 4)
+            others = sorted((i for i in members if i != head), key=lambda i: self._ids[i])
+            clusters.append(
+                {
+                    "canonical": {"policy_id": self._ids[head], "policy_name": self._names[head]},
+                    "duplicates": [
+                        {"policy_id": self._ids[i], "policy_name": self._names[i], "similarity": similarity[i]}
+                        for i in others
+                    ],
+                }
+            )
+        clusters.sort(key=lambda c: (-len(c["duplicates"]), c["canonical"]["policy_id"]))
+
+        sizes = [1] * n
+        for members in groups:
+            for i in members:
+                sizes[i] = len(members)
+        df = pd.DataFrame(
+            {
+                "policy_id": self._ids,
+                "canonical_id": [self._ids[c] for c in canonical],
+                "cluster_size": sizes,
+                "similarity": similarity,
+            },
+            columns=DEDUP_COLS,
+        ).sort_values("policy_id", ignore_index=True)
+
+        merged = sum(len(c["duplicates"]) for c in clusters)
+        report = {
+            "policies": n,
+            "canonical": n - merged,
+            "merged": merged,
+            "clusters": len(clusters),
+            "candidate_pairs": len(candidates),
+            "matched_pairs": matched,
+            "boilerplate_lines": len(self.boilerplate),
+            "params": {
+                "shingle_k": SHINGLE_K,
+                "num_perm": self.hasher.num_perm,
+                "bands": self.bands,
+                "threshold": self.threshold,
+            },
+            "seconds": round(time.perf_counter() - t0, 6),
+            "merged_clusters": clusters,
+        }
+        return df, report
+
+
+# -------------------------
+# save / read
+# -------------------------
+def save_dedup(out_dir: str, df: pd.DataFrame, report: Dict[str, Any]) -> Tuple[str, str]:
+    """임시 파일에 쓰고 os.replace (읽는 쪽이 중간 상태 파일을 보지 않음)"""
+    map_out = os.path.join(out_dir, "policy_dedup.csv")
+    report_out = os.path.join(out_dir, "dedup_report.json")
+    df.to_csv(map_out + ".tmp", index=False, encoding="utf-8-sig")
+    with open(report_out + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    os.replace(map_out + ".tmp", map_out)
+    os.replace(report_out + ".tmp", report_out)
+    return map_out, report_out
+
+
+def format_summary(report: Dict[str, Any], top: int = 10) -> str:
+    lines = [
+        f"dedup: policies={report['policies']:,} → canonical={report['canonical']:,} "
+        f"(merged {report['merged']:,} in {report['clusters']:,} clusters, "
+        f"candidates={report['candidate_pairs']:,}, matched={report['matched_pairs']:,})"
+    ]
+    for c in report["merged_clusters"][:top]:
+        dups = ", ".join(f"{d['policy_id']}({d['similarity']:.2f})" for d in c["duplicates"])
+        lines.append(f"  {c['canonical']['policy_id']} {c['canonical']['policy_name'][:40]} ← {dups}")
+    return "\n".join(lines)
+
+
+def run_dedup(
+    policies_path: str,
+    *,
+    threshold: float = THRESHOLD,
+    num_perm: int = NUM_PERM,
+    bands: int = BANDS,
+    chunksize: int = 5000,
+) -> Tuple[Dict[str, Any], Tuple[str, str]]:
+    """저장된 policies 출력(CSV 또는 같은 이름의 Parquet)을 청크 단위로 2번 읽어 중복 클러스터 → (리포트, 저장 경로)"""
+    from pipeline.cleaner.outputs import iter_output
+
+    deduper = Deduper(num_perm=num_perm, bands=bands, threshold=threshold)
+    for part in iter_output(policies_path, ["clean_text"], chunksize):
+        deduper.count_lines(part["clean_text"])
+    for part in iter_output(policies_path, ["policy_id", "policy_name", "clean_text"], chunksize):
+        deduper.add(part["policy_id"], part["policy_name"], part["clean_text"])
+    table, report = deduper.finish()
+    return report, save_dedup(os.path.dirname(os.path.abspath(policies_path)), table, report)
+
+
+# -------------------------
+# CLI (이미 저장된 policies 출력으로 다시 계산)
+# -------------------------
+def parse_args() -> argparse.Namespace:
+    here = os.path.dirname(os.path.abspath(__file__))
+    ap = argparse.ArgumentParser(description="cleaner policies 출력 → MinHash/LSH 중복 정책 클러스터")
+    ap.add_argument("--policies", default=os.path.join(here, "policies.csv"))
+    ap.add_argument("--threshold", type=float, default=THRESHOLD, help="중복 판정 추정 Jaccard 하한")
+    ap.add_argument("--num-perm", type=int, default=NUM_PERM)
+    ap.add_argument("--bands", type=int, default=BANDS)
+    ap.add_argument("--read-chunksize", type=int, default=5000)
+    return ap.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    root = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+    if root not in sys.path:
+        sys.path.insert(0, root)
+
+    report, paths = run_dedup(
+        args.policies,
+        threshold=args.threshold,
+        num_perm=args.num_perm,
+        bands=args.bands,
+        chunksize=args.read_chunksize,
+    )
+    print(format_summary(report))
+    for path in paths:
+        print(f"[INFO] Saved → {path}")
+
+
+if __name__ == "__main__":
+    main()
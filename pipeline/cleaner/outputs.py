@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+"""
+outputs.py
+
+cleaner 출력 writer
+- 청크 단위로 append → 입력 크기와 무관하게 메모리 일정 (--stream)
+- CSV(utf-8-sig) + 선택: Parquet (pyarrow 설치 시)
+    - region: dictionary 인코딩 (값 종류가 적음)
+    - 긴 텍스트 컬럼(support_detail/clean_text 등): zstd 압축
+- policy_chunks: 섹션 청크 오프셋/토큰 수 (정책 1건 = 여러 행)
+- 임시 파일에 쓰고 commit()에서 os.replace → 읽는 쪽이 중간 상태 파일을 보지 않음
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import pandas as pd
+
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError:
+    pa = None
+    pq = None
+
+
+POLICIES_COLS = [
+    "policy_id",
+    "policy_name",
+    "support_summary",
+    "support_detail",
+    "region",
+    "clean_text",
+    "embedding_text",
+    "card_snippet",
+    "updated_at",
+]
+ELIG_COLS = [
+    "policy_id",
+    "min_age",
+    "max_age",
+    "income_rule_type",
+    "income_threshold",
+    "asset_threshold",
+    "is_homeowner_required",
+    "vehicle_value_limit",
+]
+ELIG_NUMERIC_COLS = ["min_age", "max_age", "income_threshold", "asset_threshold", "vehicle_value_limit"]
+TEXT_COLS = ["policy_name", "support_summary", "support_detail", "clean_text", "embedding_text", "card_snippet"]
+# 섹션 청크: 텍스트는 저장하지 않고 clean_text 오프셋만 (clean_text[start:end])
+CHUNK_COLS = ["policy_id", "chunk_no", "section", "start", "end", "tokens"]
+
+FORMATS = ("csv", "parquet")
+
+
+def parquet_available() -> bool:
+    return pq is not None
+
+
+def _policies_schema():
+    return pa.schema(
+        [
+            ("policy_id", pa.int64()),
+            ("policy_name", pa.string()),
+            ("support_summary", pa.string()),
+            ("support_detail", pa.string()),
+            ("region", pa.dictionary(pa.int32(), pa.string())),
+            ("clean_text", pa.string()),
+            ("embedding_text", pa.string()),
+            ("card_snippet", pa.string()),
+            ("updated_at", pa.string()),
+        ]
+    )
+
+
+def _elig_schema():
+    return pa.schema(
+        [
+            ("policy_id", pa.int64()),
+            *[(c, pa.float64()) for c in ("min_age", "max_age")],
+            ("income_rule_type", pa.dictionary(pa.int8(), pa.string())),
+            *[(c, pa.float64()) for c in ("income_threshold", "asset_threshold")],
+            ("is_homeowner_required", pa.bool_()),
+            ("vehicle_value_limit", pa.float64()),
+        ]
+    )
+
+
+def _chunks_schema():
+    return pa.schema(
+        [
+            ("policy_id", pa.int64()),
+            ("chunk_no", pa.int32()),
+            ("section", pa.dictionary(pa.int8(), pa.string())),
+            *[(c, pa.int32()) for c in ("start", "end", "tokens")],
+        ]
+    )
+
+
+def normalize_policies(df: pd.DataFrame) -> pd.DataFrame:
+    df = df[POLICIES_COLS].copy()
+    df["policy_id"] = df["policy_id"].astype("int64")
+    return df
+
+
+def normalize_elig(df: pd.DataFrame) -> pd.DataFrame:
+    """청크마다 dtype이 달라지지 않게 고정 (결측이 없는 청크도 19.0 형식으로 기록)"""
+    df = df[ELIG_COLS].copy()
+    df["policy_id"] = df["policy_id"].astype("int64")
+    for c in ELIG_NUMERIC_COLS:
+        df[c] = pd.to_numeric(df[c], errors="coerce").astype("float64")
+    df["is_homeowner_required"] = df["is_homeowner_required"].astype(bool)
+    return df
+
+
+def normalize_chunks(df: pd.DataFrame) -> pd.DataFrame:
+    df = df[CHUNK_COLS].copy()
+    for c in ("policy_id", "chunk_no", "start", "end", "tokens"):
+        df[c] = df[c].astype("int64")
+    return df
+
+
+class TableWriter:
+    """같은 테이블을 CSV/Parquet로 동시에 청크 append"""
+
+    def __init__(
+        self,
+        csv_path: str,
+        formats: Sequence[str],
+        columns: Sequence[str],
+        schema_fn,
+        text_cols: Sequence[str] = (),
+    ) -> None:
+        self.csv_path = csv_path
+        self.columns = list(columns)
+        self.parquet_path = os.path.splitext(csv_path)[0] + ".parquet"
+        self.formats = tuple(formats)
+        self._schema_fn = schema_fn
+        self._text_cols = list(text_cols)
+        self._csv_header = True
+        self._pq_writer = None
+        self.rows = 0
+
+    @property
+    def paths(self) -> List[str]:
+        out = []
+        if "csv" in self.formats:
+            out.append(self.csv_path)
+        if "parquet" in self.formats:
+            out.append(self.parquet_path)
+        return out
+
+    def write(self, df: pd.DataFrame) -> None:
+        if df.empty:
+            return
+        if "csv" in self.formats:
+            df.to_csv(
+                self.csv_path + ".tmp",
+                index=False,
+                encoding="utf-8-sig" if self._csv_header else "utf-8",
+                mode="w" if self._csv_header else "a",
+                header=self._csv_header,
+            )
+            self._csv_header = False
+        if "parquet" in self.formats:
+            schema = self._schema_fn()
+            table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+            if self._pq_writer is None:
+                compression: Dict[str, str] = {name: "snappy" for name in schema.names}
+                compression.update({c: "zstd" for c in self._text_cols})
+                self._pq_writer = pq.ParquetWriter(
+                    self.parquet_path + ".tmp",
+                    schema,
+                    compression=compression,
+                    use_dictionary=[f.name for f in schema if pa.types.is_dictionary(f.type)],
+                )
+            self._pq_writer.write_table(table)
+        self.rows += len(df)
+
+    def commit(self) -> None:
+        if self._pq_writer is not None:
+            self._pq_writer.close()
+            self._pq_writer = None
+        if "csv" in self.formats and self._csv_header:
+            # 행이 0개여도 헤더는 남김
+            pd.DataFrame(columns=self.columns).to_csv(self.csv_path + ".tmp", index=False, encoding="utf-8-sig")
+        for path in self.paths:
+            if os.path.exists(path + ".tmp"):
+                os.replace(path + ".tmp", path)
+        # 이번에 쓰지 않은 형식의 이전 파일은 지움 (읽는 쪽이 오래된 Parquet를 읽지 않도록)
+        if "parquet" not in self.formats and os.path.exists(self.parquet_path):
+            os.remove(self.parquet_path)
+
+    def abort(self) -> None:
+        if self._pq_writer is not None:
+            self._pq_writer.close()
+            self._pq_writer = None
+        for path in self.paths:
+            if os.path.exists(path + ".tmp"):
+                os.remove(path + ".tmp")
+
+
+def open_writers(out_dir: str, formats: Sequence[str]) -> Dict[str, TableWriter]:
+    unknown = set(formats) - set(FORMATS)
+    if unknown:
+        raise ValueError(f"unknown output format(s): {sorted(unknown)} (allowed: {list(FORMATS)})")
+    return {
+        "policies": TableWriter(os.path.join(out_dir, "policies.csv"), formats, POLICIES_COLS, _policies_schema, TEXT_COLS),
+        "eligibility": TableWriter(os.path.join(out_dir, "policy_eligibility.csv"), formats, ELIG_COLS, _elig_schema),
+        "chunks": TableWriter(os.path.join(out_dir, "policy_chunks.csv"), formats, CHUNK_COLS, _chunks_schema),
+    }
+
+
+def iter_output(path: str, columns: Sequence[str], chunksize: int) -> Iterator[pd.DataFrame]:
+    """read_output의 청크 버전 (출력 전체를 메모리에 올리지 않음)"""
+    parquet_path = os.path.splitext(path)[0] + ".parquet"
+    if pq is not None and os.path.exists(parquet_path):
+        for batch in pq.ParquetFile(parquet_path).iter_batches(batch_size=chunksize, columns=list(columns)):
+            yield batch.to_pandas()
+        return
+    with pd.read_csv(path, encoding="utf-8-sig", usecols=list(columns), chunksize=chunksize) as reader:
+        yield from reader
+
+
+def read_output(path: str, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """cleaner 출력 읽기: 같은 이름의 .parquet가 있고 pyarrow가 있으면 Parquet, 아니면 CSV (둘 다 필요한 컬럼만)"""
+    parquet_path = os.path.splitext(path)[0] + ".parquet"
+    if pq is not None and os.path.exists(parquet_path):
+        df = pq.read_table(parquet_path, columns=list(columns) if columns else None).to_pandas()
+        for c in df.columns:
+            if isinstance(df[c].dtype, pd.CategoricalDtype):
+                df[c] = df[c].astype(object)
+        return df
+    return pd.read_csv(path, encoding="utf-8-sig", usecols=list(columns) if columns else None)
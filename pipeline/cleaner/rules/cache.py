@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+cache.py
+
+룰 결과 디스크 캐시 (SQLite, WAL)
+- 키: (룰 이름, 룰 버전, 정규화 전 텍스트 sha256)
+- 룰 버전: 룰 모듈 소스 + 공용 모듈(utils/scan/context/engine) 소스의 해시 → 정규식 하나만 바꿔도 해당 룰 항목만 무효화
+- 같은 지원대상 문구(여러 정책 공통 boilerplate)나 변경 없는 정책은 다시 파싱하지 않음
+- process pool 워커마다 자기 커넥션을 열어 같은 파일을 공유
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, MutableMapping, Optional
+
+from . import context as _context
+from . import engine as _engine
+from . import scan as _scan
+from . import utils as _utils
+from .engine import RULES, parse_all
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rule_cache (
+    rule TEXT NOT NULL,
+    version TEXT NOT NULL,
+    text_hash TEXT NOT NULL,
+    result TEXT NOT NULL,
+    PRIMARY KEY (text_hash, rule, version)
+)
+"""
+
+
+def rule_versions() -> Dict[str, str]:
+    """룰별 버전 = sha256(룰 모듈 소스 + utils/scan/context/engine 소스)[:16]"""
+    shared = "".join(inspect.getsource(m) for m in (_utils, _scan, _context, _engine))
+    out: Dict[str, str] = {}
+    for name, (module, _fn) in RULES.items():
+        src = inspect.getsource(module) + shared
+        out[name] = hashlib.sha256(src.encode("utf-8")).hexdigest()[:16]
+    return out
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+class RuleCache:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.versions = rule_versions()
+        self.hits: Counter = Counter()
+        self.misses: Counter = Counter()
+        self._conn_obj: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    def _conn(self) -> sqlite3.Connection:
+        # fork된 워커는 부모 커넥션을 쓰지 않고 새로 연결
+        if self._conn_obj is None or self._pid != os.getpid():
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SCHEMA)
+            self._conn_obj = conn
+            self._pid = os.getpid()
+        return self._conn_obj
+
+    def get_many(self, key: str, rules: Iterable[str]) -> Dict[str, Any]:
+        rows = self._conn().execute(
+            "SELECT rule, version, result FROM rule_cache WHERE text_hash = ?", (key,)
+        ).fetchall()
+        current = {rule: result for rule, version, result in rows if self.versions.get(rule) == version}
+        found: Dict[str, Any] = {}
+        for r in rules:
+            if r in current:
+                found[r] = json.loads(current[r])
+                self.hits[r] += 1
+            else:
+                self.misses[r] += 1
+        return found
+
+    def put_many(self, key: str, results: Dict[str, Any]) -> None:
+        self._conn().executemany(
+            "INSERT OR REPLACE INTO rule_cache (rule, version, text_hash, result) VALUES (?, ?, ?, ?)",
+            [(r, self.versions[r], key, json.dumps(v, ensure_ascii=False)) for r, v in results.items()],
+        )
+
+    def prune_stale(self) -> int:
+        """현재 버전이 아닌 룰 항목 삭제 (룰 수정 후 남은 이전 결과)"""
+        conn = self._conn()
+        removed = 0
+        for r, v in self.versions.items():
+            removed += conn.execute("DELETE FROM rule_cache WHERE rule = ? AND version != ?", (r, v)).rowcount
+        return removed
+
+    def take_stats(self) -> Dict[str, list]:
+        """{rule: [hits, misses]} 반환 후 카운터 초기화 (워커 → 부모 합산용)"""
+        stats = {r: [self.hits[r], self.misses[r]] for r in RULES}
+        self.hits.clear()
+        self.misses.clear()
+        return stats
+
+
+def cached_parse_all(
+    cache: RuleCache,
+    timings: Optional[MutableMapping[str, float]] = None,
+) -> Callable[[str], Dict[str, Dict[str, Any]]]:
+    """parse_all과 같은 결과. 캐시에 없는 룰만 계산해서 저장 (timings: 조회/저장 시간은 'cache'로 누적)"""
+
+    def parse(text: str) -> Dict[str, Dict[str, Any]]:
+        t0 = time.perf_counter()
+        key = text_hash(text)
+        found = cache.get_many(key, RULES)
+        missing = [r for r in RULES if r not in found]
+        t_cache = time.perf_counter() - t0
+        if missing:
+            computed = parse_all(text, rules=missing, timings=timings)
+            t0 = time.perf_counter()
+            cache.put_many(key, computed)
+            t_cache += time.perf_counter() - t0
+            found.update(computed)
+        if timings is not None:
+            timings["cache"] = timings.get("cache", 0.0) + t_cache
+        return found
+
+    return parse
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+context.py
+
+룰 입력 컨텍스트: 텍스트 1건을 한 번만 정규화하고 룰들이 공유하는 분석 결과를 캐시
+- text              : norm_text 결과 (모든 룰이 같은 문자열을 봄)
+- finditer/search   : 패턴 스캔 (RuleContext = 키워드 window, FullContext = 전체 스캔 기준 구현)
+- keyword_positions : prefilter 키워드 → 등장 위치 (RuleContext, window 계산과 같은 1회 스캔)
+- line_starts       : 줄 시작 오프셋 (RuleContext, not_before 줄 단위 판정에 사용)
+- money(s)          : 금액 문자열 → 원 (숫자/단위 토큰 1회 분해, 같은 문자열은 다시 계산하지 않음)
+
+룰 추가: 모듈에 PATTERNS / PREFILTER_KEYWORDS 정의 + engine.RULES 등록
+→ 정규화/키워드 스캔은 텍스트당 1회 그대로
+"""
+
+from __future__ import annotations
+
+from typing import Dict, FrozenSet, Optional, Pattern, Protocol, Sequence
+
+from .scan import FullScanner, Scanner, WindowScanner
+from .utils import norm_text, parse_money_to_won
+
+
+class Context(Scanner, Protocol):
+    raw: str
+
+    def money(self, s: str) -> Optional[int]: ...
+
+
+class _MoneyCache:
+    _money: Dict[str, Optional[int]]
+
+    def money(self, s: str) -> Optional[int]:
+        """parse_money_to_won(s)와 같은 값 (텍스트 안에서 같은 금액 문구는 1회만 파싱)"""
+        try:
+            return self._money[s]
+        except KeyError:
+            won = self._money[s] = parse_money_to_won(s)
+            return won
+
+
+class RuleContext(_MoneyCache, WindowScanner):
+    """engine.context_for()로 생성 (키워드/허용 문자 집합은 등록된 룰 전체 기준)"""
+
+    def __init__(
+        self,
+        raw: str,
+        keyword_re: Pattern[str],
+        keywords: Sequence[str],
+        allowed: FrozenSet[str],
+    ) -> None:
+        self.raw = raw
+        self._money = {}
+        super().__init__(norm_text(raw), keyword_re, keywords, allowed)
+
+
+class FullContext(_MoneyCache, FullScanner):
+    """룰 단독 호출(parse_age(text) 등)용: 전체 스캔 (기존 동작 그대로, 차분 검증 기준)"""
+
+    def __init__(self, raw: str) -> None:
+        self.raw = raw
+        self._money = {}
+        super().__init__(norm_text(raw))
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+engine.py
+
+룰 엔진: 텍스트 1건에 대해 parse_age / parse_income / parse_assets / parse_car를 한 번에 실행
+- 텍스트 1건 → RuleContext 1개 (정규화 1회 + 키워드 스캔 1회 + 금액 파싱 캐시), 모든 룰이 공유
+- 모든 룰 키워드를 하나의 정규식으로 1회 스캔 → 매칭이 가능한 window만 각 룰 패턴으로 검사
+- 룰 추가: 모듈(PATTERNS / PREFILTER_KEYWORDS / parse_x(text, ctx=None))을 RULES에 등록하면 끝
+- 결과는 각 parse_*(text)와 동일 (pipeline/benchmarks/diff_rule_engine.py로 검증)
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from typing import Any, Dict, FrozenSet, MutableMapping, Optional, Sequence
+
+from . import parse_age as _age
+from . import parse_assets as _assets
+from . import parse_car as _car
+from . import parse_income as _income
+from .context import RuleContext
+
+# 룰 이름 → (모듈, parse 함수). 출력 dict 키 순서도 이 순서
+RULES = {
+    "age": (_age, _age.parse_age),
+    "income": (_income, _income.parse_income),
+    "assets": (_assets, _assets.parse_assets),
+    "car": (_car, _car.parse_car),
+}
+RULE_MODULES = tuple(module for module, _fn in RULES.values())
+
+# prefilter 키워드: 등록된 룰들의 PREFILTER_KEYWORDS 합집합 (순서 유지)
+PREFILTER_KEYWORDS = tuple(dict.fromkeys(k for module in RULE_MODULES for k in module.PREFILTER_KEYWORDS))
+KEYWORD_RE = re.compile("|".join(re.escape(k) for k in sorted(PREFILTER_KEYWORDS, key=len, reverse=True)))
+
+
+def _allowed_chars() -> FrozenSet[str]:
+    """
+    룰 패턴 매칭에 들어갈 수 있는 문자 집합(숫자/공백은 RuleContext(WindowScanner)에서 따로 판정)
+    - 패턴 소스의 비-ASCII 문자(한글 리터럴, –, —)는 전부 포함 → 과포함은 window가 길어질 뿐 결과는 동일
+    - ASCII 리터럴은 , % ~ - 뿐
+    """
+    chars = set(",%~-")
+    for mod in RULE_MODULES:
+        for pat in mod.PATTERNS:
+            chars.update(c for c in pat.pattern if ord(c) > 127)
+    for k in PREFILTER_KEYWORDS:
+        chars.update(k)
+    return frozenset(chars)
+
+
+ALLOWED_CHARS = _allowed_chars()
+
+
+def context_for(text: str) -> RuleContext:
+    """정규화 + 키워드 window 계산 (룰 여러 개가 공유)"""
+    return RuleContext(text, KEYWORD_RE, PREFILTER_KEYWORDS, ALLOWED_CHARS)
+
+
+def parse_all(
+    text: str,
+    rules: Optional[Sequence[str]] = None,
+    ctx: Optional[RuleContext] = None,
+    timings: Optional[MutableMapping[str, float]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    {"age": parse_age(text), "income": ..., "assets": ..., "car": ...} (rules로 일부만 실행 가능)
+    timings: 주면 context 생성/룰별 소요 시간(초)을 누적 (run_clean --profile)
+    """
+    names = RULES if rules is None else [r for r in RULES if r in rules]
+    if timings is None:
+        ctx = ctx or context_for(text)
+        return {name: RULES[name][1](text, ctx=ctx) for name in names}
+
+    t0 = time.perf_counter()
+    ctx = ctx or context_for(text)
+    timings["context"] = timings.get("context", 0.0) + time.perf_counter() - t0
+    out: Dict[str, Dict[str, Any]] = {}
+    for name in names:
+        t0 = time.perf_counter()
+        out[name] = RULES[name][1](text, ctx=ctx)
+        timings[name] = timings.get(name, 0.0) + time.perf_counter() - t0
+    return out
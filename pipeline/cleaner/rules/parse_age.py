@@ -2,12 +2,28 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from .utils import norm_text, to_int_safe, result_template
+from .context import Context, FullContext
+from .utils import to_int_safe, result_template
 
+# 패턴들 (모듈 로드 시 1회 컴파일)
+# 만 19세 이상 / 19세 이상
+AGE_MIN = re.compile(r"(만\s*)?(\d{1,2})\s*세\s*이상", re.IGNORECASE)
+# 만 34세 이하 / 34세 이하
+AGE_MAX = re.compile(r"(만\s*)?(\d{1,2})\s*세\s*이하", re.IGNORECASE)
+# 만 19세 ~ 34세 / 19세~34세 / 19-34세
+AGE_RANGE = re.compile(r"(만\s*)?(\d{1,2})\s*세?\s*(?:~|-|–|—)\s*(만\s*)?(\d{1,2})\s*세", re.IGNORECASE)
+# 65세 (이상/이하 없이 단독은 exact로 두되 note)
+AGE_EXACT = re.compile(r"(만\s*)?(\d{1,2})\s*세\b", re.IGNORECASE)
 
-def parse_age(text: str) -> Dict[str, Any]:
+PATTERNS = [AGE_MIN, AGE_MAX, AGE_RANGE, AGE_EXACT]
+KEYWORDS = ("세",)
+# engine prefilter에 쓰는 이 룰의 키워드 전체
+PREFILTER_KEYWORDS = KEYWORDS
+
+
+def parse_age(text: str, ctx: Optional[Context] = None) -> Dict[str, Any]:
     """
     반환 포맷:
     {
@@ -21,28 +37,19 @@ def parse_age(text: str) -> Dict[str, Any]:
       "notes": [...],
       "evidence": [...]
     }
+
+    ctx: 여러 룰이 공유하는 RuleContext (ctx.text = 정규화된 텍스트, text는 무시)
     """
-    t = norm_text(text)
+    ctx = ctx or FullContext(text)
+    t = ctx.text
     out = result_template("age")
     if not t:
         return out
 
-    # 패턴들
-    patterns = [
-        # 만 19세 이상 / 19세 이상
-        (r"(만\s*)?(\d{1,2})\s*세\s*이상", "min"),
-        # 만 34세 이하 / 34세 이하
-        (r"(만\s*)?(\d{1,2})\s*세\s*이하", "max"),
-        # 만 19세 ~ 34세 / 19세~34세 / 19-34세
-        (r"(만\s*)?(\d{1,2})\s*세?\s*(?:~|-|–|—)\s*(만\s*)?(\d{1,2})\s*세", "range"),
-        # 65세 (이상/이하 없이 단독은 exact로 두되 note)
-        (r"(만\s*)?(\d{1,2})\s*세\b", "maybe_exact"),
-    ]
-
     used_spans = set()
 
     # range 우선
-    for m in re.finditer(patterns[2][0], t, re.IGNORECASE):
+    for m in ctx.finditer(AGE_RANGE, KEYWORDS):
         a = to_int_safe(m.group(2))
         b = to_int_safe(m.group(4))
         if a is None or b is None:
@@ -52,8 +59,8 @@ def parse_age(text: str) -> Dict[str, Any]:
         used_spans.add(m.span())
 
     # min/max
-    for pat, typ in [patterns[0], patterns[1]]:
-        for m in re.finditer(pat, t, re.IGNORECASE):
+    for pat, typ in [(AGE_MIN, "min"), (AGE_MAX, "max")]:
+        for m in ctx.finditer(pat, KEYWORDS):
             # range에 포함된 span이면 스킵(대충)
             if any(_overlap(m.span(), s) for s in used_spans):
                 continue
@@ -65,7 +72,7 @@ def parse_age(text: str) -> Dict[str, Any]:
 
     # maybe_exact: 다른 조건이 하나도 없을 때만 참고
     if not out["constraints"]:
-        for m in re.finditer(patterns[3][0], t, re.IGNORECASE):
+        for m in ctx.finditer(AGE_EXACT, KEYWORDS):
             v = to_int_safe(m.group(2))
             if v is None:
                 continue
@@ -2,32 +2,41 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from .utils import norm_text, parse_money_to_won, result_template
+from .context import Context, FullContext
+from .utils import result_template
 
+# 예: 총자산 3억원 이하 / 재산 2억 이하 / 순자산 5천만원 미만
+ASSET_MAX = re.compile(
+    r"(총\s*자산|순\s*자산|재산)\s*([0-9][0-9, ]*(?:억|만|원|만원)?)\s*(이하|미만)",
+    re.IGNORECASE,
+)
 
-def parse_assets(text: str) -> Dict[str, Any]:
+PATTERNS = [ASSET_MAX]
+KEYWORDS = ("자산", "재산")
+# engine prefilter에 쓰는 이 룰의 키워드 전체
+PREFILTER_KEYWORDS = KEYWORDS
+
+
+def parse_assets(text: str, ctx: Optional[Context] = None) -> Dict[str, Any]:
     """
     자산: '총자산/재산/순자산' 상한 중심.
+    ctx: 여러 룰이 공유하는 RuleContext (ctx.text = 정규화된 텍스트, text는 무시)
     """
-    t = norm_text(text)
+    ctx = ctx or FullContext(text)
+    t = ctx.text
     out = result_template("assets")
     if not t:
         return out
 
-    # 예: 총자산 3억원 이하 / 재산 2억 이하 / 순자산 5천만원 미만
-    for m in re.finditer(
-        r"(총\s*자산|순\s*자산|재산)\s*([0-9][0-9, ]*(?:억|만|원|만원)?)\s*(이하|미만)",
-        t,
-        re.IGNORECASE,
-    ):
+    for m in ctx.finditer(ASSET_MAX, KEYWORDS):
         label = m.group(1).replace(" ", "")
         money = m.group(2)
-        won = parse_money_to_won(money)
+        won = ctx.money(money)
         if won is None:
             # "3억원" 같은 케이스: 숫자+억+원 혼합 방어
-            won = parse_money_to_won(money.replace("원", ""))
+            won = ctx.money(money.replace("원", ""))
         if won is None:
             continue
         out["constraints"].append({"type": "max_won", "value": won, "field": label})
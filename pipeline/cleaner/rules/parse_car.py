@@ -2,35 +2,48 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from .utils import norm_text, parse_money_to_won, result_template
+from .context import Context, FullContext
+from .utils import result_template
 
+# 미보유/무소유
+CAR_NOT_OWN = re.compile(r"(차량|자동차)\s*(미보유|무소유)", re.IGNORECASE)
+# 차량가액 N 이하/미만
+CAR_VALUE_MAX = re.compile(
+    r"(차량\s*가액|자동차\s*가액|차량가액|자동차가액)\s*([0-9][0-9, ]*(?:억|만|원|만원)?)\s*(이하|미만)",
+    re.IGNORECASE,
+)
 
-def parse_car(text: str) -> Dict[str, Any]:
+PATTERNS = [CAR_NOT_OWN, CAR_VALUE_MAX]
+KEYWORDS = ("차량", "자동차")
+VALUE_KEYWORDS = ("가액",)
+# engine prefilter에 쓰는 이 룰의 키워드 전체
+PREFILTER_KEYWORDS = KEYWORDS + VALUE_KEYWORDS
+
+
+def parse_car(text: str, ctx: Optional[Context] = None) -> Dict[str, Any]:
     """
     차량: '차량가액/자동차가액' 상한, '차량 미보유' 등.
+    ctx: 여러 룰이 공유하는 RuleContext (ctx.text = 정규화된 텍스트, text는 무시)
     """
-    t = norm_text(text)
+    ctx = ctx or FullContext(text)
+    t = ctx.text
     out = result_template("car")
     if not t:
         return out
 
     # 미보유/무소유
-    for m in re.finditer(r"(차량|자동차)\s*(미보유|무소유)", t, re.IGNORECASE):
+    for m in ctx.finditer(CAR_NOT_OWN, KEYWORDS):
         out["constraints"].append({"type": "must_not_own", "value": True})
         out["evidence"].append(m.group(0))
 
     # 차량가액 N 이하/미만
-    for m in re.finditer(
-        r"(차량\s*가액|자동차\s*가액|차량가액|자동차가액)\s*([0-9][0-9, ]*(?:억|만|원|만원)?)\s*(이하|미만)",
-        t,
-        re.IGNORECASE,
-    ):
+    for m in ctx.finditer(CAR_VALUE_MAX, VALUE_KEYWORDS):
         money = m.group(2)
-        won = parse_money_to_won(money)
+        won = ctx.money(money)
         if won is None:
-            won = parse_money_to_won(money.replace("원", ""))
+            won = ctx.money(money.replace("원", ""))
         if won is None:
             continue
         out["constraints"].append({"type": "value_max_won", "value": won})
@@ -4,11 +4,39 @@ from __future__ import annotations
 import re
 from typing import Any, Dict, List, Optional, Tuple
 
-from .utils import norm_text, to_int_safe, parse_money_to_won, result_template
-
-
-def parse_income(text: str) -> Dict[str, Any]:
-    t = norm_text(text)
+from .context import Context, FullContext
+from .utils import to_int_safe, result_template
+
+# 패턴들 (모듈 로드 시 1회 컴파일)
+INCOME_MEDIAN_PERCENT = re.compile(
+    r"(?:기준\s*)?중위\s*소득\s*(\d{1,3})\s*%\s*(이하|미만|이내|이상|초과)",
+    re.IGNORECASE,
+)
+# 같은 줄 뒤쪽에 '중위소득'이 있으면 비-중위 % 패턴 시작 위치에서 제외
+MEDIAN_INCOME = re.compile(r"중위\s*소득", re.IGNORECASE)
+INCOME_PERCENT = re.compile(
+    r"(?:도시근로자\s*월평균\s*)?(?:평균\s*)?(?:기준\s*)?소득\s*(\d{1,3})\s*%\s*(이하|미만|이내|이상|초과)",
+    re.IGNORECASE,
+)
+INCOME_AMOUNT = re.compile(
+    r"(연\s*소득|월\s*소득)\s*([0-9][0-9,]*)\s*(만원|원)\s*(이하|미만|이내|이상|초과)",
+    re.IGNORECASE,
+)
+INCOME_DECILE = re.compile(r"(\d{1,2})\s*분위", re.IGNORECASE)
+HOUSEHOLD_PERCENT = re.compile(r"\d+인\s*\d{1,3}\s*%")
+
+PATTERNS = [INCOME_MEDIAN_PERCENT, MEDIAN_INCOME, INCOME_PERCENT, INCOME_AMOUNT, INCOME_DECILE, HOUSEHOLD_PERCENT]
+KEYWORDS = ("소득",)
+DECILE_KEYWORDS = ("분위",)
+HOUSEHOLD_KEYWORDS = ("%",)
+# engine prefilter에 쓰는 이 룰의 키워드 전체 (중위: MEDIAN_INCOME not_before 판정용)
+PREFILTER_KEYWORDS = KEYWORDS + ("중위",) + DECILE_KEYWORDS + HOUSEHOLD_KEYWORDS
+
+
+def parse_income(text: str, ctx: Optional[Context] = None) -> Dict[str, Any]:
+    """ctx: 여러 룰이 공유하는 RuleContext (ctx.text = 정규화된 텍스트, text는 무시)"""
+    ctx = ctx or FullContext(text)
+    t = ctx.text
     out = result_template("income")
     if not t:
         return out
@@ -38,11 +66,7 @@ def parse_income(text: str) -> Dict[str, Any]:
     # 1) 중위소득 % (가장 우선/명확)
     # ---------------------------------------------------------------------
     # 예: 기준 중위소득 150% 이하, 중위 소득 120% 이내, 중위소득 100% 이상
-    for m in re.finditer(
-        r"(?:기준\s*)?중위\s*소득\s*(\d{1,3})\s*%\s*(이하|미만|이내|이상|초과)",
-        t,
-        re.IGNORECASE,
-    ):
+    for m in ctx.finditer(INCOME_MEDIAN_PERCENT, KEYWORDS):
         p = to_int_safe(m.group(1))
         if p is None:
             continue
@@ -57,13 +81,8 @@ def parse_income(text: str) -> Dict[str, Any]:
     # 2) 비-중위소득 % (평균/기준/도시근로자월평균/그냥 소득)
     # ---------------------------------------------------------------------
     # 예: 도시근로자 월평균소득 120% 이하, 평균소득 80% 이하, 소득 70% 이내
-    # "중위소득"은 위에서 이미 처리하므로 제외(negative lookahead)
-    for m in re.finditer(
-        r"(?!.*중위\s*소득)"
-        r"(?:도시근로자\s*월평균\s*)?(?:평균\s*)?(?:기준\s*)?소득\s*(\d{1,3})\s*%\s*(이하|미만|이내|이상|초과)",
-        t,
-        re.IGNORECASE,
-    ):
+    # "중위소득"은 위에서 이미 처리하므로 제외(negative lookahead: '(?!.*중위\s*소득)')
+    for m in ctx.finditer(INCOME_PERCENT, KEYWORDS, not_before=MEDIAN_INCOME):
         p = to_int_safe(m.group(1))
         if p is None:
             continue
@@ -78,17 +97,13 @@ def parse_income(text: str) -> Dict[str, Any]:
     # 3) 금액 조건: 연소득/월소득
     # ---------------------------------------------------------------------
     # 예: 연소득 6,000만원 이하 / 월소득 300만원 미만 / 연 소득 50000000원 이하
-    for m in re.finditer(
-        r"(연\s*소득|월\s*소득)\s*([0-9][0-9,]*)\s*(만원|원)\s*(이하|미만|이내|이상|초과)",
-        t,
-        re.IGNORECASE,
-    ):
+    for m in ctx.finditer(INCOME_AMOUNT, KEYWORDS):
         kind = (m.group(1) or "").replace(" ", "")  # '연소득' / '월소득'
         amount_num = m.group(2)
         unit = m.group(3)
         op_word = m.group(4)
 
-        won = parse_money_to_won(f"{amount_num}{unit}")
+        won = ctx.money(f"{amount_num}{unit}")
         if won is None:
             continue
 
@@ -107,7 +122,7 @@ def parse_income(text: str) -> Dict[str, Any]:
     # ---------------------------------------------------------------------
     # 4) 분위(소득분위/분위) - 단순
     # ---------------------------------------------------------------------
-    for m in re.finditer(r"(\d{1,2})\s*분위", t, re.IGNORECASE):
+    for m in ctx.finditer(INCOME_DECILE, DECILE_KEYWORDS):
         v = to_int_safe(m.group(1))
         if v is None:
             continue
@@ -122,7 +137,7 @@ def parse_income(text: str) -> Dict[str, Any]:
     # 5) 애매/복잡한 패턴은 notes로만 남김(가구원수별 등)
     # ---------------------------------------------------------------------
     # 예: "1인 120%, 2인 110%..." 같은 경우: 숫자/%가 여러 개 붙는 패턴
-    if re.search(r"\d+인\s*\d{1,3}\s*%", t):
+    if ctx.search(HOUSEHOLD_PERCENT, HOUSEHOLD_KEYWORDS):
         out["notes"].append("가구원수별 소득% 조건이 포함되어 있을 수 있음(추후 확장 필요)")
 
     return out
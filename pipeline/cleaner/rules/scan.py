@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""
+scan.py
+
+룰 패턴 스캐너:
+- FullScanner   : 텍스트 전체에 finditer (기존 parse_* 동작 그대로, 기준 구현)
+- WindowScanner : 키워드(세/소득/자산/재산/차량/가액/분위 …) 위치를 한 번만 찾아
+                  매칭이 생길 수 있는 짧은 구간(window)에서만 패턴 실행
+
+window 정의:
+- 룰 패턴이 매칭할 수 있는 문자(allowed: 패턴 리터럴 문자 + 숫자 + 공백 + ,%~-)만으로 이어진 최대 구간
+- 매칭은 allowed 밖의 문자를 포함할 수 없으므로, 모든 매칭은 자기 키워드가 들어 있는 window 안에 있음
+  → window에서만 돌려도 전체 finditer와 매칭/순서가 동일
+"""
+
+from __future__ import annotations
+
+import bisect
+import re
+from typing import Dict, FrozenSet, Iterator, List, Optional, Pattern, Protocol, Sequence, Tuple
+
+
+class Scanner(Protocol):
+    text: str
+
+    def finditer(
+        self,
+        pattern: Pattern[str],
+        keywords: Sequence[str],
+        not_before: Optional[Pattern[str]] = None,
+    ) -> Iterator[re.Match]: ...
+
+    def search(self, pattern: Pattern[str], keywords: Sequence[str]) -> Optional[re.Match]: ...
+
+
+class FullScanner:
+    """텍스트 전체 스캔 (기준 구현)"""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self._compiled: Dict[Tuple[str, str], Pattern[str]] = {}
+
+    def finditer(
+        self,
+        pattern: Pattern[str],
+        keywords: Sequence[str],
+        not_before: Optional[Pattern[str]] = None,
+    ) -> Iterator[re.Match]:
+        """
+        not_before: 매칭 시작 위치 뒤 같은 줄에 이 패턴이 있으면 그 위치는 건너뜀
+                    (= 기존 정규식의 '(?!.*<not_before>)' 선행 부정탐색)
+        """
+        if not_before is not None:
+            key = (pattern.pattern, not_before.pattern)
+            compiled = self._compiled.get(key)
+            if compiled is None:
+                compiled = re.compile(r"(?!.*" + not_before.pattern + ")" + pattern.pattern, pattern.flags)
+                self._compiled[key] = compiled
+            pattern = compiled
+        return pattern.finditer(self.text)
+
+    def search(self, pattern: Pattern[str], keywords: Sequence[str]) -> Optional[re.Match]:
+        return pattern.search(self.text)
+
+
+class WindowScanner:
+    """키워드 prefilter + window 단위 스캔 (FullScanner와 결과 동일)"""
+
+    def __init__(self, text: str, keyword_re: Pattern[str], keywords: Sequence[str], allowed: FrozenSet[str]) -> None:
+        self.text = text
+        self._allowed = allowed
+        self._keywords = tuple(keywords)
+        # 키워드 → 등장 위치 (window 계산과 같은 1회 스캔에서 기록)
+        self.keyword_positions: Dict[str, List[int]] = {}
+        # (start, end, 포함된 키워드 집합) — 텍스트 순서
+        self.windows: List[Tuple[int, int, FrozenSet[str]]] = self._find_windows(keyword_re)
+        self._zones: Dict[str, Tuple[List[int], List[int]]] = {}
+        self._line_starts: Optional[List[int]] = None
+
+    def _is_allowed(self, c: str) -> bool:
+        return c in self._allowed or c.isdecimal() or c.isspace()
+
+    def _find_windows(self, keyword_re: Pattern[str]) -> List[Tuple[int, int, FrozenSet[str]]]:
+        t = self.text
+        n = len(t)
+        windows: List[Tuple[int, int, FrozenSet[str]]] = []
+        end = -1
+        for m in keyword_re.finditer(t):
+            self.keyword_positions.setdefault(m.group(), []).append(m.start())
+            if m.start() < end:
+                continue  # 이미 찾은 window 안의 키워드
+            s = m.start()
+            while s > 0 and self._is_allowed(t[s - 1]):
+                s -= 1
+            end = m.end()
+            while end < n and self._is_allowed(t[end]):
+                end += 1
+            seg = t[s:end]
+            # 키워드끼리 겹치는 경우(자동차량 등)까지 window 안에서 다시 확인
+            windows.append((s, end, frozenset(k for k in self._keywords if k in seg)))
+        return windows
+
+    @property
+    def line_starts(self) -> List[int]:
+        """줄 시작 오프셋 (처음 필요할 때 1회 계산)"""
+        if self._line_starts is None:
+            self._line_starts = [0] + [m.end() for m in re.finditer("\n", self.text)]
+        return self._line_starts
+
+    def line_start(self, pos: int) -> int:
+        starts = self.line_starts
+        return starts[bisect.bisect_right(starts, pos) - 1]
+
+    def _selected(self, keywords: Sequence[str]) -> Iterator[Tuple[int, int]]:
+        n = len(self.text)
+        for s, e, kws in self.windows:
+            if not kws.isdisjoint(keywords):
+                # endpos에 경계 문자 1개 포함: 패턴 끝의 \b 판정이 전체 스캔과 같아지도록
+                yield s, min(e + 1, n)
+
+    def _line_zones(self, not_before: Pattern[str], keywords: Sequence[str]) -> Tuple[List[int], List[int]]:
+        """
+        '(?!.*X)'가 실패하는 시작 위치 = X가 시작하는 위치 q와 같은 줄이면서 q 이전인 위치
+        → 줄마다 [줄 시작, 마지막 q] 구간으로 정리 (정렬된 starts/ends)
+        """
+        cached = self._zones.get(not_before.pattern)
+        if cached is not None:
+            return cached
+        t = self.text
+        per_line: Dict[int, int] = {}
+        for s, e in self._selected(keywords):
+            for m in not_before.finditer(t, s, e):
+                q = m.start()
+                ls = self.line_start(q)
+                per_line[ls] = max(per_line.get(ls, -1), q)
+        starts = sorted(per_line)
+        zones = (starts, [per_line[s] for s in starts])
+        self._zones[not_before.pattern] = zones
+        return zones
+
+    def finditer(
+        self,
+        pattern: Pattern[str],
+        keywords: Sequence[str],
+        not_before: Optional[Pattern[str]] = None,
+    ) -> Iterator[re.Match]:
+        if not_before is None:
+            for s, e in self._selected(keywords):
+                yield from pattern.finditer(self.text, s, e)
+            return
+
+        # 선행 부정탐색을 줄 단위 금지 구간으로 바꿔 선형 시간에 처리
+        zone_starts, zone_ends = self._line_zones(not_before, _keywords_of(not_before, self._keywords))
+        for s, e in self._selected(keywords):
+            pos = s
+            while pos < e:
+                m = pattern.search(self.text, pos, e)
+                if m is None:
+                    break
+                i = bisect.bisect_right(zone_starts, m.start()) - 1
+                if i >= 0 and m.start() <= zone_ends[i]:
+                    pos = zone_ends[i] + 1
+                    continue
+                yield m
+                pos = m.end()
+
+    def search(self, pattern: Pattern[str], keywords: Sequence[str]) -> Optional[re.Match]:
+        for s, e in self._selected(keywords):
+            m = pattern.search(self.text, s, e)
+            if m is not None:
+                return m
+        return None
+
+
+def _keywords_of(pattern: Pattern[str], keywords: Sequence[str]) -> Tuple[str, ...]:
+    """패턴 리터럴에 들어 있는 키워드 (not_before 패턴의 window 선택용)"""
+    src = re.sub(r"\\s\*", "", pattern.pattern)
+    found = tuple(k for k in keywords if k in src)
+    if not found:
+        raise ValueError(f"pattern has no prefilter keyword: {pattern.pattern}")
+    return found
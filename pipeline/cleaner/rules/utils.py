@@ -30,6 +30,17 @@ def to_int_safe(s: str) -> Optional[int]:
         return None
 
 
+# 금액 토큰: 숫자 덩어리 + (억/만/원). 쉼표/공백 제거 후 1회 스캔
+MONEY_TOKEN = re.compile(r"(\d+)\s*(억|만|원)?")
+_MONEY_STRIP = str.maketrans("", "", ", ")
+_MONEY_UNITS = {"억": 100_000_000, "만": 10_000, "원": 1}
+
+
+def money_tokens(s: str) -> List[Tuple[int, Optional[str]]]:
+    """'3억 5,000만원' -> [(3, '억'), (5000, '만')] (단위 없는 숫자는 unit=None)"""
+    return [(int(m.group(1)), m.group(2)) for m in MONEY_TOKEN.finditer(s.translate(_MONEY_STRIP))]
+
+
 def parse_money_to_won(s: str) -> Optional[int]:
     """
     한국어 금액 표현을 '원' 단위 int로 근사 변환.
@@ -38,33 +49,15 @@ def parse_money_to_won(s: str) -> Optional[int]:
       "200만원" -> 2_000_000
       "1억" -> 100_000_000
       "1억 2천만원" 같은 복합은 1차 버전에선 부분 매칭만 될 수 있음.
+    단위(억/만/원)마다 처음 나온 숫자만 사용
     """
     if not s:
         return None
-    s = s.replace(",", "").replace(" ", "")
-
-    # 1) 억 단위
-    m = re.search(r"(\d+)\s*억", s)
-    total = 0
-    if m:
-        v = to_int_safe(m.group(1))
-        if v is not None:
-            total += v * 100_000_000
-
-    # 2) 만 단위
-    m2 = re.search(r"(\d+)\s*만", s)
-    if m2:
-        v2 = to_int_safe(m2.group(1))
-        if v2 is not None:
-            total += v2 * 10_000
-
-    # 3) 원/천원/만원/백만원/천만원 등 숫자원 (간단 처리)
-    m3 = re.search(r"(\d+)\s*원", s)
-    if m3:
-        v3 = to_int_safe(m3.group(1))
-        if v3 is not None:
-            total += v3
-
+    seen: Dict[str, int] = {}
+    for value, unit in money_tokens(s):
+        if unit is not None and unit not in seen:
+            seen[unit] = value
+    total = sum(v * _MONEY_UNITS[u] for u, v in seen.items())
     return total if total > 0 else None
 
 
@@ -2,12 +2,18 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import importlib
+import json
 import logging
+import math
 import os
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, Tuple, List
+from typing import Any, Dict, Iterator, Optional, Tuple, List
 
 import pandas as pd
 
@@ -17,6 +23,21 @@ PROJECT_ROOT = os.path.abspath(os.path.join(HERE, "..", ".."))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
+from pipeline.cleaner.clean_profile import CleanProfile, check_throughput, format_report  # noqa: E402
+from pipeline.cleaner.dedup import THRESHOLD as DEDUP_THRESHOLD, format_summary, run_dedup  # noqa: E402
+from pipeline.cleaner.outputs import (  # noqa: E402
+    FORMATS,
+    POLICIES_COLS,
+    normalize_chunks,
+    normalize_elig,
+    normalize_policies,
+    open_writers,
+    parquet_available,
+    read_output,
+)
+
+DEFAULT_RULE_CACHE = os.path.join(HERE, ".cache", "rule_cache.sqlite3")
+
 
 # -------------------------
 # logger
@@ -76,7 +97,7 @@ def _to_text(v: Any) -> str:
 def validate_input_contract(df: pd.DataFrame) -> None:
     """
     입력 최소 계약:
-    - policy_id 컬럼 존재 + 값 비어있으면 안됨 (중복 허용: 출력에서 재번호 부여하므로)
+    - policy_id 컬럼 존재 + 값 비어있으면 안됨 (중복 허용: 같은 값은 등장 순서로 구분해 id_map에 매핑)
     - eligibility 컬럼 존재 + 값 비어있으면 안됨
     """
     required_cols = ["policy_id", "eligibility"]
@@ -97,7 +118,49 @@ def validate_input_contract(df: pd.DataFrame) -> None:
 # -------------------------
 # safe import (rules/build_clean_text)
 # -------------------------
-def safe_import_rules(logger: logging.Logger):
+def load_rule_cache(path: Optional[str], logger: logging.Logger):
+    """룰 결과 디스크 캐시 (없거나 실패하면 None → 캐시 없이 실행)"""
+    if not path:
+        return None
+    try:
+        from pipeline.cleaner.rules.cache import RuleCache
+
+        return RuleCache(path)
+    except Exception as e:
+        logger.warning(f"rule cache disabled ({e})")
+        return None
+
+
+def safe_import_rules(logger: logging.Logger, rule_cache: Any = None, prof: Optional[CleanProfile] = None):
+    """
+    텍스트 1건 → (age, income, assets, car) 결과를 돌려주는 함수 1개
+    1) 룰 엔진(rules.engine.parse_all): 정규화/키워드 스캔 1회 + window 단위 패턴 검사
+       rule_cache(RuleCache)가 있으면 (룰 버전, 텍스트 해시)로 저장된 결과 재사용
+    2) 실패하면 개별 parse_* (없는 룰은 noop)
+    prof: 있으면 룰별 소요 시간을 prof.rules에 누적
+    """
+    timings = prof.rules if prof is not None else None
+    try:
+        from pipeline.cleaner.rules.engine import parse_all
+
+        if rule_cache is not None:
+            from pipeline.cleaner.rules.cache import cached_parse_all
+
+            parse = cached_parse_all(rule_cache, timings)
+        else:
+            def parse(text: str):
+                return parse_all(text, timings=timings)
+
+        def parse_rules(text: str):
+            r = parse(text)
+            if prof is not None:
+                prof.rule_calls += 1
+            return r["age"], r["income"], r["assets"], r["car"]
+
+        return parse_rules
+    except Exception as e:
+        logger.warning(f"rule engine not found → 개별 parse_* 사용 ({e})")
+
     try:
         from pipeline.cleaner.rules.parse_age import parse_age
     except Exception as e:
@@ -122,19 +185,33 @@ def safe_import_rules(logger: logging.Logger):
         logger.warning(f"parse_car not found → noop 사용 ({e})")
         parse_car = lambda *args, **kwargs: {}
 
-    return parse_age, parse_income, parse_assets, parse_car
+    fns = (("age", parse_age), ("income", parse_income), ("assets", parse_assets), ("car", parse_car))
+
+    def parse_rules(text: str):
+        if timings is None:
+            return tuple(fn(text) for _name, fn in fns)
+        out = []
+        for name, fn in fns:
+            t0 = time.perf_counter()
+            out.append(fn(text))
+            timings[name] += time.perf_counter() - t0
+        prof.rule_calls += 1
+        return tuple(out)
+
+    return parse_rules
 
 
 def safe_import_build_clean_text(logger: logging.Logger):
     """
+    build_text_bundle(row) → {clean_text, embedding_text, card_snippet, chunks}
     1) 정상 패키지 import: pipeline.cleaner.build_clean_text
     2) 실패하면, 현재 파일 기준 동일 폴더의 build_clean_text.py 직접 로드(importlib)
-    3) 그래도 실패하면 fallback
+    3) 그래도 실패하면 fallback (청크 없음 → QA 로더는 clean_text 전체를 문서 1개로 사용)
     """
     try:
-        from pipeline.cleaner.build_clean_text import build_clean_text
+        from pipeline.cleaner.build_clean_text import build_text_bundle
         logger.info("build_clean_text loaded (package import)")
-        return build_clean_text
+        return build_text_bundle
     except Exception as e1:
         logger.warning(f"build_clean_text package import failed: {e1}")
 
@@ -146,9 +223,9 @@ def safe_import_build_clean_text(logger: logging.Logger):
             if spec and spec.loader:
                 mod = importlib.util.module_from_spec(spec)
                 spec.loader.exec_module(mod)  # type: ignore
-                build_clean_text = getattr(mod, "build_clean_text")
+                build_text_bundle = getattr(mod, "build_text_bundle")
                 logger.info("build_clean_text loaded (direct file import)")
-                return build_clean_text
+                return build_text_bundle
         logger.warning("build_clean_text.py not found next to run_clean.py")
     except Exception as e2:
         logger.warning(f"build_clean_text direct import failed: {e2}")
@@ -164,8 +241,9 @@ def safe_import_build_clean_text(logger: logging.Logger):
         raw = _to_text(row.get("raw_text"))
         if raw:
             parts.append(f"[raw]\n{raw[:2000]}")
-        text = "\n\n".join(parts)
-        return text[:max_chars]
+        text = "\n\n".join(parts)[:max_chars]
+        snippet = " ".join(_to_text(row.get("support_summary")).split())
+        return {"clean_text": text, "embedding_text": text, "card_snippet": snippet[:120], "chunks": []}
 
     return fallback
 
@@ -297,144 +375,585 @@ def build_support_detail(row: Dict[str, Any]) -> str:
 
 
 # -------------------------
-# core
+# row processing (serial / process pool 공용)
 # -------------------------
-def run_clean(input_csv: str, limit: Optional[int] = None, verbose: bool = False) -> None:
-    logger = setup_logger(verbose)
+def _stage(prof: Optional[CleanProfile], name: str):
+    return prof.stage(name) if prof is not None else nullcontext()
+
+
+def clean_row(
+    policy_id: int,
+    row: Dict[str, Any],
+    updated_at: str,
+    fns: Tuple[Any, ...],
+    logger: logging.Logger,
+    prof: Optional[CleanProfile] = None,
+) -> Tuple[Dict[str, Any], Dict[str, Any], List[Dict[str, Any]]]:
+    """입력 1행 → (policies 행, policy_eligibility 행, policy_chunks 행들). prof: 단계별 시간/느린 행 기록"""
+    parse_rules, build_text_bundle = fns
+    t_row = time.perf_counter()
+
+    policy_name = _to_text(row.get("policy_name"))
+    if not policy_name:
+        raise ValueError(f"Schema violation: policy_name is required for policies (row_new_id={policy_id})")
+
+    chunks = [
+        _to_text(row.get("eligibility")),
+        _to_text(row.get("benefit")),
+        _to_text(row.get("apply_process")),
+        _to_text(row.get("apply_period")),
+        _to_text(row.get("raw_text")),
+    ]
+    text_for_rules = "\n".join([c for c in chunks if c])
+
+    with _stage(prof, "rules"):
+        age_obj, income_obj, assets_obj, car_obj = parse_rules(text_for_rules)
+
+    min_age, max_age = pick_age_min_max(age_obj)
+    income_rule_type, income_threshold = normalize_income_to_contract(income_obj, logger)
+
+    asset_threshold = pick_min_of_type(assets_obj, ("max_won", "asset_max_won", "assets_max_won"))
+    vehicle_value_limit = pick_min_of_type(car_obj, ("value_max_won", "car_value_max_won", "max_won"))
 
-    df = pd.read_csv(input_csv, encoding="utf-8-sig")
-    validate_input_contract(df)
+    is_homeowner_required = bool(infer_is_homeowner_required(text_for_rules))
 
-    if limit:
-        df = df.head(limit)
+    with _stage(prof, "support_text"):
+        support_summary = build_support_summary(row)
+        support_detail = build_support_detail(row)
+    row_for_clean = dict(row, support_summary=support_summary, support_detail=support_detail)
+    with _stage(prof, "build_clean_text"):
+        bundle = build_text_bundle(row_for_clean)
 
-    parse_age, parse_income, parse_assets, parse_car = safe_import_rules(logger)
-    build_clean_text = safe_import_build_clean_text(logger)
+    region = row.get("region", pd.NA)
+    if _is_missing(region):
+        region = pd.NA
+    else:
+        region = _to_text(region)
+
+    policy = {
+        "policy_id": policy_id,
+        "policy_name": policy_name,
+        "support_summary": support_summary,
+        "support_detail": support_detail,
+        "region": region,
+        "clean_text": bundle["clean_text"],
+        "embedding_text": bundle["embedding_text"],
+        "card_snippet": bundle["card_snippet"],
+        "updated_at": updated_at,
+    }
+    chunks = [{"policy_id": policy_id, "chunk_no": no, **c} for no, c in enumerate(bundle["chunks"])]
+    elig = {
+        "policy_id": policy_id,
+        "min_age": min_age,
+        "max_age": max_age,
+        "income_rule_type": income_rule_type,  # NONE/AMOUNT/MEDIAN_RATIO
+        "income_threshold": income_threshold,  # AMOUNT일 때만 값(연소득 원)
+        "asset_threshold": asset_threshold,  # 원
+        "is_homeowner_required": bool(is_homeowner_required),
+        "vehicle_value_limit": vehicle_value_limit,  # 원
+    }
+    if prof is not None:
+        prof.add_row(policy_id, time.perf_counter() - t_row, len(text_for_rules))
+    return policy, elig, chunks
+
+
+# -------------------------
+# process pool (--workers)
+# -------------------------
+class _RecordBuffer(logging.Handler):
+    """워커에서 찍힌 로그를 모아 두었다가 부모 프로세스에서 순서대로 재출력"""
 
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: List[Tuple[int, str]] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append((record.levelno, record.getMessage()))
+
+
+_WORKER_FNS: Optional[Tuple[Any, ...]] = None
+_WORKER_LOGGER: Optional[logging.Logger] = None
+_WORKER_BUFFER: Optional[_RecordBuffer] = None
+_WORKER_CACHE: Any = None
+_WORKER_PROF: Optional[CleanProfile] = None
+
+
+def _init_worker(verbose: bool, rule_cache_path: Optional[str], profile: bool = False) -> None:
+    global _WORKER_FNS, _WORKER_LOGGER, _WORKER_BUFFER, _WORKER_CACHE, _WORKER_PROF
+    # 워커 로그는 부모 logger("cleaner")로 되돌려 보내므로 여기서는 버퍼에만 기록
+    logger = logging.getLogger(f"cleaner.worker.{os.getpid()}")
+    logger.handlers.clear()
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+    buffer = _RecordBuffer()
+    logger.addHandler(buffer)
+
+    # import 결과(noop fallback 여부)는 부모에서 이미 한 번 로그를 남김
+    quiet = logging.getLogger("cleaner.worker.import")
+    quiet.handlers.clear()
+    quiet.propagate = False
+    quiet.addHandler(logging.NullHandler())
+    _WORKER_CACHE = load_rule_cache(rule_cache_path, quiet)
+    _WORKER_PROF = CleanProfile() if profile else None
+    _WORKER_FNS = (safe_import_rules(quiet, _WORKER_CACHE, _WORKER_PROF), safe_import_build_clean_text(quiet))
+    _WORKER_LOGGER = logger
+    _WORKER_BUFFER = buffer
+
+
+def _clean_chunk(
+    items: List[Tuple[int, Dict[str, Any], str]]
+) -> Tuple[
+    List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]], List[Tuple[int, str]], Dict[str, list], Dict[str, Any]
+]:
+    assert _WORKER_FNS is not None and _WORKER_LOGGER is not None and _WORKER_BUFFER is not None
+    _WORKER_BUFFER.records = []
     policies_rows: List[Dict[str, Any]] = []
     elig_rows: List[Dict[str, Any]] = []
+    chunk_rows: List[Dict[str, Any]] = []
+    for policy_id, row, updated_at in items:
+        policy, elig, sections = clean_row(policy_id, row, updated_at, _WORKER_FNS, _WORKER_LOGGER, _WORKER_PROF)
+        policies_rows.append(policy)
+        elig_rows.append(elig)
+        chunk_rows.extend(sections)
+    stats = _WORKER_CACHE.take_stats() if _WORKER_CACHE is not None else {}
+    prof = _WORKER_PROF.take() if _WORKER_PROF is not None else {}
+    return policies_rows, elig_rows, chunk_rows, _WORKER_BUFFER.records, stats, prof
+
+
+def format_rule_cache_stats(stats: Dict[str, list]) -> str:
+    parts = []
+    for rule, (hit, miss) in stats.items():
+        total = hit + miss
+        rate = hit / total * 100 if total else 0.0
+        parts.append(f"{rule} {hit}/{total} ({rate:.1f}%)")
+    return "rule cache hits: " + (", ".join(parts) if parts else "-")
+
+
+def _merge_stats(total: Dict[str, list], part: Dict[str, list]) -> None:
+    for rule, (hit, miss) in part.items():
+        acc = total.setdefault(rule, [0, 0])
+        acc[0] += hit
+        acc[1] += miss
+
+
+def _resolve_workers(workers: Optional[int]) -> int:
+    """None/1 → 직렬, 0 이하 → 전체 코어"""
+    if workers is None:
+        return 1
+    if workers <= 0:
+        return os.cpu_count() or 1
+    return workers
 
-    now_iso = datetime.now(timezone.utc).isoformat()
 
-    # ✅ 출력 policy_id: 입력의 policy_id와 무관하게 1..N 재번호
-    for new_id, r in enumerate(df.itertuples(index=False), start=1):
-        row = r._asdict()
+# -------------------------
+# stable policy_id / incremental state
+# -------------------------
+ID_MAP_COLS = ["source_id", "policy_id", "version_hash", "clean_version", "updated_at", "removed_at"]
+VERSION_FIELDS = (
+    "policy_name", "target_group", "summary", "support_summary", "support_detail", "region",
+    "eligibility", "benefit", "apply_process", "apply_period", "raw_text",
+)
+
 
-        policy_id = int(new_id)  # <- 핵심 변경
+def row_version(row: Dict[str, Any]) -> str:
+    """입력의 version_hash를 우선 사용, 없으면 정제에 쓰이는 필드로 계산"""
+    v = _to_text(row.get("version_hash"))
+    if v:
+        return v
+    payload = {k: _to_text(row.get(k)) for k in VERSION_FIELDS}
+    canonical = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
 
-        policy_name = _to_text(row.get("policy_name"))
-        if not policy_name:
-            raise ValueError(f"Schema violation: policy_name is required for policies (row_new_id={policy_id})")
 
-        chunks = [
-            _to_text(row.get("eligibility")),
-            _to_text(row.get("benefit")),
-            _to_text(row.get("apply_process")),
-            _to_text(row.get("apply_period")),
-            _to_text(row.get("raw_text")),
-        ]
-        text_for_rules = "\n".join([c for c in chunks if c])
+def clean_versions() -> Dict[str, Any]:
+    """
+    정제 로직 버전: 룰별 버전(rules/cache.rule_versions) + 텍스트 빌더(build_clean_text.py) 소스 해시
+    → clean_version (id_map에 행마다 기록, 다르면 입력이 그대로여도 직전 출력을 재사용하지 않고 다시 정제)
+    """
+    try:
+        from pipeline.cleaner.rules.cache import rule_versions
+
+        rules = rule_versions()
+    except Exception:  # 룰 import 실패 → noop fallback (safe_import_rules에서 이미 경고)
+        rules = {}
+    with open(os.path.join(HERE, "build_clean_text.py"), "rb") as f:
+        text_builder = hashlib.sha256(f.read()).hexdigest()[:16]
+    payload = json.dumps({"rules": rules, "text_builder": text_builder}, sort_keys=True)
+    return {
+        "clean_version": hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16],
+        "rule_versions": rules,
+        "text_builder": text_builder,
+    }
+
+
+def source_ids(rows: List[Dict[str, Any]], seen: Optional[Dict[str, int]] = None) -> List[str]:
+    """
+    입력 policy_id(sh01_061030, bokjiro_WLF... 등). 같은 값이 반복되면 'id#2'처럼 등장 순서로 구분
+    seen: 청크 간 등장 횟수 (--stream에서 청크를 넘어 이어서 셈)
+    """
+    seen = {} if seen is None else seen
+    out: List[str] = []
+    for row in rows:
+        sid = str(row.get("policy_id")).strip()
+        seen[sid] = seen.get(sid, 0) + 1
+        out.append(sid if seen[sid] == 1 else f"{sid}#{seen[sid]}")
+    return out
 
-        age_obj = parse_age(text_for_rules)
-        income_obj = parse_income(text_for_rules)
-        assets_obj = parse_assets(text_for_rules)
-        car_obj = parse_car(text_for_rules)
 
-        min_age, max_age = pick_age_min_max(age_obj)
-        income_rule_type, income_threshold = normalize_income_to_contract(income_obj, logger)
+def load_id_map(path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    source_id → {policy_id, version_hash, clean_version, updated_at, removed_at}. 한 번 부여된 policy_id는 재사용하지 않음
+    clean_version 컬럼이 없는 이전 id_map은 빈 값 → 다음 실행에서 한 번 전체 재정제
+    updated_at: 마지막으로 내용이 바뀌어 정제된 시각 (입력/clean_version이 그대로면 --full/--stream 재정제에도 유지)
+    """
+    if not os.path.exists(path):
+        return {}
+    df = pd.read_csv(path, encoding="utf-8-sig", dtype=str)
+    out: Dict[str, Dict[str, Any]] = {}
+    for r in df.to_dict(orient="records"):
+        out[r["source_id"]] = {
+            "policy_id": int(r["policy_id"]),
+            "version_hash": _to_text(r.get("version_hash")),
+            "clean_version": _to_text(r.get("clean_version")),
+            "updated_at": _to_text(r.get("updated_at")),
+            "removed_at": _to_text(r.get("removed_at")),
+        }
+    return out
+
+
+def save_id_map(path: str, id_map: Dict[str, Dict[str, Any]]) -> None:
+    rows = [{"source_id": sid, **v} for sid, v in id_map.items()]
+    df = pd.DataFrame(rows, columns=ID_MAP_COLS).sort_values("policy_id")
+    df.to_csv(path, index=False, encoding="utf-8-sig")
+
+
+def load_previous_outputs(
+    policies_out: str, elig_out: str, chunks_out: str
+) -> Tuple[Dict[int, dict], Dict[int, dict], Dict[int, List[dict]]]:
+    """
+    직전 실행 결과를 policy_id 기준으로 읽어 둠 (변경 없는 행은 그대로 재사용)
+    출력 컬럼이 지금과 다르면(이전 버전 출력) 재사용하지 않고 전체를 다시 정제
+    """
+    if not all(os.path.exists(path) for path in (policies_out, elig_out, chunks_out)):
+        return {}, {}, {}
+    p = read_output(policies_out)
+    if set(POLICIES_COLS) - set(p.columns):
+        return {}, {}, {}
+    e = read_output(elig_out)
+    c = read_output(chunks_out)
+    p = p.astype(object).where(pd.notna(p), pd.NA)
+    e = e.astype(object).where(pd.notna(e), None)
+    prev_p = {int(r["policy_id"]): r for r in p.to_dict(orient="records")}
+    prev_e = {int(r["policy_id"]): r for r in e.to_dict(orient="records")}
+    prev_c: Dict[int, List[dict]] = {}
+    for r in c.to_dict(orient="records"):
+        prev_c.setdefault(int(r["policy_id"]), []).append(r)
+    return prev_p, prev_e, prev_c
 
-        asset_threshold = pick_min_of_type(assets_obj, ("max_won", "asset_max_won", "assets_max_won"))
-        vehicle_value_limit = pick_min_of_type(car_obj, ("value_max_won", "car_value_max_won", "max_won"))
 
-        is_homeowner_required = bool(infer_is_homeowner_required(text_for_rules))
+# -------------------------
+# input / output (--stream)
+# -------------------------
+def iter_input(input_csv: str, limit: Optional[int], read_chunksize: Optional[int]) -> Iterator[pd.DataFrame]:
+    """입력 CSV를 read_chunksize 행씩 읽음 (없으면 전체를 1청크로). 청크마다 입력 계약 검증"""
+    # policy_id는 청크마다 dtype 추론이 달라지지 않게 문자열로 고정
+    read_kw: Dict[str, Any] = {"encoding": "utf-8-sig", "dtype": {"policy_id": str}}
+    if not read_chunksize:
+        df = pd.read_csv(input_csv, **read_kw)
+        validate_input_contract(df)
+        yield df.head(limit) if limit else df
+        return
+
+    remaining = limit or None
+    with pd.read_csv(input_csv, chunksize=read_chunksize, **read_kw) as reader:
+        for df in reader:
+            validate_input_contract(df)
+            if remaining is not None:
+                df = df.head(remaining)
+                remaining -= len(df)
+            yield df
+            if remaining == 0:
+                break
+
+
+def resolve_formats(formats: Optional[str], logger: logging.Logger) -> List[str]:
+    """'csv,parquet' → ['csv', 'parquet']. pyarrow가 없으면 parquet는 경고 후 제외"""
+    out = [f.strip().lower() for f in (formats or "csv").split(",") if f.strip()]
+    unknown = [f for f in out if f not in FORMATS]
+    if unknown:
+        raise ValueError(f"unknown output format(s): {unknown} (allowed: {list(FORMATS)})")
+    if "parquet" in out and not parquet_available():
+        logger.warning("pyarrow not installed → parquet output skipped (pip install pyarrow)")
+        out = [f for f in out if f != "parquet"]
+    return out or ["csv"]
+
+
+def write_chunk(
+    writers: Dict[str, Any],
+    policies_rows: List[Dict[str, Any]],
+    elig_rows: List[Dict[str, Any]],
+    chunk_rows: List[Dict[str, Any]],
+    written_ids: set,
+) -> None:
+    """정제 결과 1청크를 검증 후 writer에 append (청크 안에서는 policy_id 순)"""
+    if not policies_rows:
+        return
+    policies_rows.sort(key=lambda r: int(r["policy_id"]))
+    elig_rows.sort(key=lambda r: int(r["policy_id"]))
+    chunk_rows.sort(key=lambda r: (int(r["policy_id"]), int(r["chunk_no"])))
+
+    policies_df = normalize_policies(pd.DataFrame(policies_rows))
+    elig_df = normalize_elig(pd.DataFrame(elig_rows))
 
-        row_for_clean = dict(row)
-        row_for_clean["support_summary"] = build_support_summary(row)
-        row_for_clean["support_detail"] = build_support_detail(row)
-        clean_text = build_clean_text(row_for_clean)
+    allowed = {"NONE", "AMOUNT", "MEDIAN_RATIO"}
+    bad = set(elig_df["income_rule_type"].dropna().astype(str)) - allowed
+    if bad:
+        raise ValueError(f"Contract violation: invalid income_rule_type values found: {sorted(list(bad))}")
 
-        region = row.get("region", pd.NA)
-        if _is_missing(region):
-            region = pd.NA
-        else:
-            region = _to_text(region)
-
-        policies_rows.append(
-            {
-                "policy_id": policy_id,
-                "policy_name": policy_name,
-                "support_summary": build_support_summary(row),
-                "support_detail": build_support_detail(row),
-                "region": region,
-                "clean_text": clean_text,
-                "updated_at": now_iso,
-            }
-        )
+    # policy_id 중복 방지 (id_map에서 부여했으니 여기서 중복이면 로직 오류)
+    ids = policies_df["policy_id"].tolist()
+    if policies_df["policy_id"].duplicated().any() or not written_ids.isdisjoint(ids):
+        raise ValueError("Internal error: duplicated policy_id in id_map")
+    written_ids.update(ids)
+
+    writers["policies"].write(policies_df)
+    writers["eligibility"].write(elig_df)
+    if chunk_rows:
+        writers["chunks"].write(normalize_chunks(pd.DataFrame(chunk_rows)))
 
-        elig_rows.append(
-            {
-                "policy_id": policy_id,
-                "min_age": min_age,
-                "max_age": max_age,
-                "income_rule_type": income_rule_type,  # NONE/AMOUNT/MEDIAN_RATIO
-                "income_threshold": income_threshold,  # AMOUNT일 때만 값(연소득 원)
-                "asset_threshold": asset_threshold,  # 원
-                "is_homeowner_required": bool(is_homeowner_required),
-                "vehicle_value_limit": vehicle_value_limit,  # 원
-            }
-        )
 
-    policies_df = pd.DataFrame(policies_rows)
-    elig_df = pd.DataFrame(elig_rows)
+# -------------------------
+# core
+# -------------------------
+def run_clean(
+    input_csv: str,
+    limit: Optional[int] = None,
+    verbose: bool = False,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    full: bool = False,
+    rule_cache: Optional[str] = None,
+    read_chunksize: Optional[int] = None,
+    formats: Optional[str] = None,
+    profile: bool = False,
+    profile_json: Optional[str] = None,
+    dedup: bool = True,
+    dedup_threshold: float = DEDUP_THRESHOLD,
+) -> Optional[Dict[str, Any]]:
+    """
+    read_chunksize(--stream): 입력을 청크 단위로 읽어 정제 → 바로 출력에 append
+    - 메모리는 청크 크기 + id_map/source_id 집합 정도로 일정
+    - 직전 출력은 읽지 않음 (변경 없는 행도 다시 정제하지만 룰 캐시로 대부분 hit)
+    - 출력 순서는 입력 순서 (청크 안에서만 policy_id 순)
+    profile(--profile): 단계별 시간/느린 행 표 출력, profile_json이 있으면 리포트 저장 → 리포트 dict 반환
+    dedup: 출력 저장 후 MinHash/LSH 중복 클러스터 → policy_dedup.csv / dedup_report.json (dedup.py)
+    """
+    logger = setup_logger(verbose)
+    t_start = time.perf_counter()
+    prof = CleanProfile() if (profile or profile_json) else None
 
     cleaner_dir = os.path.dirname(os.path.abspath(__file__))
     policies_out = os.path.join(cleaner_dir, "policies.csv")
     elig_out = os.path.join(cleaner_dir, "policy_eligibility.csv")
+    id_map_out = os.path.join(cleaner_dir, "id_map.csv")
+    chunks_out = os.path.join(cleaner_dir, "policy_chunks.csv")
+    manifest_out = os.path.join(cleaner_dir, "change_manifest.json")
 
-    policies_cols = [
-        "policy_id",
-        "policy_name",
-        "support_summary",
-        "support_detail",
-        "region",
-        "clean_text",
-        "updated_at",
-    ]
-    elig_cols = [
-        "policy_id",
-        "min_age",
-        "max_age",
-        "income_rule_type",
-        "income_threshold",
-        "asset_threshold",
-        "is_homeowner_required",
-        "vehicle_value_limit",
-    ]
-    policies_df = policies_df[policies_cols]
-    elig_df = elig_df[elig_cols]
+    now_iso = datetime.now(timezone.utc).isoformat()
+    stream = bool(read_chunksize)
+    writers = open_writers(cleaner_dir, resolve_formats(formats, logger))
+
+    # ✅ 출력 policy_id: source_id → 안정 ID (id_map.csv). 처음 보는 source_id만 새 번호 부여
+    id_map = load_id_map(id_map_out)
+    versions = clean_versions()
+    clean_version = versions["clean_version"]
+    # 룰/텍스트 빌더가 바뀐 행은 재사용하지 않음 → 재사용할 행이 하나도 없으면 직전 출력도 읽지 않음
+    reuse = not (full or stream) and any(e["clean_version"] == clean_version for e in id_map.values())
+    prev_policies, prev_elig, prev_chunks = (
+        load_previous_outputs(policies_out, elig_out, chunks_out) if reuse else ({}, {}, {})
+    )
+    next_id = max((v["policy_id"] for v in id_map.values()), default=0) + 1
 
-    allowed = {"NONE", "AMOUNT", "MEDIAN_RATIO"}
-    bad = set(elig_df["income_rule_type"].dropna().astype(str)) - allowed
-    if bad:
-        raise ValueError(f"Contract violation: invalid income_rule_type values found: {sorted(list(bad))}")
+    manifest: Dict[str, Any] = {"added": [], "changed": [], "removed": [], "unchanged": 0, "stale": 0}
+    sid_counts: Dict[str, int] = {}
+    present: set = set()
+    written_ids: set = set()
+    cleaned = 0
+    total_rows = 0
 
-    # policy_id 중복 방지 (새로 부여했으니 여기서 중복이면 로직 오류)
-    if policies_df["policy_id"].duplicated().any():
-        raise ValueError("Internal error: duplicated policy_id after renumbering")
+    cache = load_rule_cache(rule_cache, logger)
+    cache_stats: Dict[str, list] = {}
+    fns = (safe_import_rules(logger, cache, prof), safe_import_build_clean_text(logger))
+    workers = _resolve_workers(workers)
+    pool: Optional[ProcessPoolExecutor] = None
 
     try:
-        policies_df.to_csv(policies_out, index=False, encoding="utf-8-sig")
-        elig_df.to_csv(elig_out, index=False, encoding="utf-8-sig")
+        chunks = iter_input(input_csv, limit, read_chunksize)
+        chunk_no = 0
+        while True:
+            with _stage(prof, "read_csv"):
+                df = next(chunks, None)
+            if df is None:
+                break
+            chunk_no += 1
+            rows = [r._asdict() for r in df.itertuples(index=False)]
+            total_rows += len(rows)
+            sids = source_ids(rows, sid_counts)
+            present.update(sids)
+
+            policies_rows: List[Dict[str, Any]] = []
+            elig_rows: List[Dict[str, Any]] = []
+            chunk_rows: List[Dict[str, Any]] = []
+            todo: List[Tuple[int, Dict[str, Any], str]] = []
+
+            for sid, row in zip(sids, rows):
+                version = row_version(row)
+                entry = id_map.get(sid)
+                if entry is None or entry["removed_at"]:
+                    if entry is None:
+                        entry = {
+                            "policy_id": next_id, "version_hash": version, "clean_version": "", "updated_at": "", "removed_at": "",
+                        }
+                        next_id += 1
+                    manifest["added"].append({"source_id": sid, "policy_id": entry["policy_id"]})
+                elif entry["version_hash"] != version:
+                    manifest["changed"].append({"source_id": sid, "policy_id": entry["policy_id"]})
+                elif entry["clean_version"] != clean_version:
+                    manifest["stale"] += 1  # 입력은 그대로, 룰/텍스트 빌더가 바뀌어 다시 정제
+                elif entry["policy_id"] in prev_policies and entry["policy_id"] in prev_elig:
+                    manifest["unchanged"] += 1
+                    prev = prev_policies.pop(entry["policy_id"])
+                    entry["updated_at"] = entry["updated_at"] or _to_text(prev.get("updated_at"))
+                    policies_rows.append(prev)
+                    elig_rows.append(prev_elig.pop(entry["policy_id"]))
+                    chunk_rows.extend(prev_chunks.pop(entry["policy_id"], []))
+                    continue
+                elif entry["updated_at"]:
+                    # 내용은 그대로, 직전 출력이 없어서(--full/--stream 등) 다시 정제 → updated_at 유지 (ETag/커서 안정)
+                    manifest["unchanged"] += 1
+                    todo.append((entry["policy_id"], row, entry["updated_at"]))
+                    continue
+                else:
+                    manifest["unchanged"] += 1  # updated_at 기록이 없는 이전 id_map → 이번 실행 시각으로 한 번 기록
+                entry["version_hash"] = version
+                entry["clean_version"] = clean_version
+                entry["updated_at"] = now_iso
+                entry["removed_at"] = ""
+                id_map[sid] = entry
+                todo.append((entry["policy_id"], row, now_iso))
+
+            if workers == 1 or not todo:
+                for policy_id, row, updated_at in todo:
+                    policy, elig, sections = clean_row(policy_id, row, updated_at, fns, logger, prof)
+                    policies_rows.append(policy)
+                    elig_rows.append(elig)
+                    chunk_rows.extend(sections)
+            else:
+                if pool is None:
+                    n = min(workers, len(todo))
+                    pool = ProcessPoolExecutor(
+                        max_workers=n, initializer=_init_worker, initargs=(verbose, rule_cache, prof is not None)
+                    )
+                    logger.info(f"process pool: workers={n}")
+                size = chunk_size or max(1, math.ceil(len(todo) / (workers * 4)))
+                jobs = [todo[start:start + size] for start in range(0, len(todo), size)]
+                logger.debug(f"process pool: chunks={len(jobs)} (chunk_size={size})")
+                # map은 제출 순서대로 결과를 돌려주므로 직렬 실행과 같은 결과/로그 순서
+                for chunk_policies, chunk_elig, chunk_sections, records, stats, part in pool.map(_clean_chunk, jobs):
+                    for level, msg in records:
+                        logger.log(level, msg)
+                    policies_rows.extend(chunk_policies)
+                    elig_rows.extend(chunk_elig)
+                    chunk_rows.extend(chunk_sections)
+                    _merge_stats(cache_stats, stats)
+                    if prof is not None:
+                        prof.merge(part)
+
+            cleaned += len(todo)
+            with _stage(prof, "write_output"):
+                write_chunk(writers, policies_rows, elig_rows, chunk_rows, written_ids)
+            if stream:
+                logger.info(f"chunk {chunk_no}: rows={len(rows)}, cleaned={len(todo)} (total written={len(written_ids)})")
+
+        with _stage(prof, "write_output"):
+            for w in writers.values():
+                w.commit()
     except PermissionError as e:
+        for w in writers.values():
+            w.abort()
         raise PermissionError(
             f"Permission denied while writing outputs in: {cleaner_dir}\n"
             f"- 파일이 엑셀/편집기에서 열려있으면 닫고 다시 실행\n"
             f"- 또는 기존 파일 삭제/이름변경 후 재실행\n"
             f"Original error: {e}"
         )
+    except BaseException:
+        for w in writers.values():
+            w.abort()
+        raise
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    dedup_paths: Tuple[str, ...] = ()
+    if dedup:
+        with _stage(prof, "dedup"):
+            dedup_report, dedup_paths = run_dedup(
+                policies_out, threshold=dedup_threshold, chunksize=read_chunksize or 5000
+            )
+        logger.info(format_summary(dedup_report))
+
+    # 입력에서 사라진 source_id: 출력에서 빠지고, policy_id는 재사용하지 않도록 map에 남김
+    # (--limit 실행은 일부만 본 것이므로 삭제로 판단하지 않음)
+    if not limit:
+        for sid, entry in id_map.items():
+            if sid not in present and not entry["removed_at"]:
+                entry["removed_at"] = now_iso
+                manifest["removed"].append({"source_id": sid, "policy_id": entry["policy_id"]})
+
+    logger.info(
+        f"incremental: added={len(manifest['added'])}, changed={len(manifest['changed'])}, "
+        f"removed={len(manifest['removed'])}, unchanged={manifest['unchanged']}, stale={manifest['stale']} "
+        f"→ cleaned {cleaned} rows"
+    )
 
-    logger.info(f"Saved → {policies_out}")
-    logger.info(f"Saved → {elig_out}")
+    if cache is not None:
+        _merge_stats(cache_stats, cache.take_stats())
+        pruned = cache.prune_stale()
+        logger.info(format_rule_cache_stats(cache_stats) + (f", pruned stale={pruned}" if pruned else ""))
+
+    # id_map/manifest는 출력이 정상 저장된 뒤에만 갱신 (실패 시 다음 실행에서 다시 처리)
+    with _stage(prof, "save_state"):
+        save_id_map(id_map_out, id_map)
+        manifest = {"run_at": now_iso, "input": os.path.abspath(input_csv), "full": bool(full), **versions, **manifest}
+        with open(manifest_out, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    for w in writers.values():
+        for path in w.paths:
+            logger.info(f"Saved → {path}")
+    for path in dedup_paths:
+        logger.info(f"Saved → {path}")
+    logger.info(f"Saved → {id_map_out}")
+    logger.info(f"Saved → {manifest_out}")
+
+    if prof is None:
+        return None
+    report = prof.report(
+        rows=total_rows,
+        cleaned=cleaned,
+        wall_seconds=time.perf_counter() - t_start,
+        workers=workers,
+        full=bool(full),
+        stream=stream,
+        rule_cache=rule_cache is not None,
+    )
+    logger.info("profile:\n" + format_report(report))
+    if profile_json:
+        with open(profile_json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        logger.info(f"Saved → {profile_json}")
+    return report
 
 
 def main() -> None:
@@ -442,14 +961,47 @@ def main() -> None:
     ap.add_argument("--input", required=True, help="input policies.csv path")
     ap.add_argument("--limit", type=int, help="optional: process only first N rows")
     ap.add_argument("--verbose", action="store_true")
+    ap.add_argument("--workers", type=int, default=1, help="process pool 크기 (1=직렬, 0=전체 코어)")
+    ap.add_argument("--chunk-size", type=int, help="워커 1회 처리 행 수 (기본: 행 수 / (workers*4))")
+    ap.add_argument("--full", action="store_true", help="version_hash가 같아도 전체 행을 다시 정제 (policy_id는 유지)")
+    ap.add_argument("--rule-cache", default=DEFAULT_RULE_CACHE, help="룰 결과 캐시 SQLite 경로")
+    ap.add_argument("--no-rule-cache", action="store_true", help="룰 결과 캐시 사용 안 함")
+    ap.add_argument("--stream", action="store_true", help="입력을 청크 단위로 읽고 바로 출력에 append (메모리 일정)")
+    ap.add_argument("--read-chunksize", type=int, default=5000, help="--stream 입력 청크 행 수")
+    ap.add_argument("--format", default="csv", help="출력 형식: csv | parquet | csv,parquet (parquet는 pyarrow 필요)")
+    ap.add_argument("--profile", action="store_true", help="단계별 시간 / 느린 행 요약 표 출력")
+    ap.add_argument("--profile-json", help="--profile 리포트 JSON 저장 경로 (--profile-baseline로 재사용 가능)")
+    ap.add_argument("--profile-baseline", help="비교할 리포트 JSON: cleaned/s가 --profile-threshold 넘게 떨어지거나 실행 모드가 다르면 exit 1")
+    ap.add_argument("--profile-threshold", type=float, default=0.25, help="허용 처리량 하락 비율 (0.25 = 25%%)")
+    ap.add_argument("--no-dedup", action="store_true", help="중복 정책 클러스터(MinHash/LSH) 단계 건너뜀")
+    ap.add_argument("--dedup-threshold", type=float, default=DEDUP_THRESHOLD, help="중복 판정 추정 Jaccard 하한")
     args = ap.parse_args()
 
-    run_clean(
+    report = run_clean(
         input_csv=args.input,
         limit=args.limit,
         verbose=args.verbose,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        full=args.full,
+        rule_cache=None if args.no_rule_cache else args.rule_cache,
+        read_chunksize=args.read_chunksize if args.stream else None,
+        formats=args.format,
+        profile=args.profile or bool(args.profile_baseline),
+        profile_json=args.profile_json,
+        dedup=not args.no_dedup,
+        dedup_threshold=args.dedup_threshold,
     )
 
+    if args.profile_baseline and report is not None:
+        with open(args.profile_baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        msg = check_throughput(report, baseline, args.profile_threshold)
+        if msg:
+            print(f"[FAIL] {msg}")
+            sys.exit(1)
+        print(f"[INFO] throughput OK vs baseline ({report['cleaned_per_sec'] or 0:,.1f} cleaned/s)")
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,113 @@
+# bench_serialization.py
+# ------------------------------------------------------------
+# /policies, /policies/{id} 응답의 직렬화 시간 + 전송 바이트 비교
+#   - before: 전체 컬럼 + 표준 json (기존 FastAPI 기본 인코딩)
+#   - after : 요약 projection + orjson (현재 API)
+#   - 각 payload의 gzip / brotli(설치 시) 압축 후 크기
+#
+# 실행:
+#   python scripts/bench_serialization.py
+#   python scripts/bench_serialization.py --csv pipeline/cleaner/policies.csv --page-size 50 --json out.json
+# ------------------------------------------------------------
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+
+import orjson
+import pandas as pd
+
+SUMMARY_FIELDS = ["policy_id", "policy_name", "support_summary", "region", "updated_at"]
+
+try:
+    import brotli  # type: ignore
+except ImportError:
+    brotli = None
+
+
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--csv", default="pipeline/cleaner/policies.csv")
+    ap.add_argument("--page-size", type=int, default=50)
+    ap.add_argument("--repeat", type=int, default=200)
+    ap.add_argument("--json", help="optional: 결과를 JSON 파일로 저장")
+    return ap.parse_args()
+
+
+def load_rows(csv_path: str) -> List[Dict[str, Any]]:
+    df = pd.read_csv(csv_path, encoding="utf-8-sig", dtype={"policy_id": str})
+    df = df.astype(object).where(pd.notna(df), None)
+    return df.to_dict(orient="records")
+
+
+def std_json(obj: Any) -> bytes:
+    # starlette JSONResponse와 동일한 옵션
+    return json.dumps(obj, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def fast_json(obj: Any) -> bytes:
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+
+def time_it(fn: Callable[[Any], bytes], obj: Any, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(obj)
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples) * 1000  # ms
+
+
+def measure(name: str, obj: Any, fn: Callable[[Any], bytes], repeat: int) -> Dict[str, Any]:
+    body = fn(obj)
+    out = {
+        "case": name,
+        "serialize_ms": round(time_it(fn, obj, repeat), 4),
+        "raw_bytes": len(body),
+        "gzip_bytes": len(gzip.compress(body, compresslevel=6)),
+    }
+    if brotli is not None:
+        out["brotli_bytes"] = len(brotli.compress(body, quality=4))
+    return out
+
+
+def main() -> None:
+    args = parse_args()
+    rows = load_rows(args.csv)
+    page = rows[: args.page_size]
+
+    def envelope(data: Any) -> Dict[str, Any]:
+        return {"success": True, "data": data, "error": None}
+
+    list_before = envelope(page)
+    list_after = envelope({"items": [{k: r.get(k) for k in SUMMARY_FIELDS} for r in page], "next_cursor": None})
+    detail = envelope(rows[0])
+
+    results = [
+        measure("/policies  before (all columns, json)", list_before, std_json, args.repeat),
+        measure("/policies  after  (summary, orjson)", list_after, fast_json, args.repeat),
+        measure("/policies/{id} json", detail, std_json, args.repeat),
+        measure("/policies/{id} orjson", detail, fast_json, args.repeat),
+    ]
+
+    cols = ["case", "serialize_ms", "raw_bytes", "gzip_bytes"] + (["brotli_bytes"] if brotli else [])
+    widths = [max(len(c), *(len(str(r.get(c, ""))) for r in results)) for c in cols]
+    print(" | ".join(c.ljust(w) for c, w in zip(cols, widths)))
+    print("-+-".join("-" * w for w in widths))
+    for r in results:
+        print(" | ".join(str(r.get(c, "")).ljust(w) for c, w in zip(cols, widths)))
+    print(f"\nrows={len(rows)} page_size={len(page)} repeat={args.repeat} brotli={'yes' if brotli else 'no'}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"[INFO] Saved → {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+# check_publish.py
+# ------------------------------------------------------------
+# publish_cleaned swap 경로 점검: 같은 DB에 연속 2번 publish
+#   - 매 publish 후: 행 수, PK 이름(<table>_pkey), 모델 인덱스 존재, staging 테이블 잔존 여부 확인
+#     (policies / policy_eligibility / policy_chunks)
+#   - Postgres DDL(오프라인): mock 엔진으로 swap SQL을 뽑아 PK 이름 복원 문장이 있는지 확인
+#     (RENAME TABLE은 PK 인덱스 이름을 바꾸지 않아 두 번째 publish가 실패하던 문제)
+#
+# 실행:
+#   python scripts/check_publish.py                                   # SQLite 임시 파일 + Postgres DDL 오프라인 검사
+#   python scripts/check_publish.py --database-url postgresql://u:p@localhost/db   # 실제 Postgres에 2번 publish
+#   (주의: 대상 DB의 policies / policy_eligibility / policy_chunks 테이블을 덮어씀)
+# ------------------------------------------------------------
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR / "backend"))
+
+from sqlalchemy import create_engine, inspect  # noqa: E402
+from sqlalchemy.engine import create_mock_engine  # noqa: E402
+
+from app.db.models.base import Base  # noqa: E402
+from app.db.models.policy import Policy  # noqa: E402
+from app.db.models.policy_chunk import PolicyChunk  # noqa: E402
+from app.db.models.policy_eligibility import PolicyEligibility  # noqa: E402
+from app.services.publish_cleaned import STAGING_SUFFIX, _load_staging, _pk_name, _swap, publish_sync  # noqa: E402
+
+TABLES = (Policy.__table__, PolicyEligibility.__table__, PolicyChunk.__table__)
+
+
+def sample_rows(n: int, tag: str) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    policies = [
+        {
+            "policy_id": str(i),
+            "policy_name": f"정책 {i} ({tag})",
+            "support_summary": "요약",
+            "support_detail": "상세",
+            "region": "서울",
+            "clean_text": f"[메타]\n정책 {i}",
+            "embedding_text": f"[메타]\n정책 {i}",
+            "card_snippet": f"정책 {i} 요약",
+            "updated_at": datetime(2024, 1, 1),
+        }
+        for i in range(1, n + 1)
+    ]
+    elig = [
+        {
+            "policy_id": str(i),
+            "min_age": 19,
+            "max_age": 39,
+            "income_rule_type": "NONE",
+            "income_threshold": None,
+            "asset_threshold": None,
+            "is_homeowner_required": False,
+            "vehicle_value_limit": None,
+        }
+        for i in range(1, n + 1)
+    ]
+    chunks = [
+        {"policy_id": str(i), "chunk_no": 0, "section": "메타", "start": 0, "end": 10, "tokens": 5}
+        for i in range(1, n + 1)
+    ]
+    return policies, elig, chunks
+
+
+def check_database(url: str) -> List[str]:
+    """연속 2번 publish → 실패 메시지 목록 (비어 있으면 통과)"""
+    errors: List[str] = []
+    eng = create_engine(url)
+    Base.metadata.create_all(eng, tables=list(TABLES))
+    try:
+        for run, n in enumerate((5, 3), start=1):
+            policies, elig, chunks = sample_rows(n, f"run{run}")
+            try:
+                with eng.begin() as conn:
+                    publish_sync(conn, policies, elig, batch=2, chunks=chunks)
+            except Exception as e:
+                errors.append(f"publish #{run} failed: {e}")
+                break
+
+            insp = inspect(eng)
+            names = set(insp.get_table_names())
+            for table in TABLES:
+                if table.name + STAGING_SUFFIX in names:
+                    errors.append(f"publish #{run}: staging table left: {table.name + STAGING_SUFFIX}")
+                with eng.connect() as conn:
+                    count = conn.execute(table.select()).fetchall()
+                if len(count) != n:
+                    errors.append(f"publish #{run}: {table.name} rows={len(count)} (expected {n})")
+                pk = insp.get_pk_constraint(table.name).get("name")
+                if eng.dialect.name == "postgresql" and pk != _pk_name(table.name):
+                    errors.append(f"publish #{run}: {table.name} pk name={pk!r} (expected {_pk_name(table.name)!r})")
+                have = {i["name"] for i in insp.get_indexes(table.name)}
+                missing = {i.name for i in table.indexes} - have
+                if missing:
+                    errors.append(f"publish #{run}: {table.name} missing indexes {sorted(missing)}")
+    finally:
+        eng.dispose()
+    return errors
+
+
+def check_postgres_ddl() -> List[str]:
+    """DB 없이 postgresql dialect로 staging CREATE + swap SQL 생성 → PK 이름 처리 확인"""
+    statements: List[str] = []
+
+    def executor(sql, *multiparams, **params):
+        statements.append(str(sql.compile(dialect=mock.dialect)) if hasattr(sql, "compile") else str(sql))
+
+    mock = create_mock_engine("postgresql+psycopg2://", executor)
+    conn = mock.connect() if hasattr(mock, "connect") else mock
+    errors: List[str] = []
+    for table in TABLES:
+        statements.clear()
+        staging = _load_staging(conn, table, [], batch=1)
+        _swap(conn, table, staging)
+        sql = "\n".join(statements)
+        staging_pk = _pk_name(table.name + STAGING_SUFFIX)
+        if f"CONSTRAINT {staging_pk} PRIMARY KEY" not in sql:
+            errors.append(f"postgres DDL: staging PK for {table.name} is not named {staging_pk}")
+        if f"RENAME CONSTRAINT {staging_pk} TO {_pk_name(table.name)}" not in sql:
+            errors.append(f"postgres DDL: swap of {table.name} does not restore {_pk_name(table.name)}")
+    return errors
+
+
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="publish_cleaned staging/swap 연속 publish 점검")
+    ap.add_argument("--database-url", help="동기 SQLAlchemy URL (기본: 임시 SQLite 파일)")
+    return ap.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    errors = check_postgres_ddl()
+    print(f"[INFO] postgres DDL (offline): {'OK' if not errors else 'FAIL'}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.database_url or f"sqlite:///{Path(tmp) / 'publish_check.sqlite3'}"
+        db_errors = check_database(url)
+        print(f"[INFO] {url.split('://', 1)[0]} publish x2: {'OK' if not db_errors else 'FAIL'}")
+        errors += db_errors
+
+    for e in errors:
+        print(f"[FAIL] {e}")
+    if errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+# load_test.py
+# ------------------------------------------------------------
+# API 부하 테스트 (혼합 트래픽)
+#   - /recommend, /policy-qa, /similar/{id}, /policies, /policies/search 를 비율(--mix)대로 섞어 호출
+#   - 프로필은 분포에서 샘플링(연령/소득/자산/주택/차량), 질문은 코퍼스 파일에서 추출
+#   - QA는 공유 캐시(24h TTL)에 답이 남으므로 qa = 매번 고유한 질문(캐시 miss → LLM 경로),
+#     qa_cached = 코퍼스 질문 그대로(반복 → 캐시 hit)로 나눠 따로 집계
+#   - 엔드포인트별 처리량, p50/p95/p99 지연, 에러율(503 shed 별도) 집계
+#   - 결과를 JSON으로 저장하고 --compare 로 이전 실행과 비교
+#
+# 실행:
+#   python scripts/load_test.py --spawn-server --duration 60 --concurrency 32
+#   python scripts/load_test.py --base-url http://localhost:8000 --compare results/loadtest/prev.json
+# ------------------------------------------------------------
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import random
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+REQUESTS = ("policies", "search", "recommend", "similar", "qa", "qa_cached")
+DEFAULT_MIX = "policies=35,search=15,recommend=25,similar=15,qa=10"
+REGIONS = ["서울", "부산", "경기", "인천", "대구", "광주", "대전"]
+
+
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--base-url", default="http://127.0.0.1:8000")
+    ap.add_argument("--duration", type=float, default=30.0, help="측정 시간(초, warmup 제외)")
+    ap.add_argument("--warmup", type=float, default=3.0)
+    ap.add_argument("--concurrency", type=int, default=16, help="동시 가상 사용자 수 (closed loop)")
+    ap.add_argument("--think-ms", type=float, default=0.0, help="요청 사이 대기 시간(평균, 지수분포)")
+    ap.add_argument("--mix", default=DEFAULT_MIX, help="엔드포인트별 가중치")
+    ap.add_argument("--questions", default=str(ROOT_DIR / "scripts" / "load_test_questions.txt"))
+    ap.add_argument("--timeout", type=float, default=30.0)
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--out", default=None, help="결과 JSON (기본: results/loadtest/<timestamp>.json)")
+    ap.add_argument("--compare", default=None, help="이전 결과 JSON과 비교")
+    ap.add_argument("--spawn-server", action="store_true", help="가짜 LLM 서버(load_test_server.py)를 띄워서 측정")
+    ap.add_argument("--llm-latency-ms", type=float, default=800.0, help="--spawn-server 시 가짜 LLM 지연 중앙값")
+    return ap.parse_args()
+
+
+# -------------------------
+# traffic model
+# -------------------------
+def parse_mix(mix: str) -> Tuple[List[str], List[float]]:
+    names, weights = [], []
+    for part in mix.split(","):
+        name, _, w = part.partition("=")
+        names.append(name.strip())
+        weights.append(float(w or 1))
+    unknown = set(names) - set(REQUESTS)
+    if unknown:
+        raise ValueError(f"unknown endpoints in --mix: {sorted(unknown)} (allowed: {sorted(REQUESTS)})")
+    return names, weights
+
+
+def sample_profile(rng: random.Random) -> Dict[str, Any]:
+    """청년/신혼 위주 연령, lognormal 소득/자산, 20% 주택 소유, 60%는 차량 없음"""
+    age = int(min(70, max(19, rng.gauss(32, 8))))
+    income = int(rng.lognormvariate(math.log(36_000_000), 0.5)) if rng.random() > 0.1 else 0
+    assets = int(rng.lognormvariate(math.log(80_000_000), 0.9))
+    vehicle = 0 if rng.random() < 0.6 else int(rng.lognormvariate(math.log(20_000_000), 0.5))
+    return {
+        "age": age,
+        "region": rng.choice(REGIONS),
+        "household_size": rng.choice([1, 1, 1, 2, 2, 3, 4]),
+        "income_annual": income,
+        "assets_total": assets,
+        "is_homeowner": rng.random() < 0.2,
+        "vehicle_value": vehicle,
+    }
+
+
+class Traffic:
+    def __init__(self, rng: random.Random, questions: List[str], policy_ids: List[str]):
+        self.rng = rng
+        self.questions = questions
+        self.policy_ids = policy_ids or ["1"]
+        self._qa_tag = f"{rng.getrandbits(32):08x}"
+        self._qa_seq = itertools.count(1)
+        # 검색어는 질문 코퍼스의 단어에서
+        self.terms = sorted({w for q in questions for w in q.replace("?", " ").split() if len(w) >= 2})
+
+    def policies(self) -> Tuple[str, str, Dict[str, Any]]:
+        params: Dict[str, Any] = {"limit": 20}
+        if self.rng.random() < 0.5:
+            p = sample_profile(self.rng)
+            params.update(age=p["age"], annual_income=p["income_annual"], is_homeless=str(not p["is_homeowner"]).lower())
+        return "GET", "/policies", {"params": params}
+
+    def search(self) -> Tuple[str, str, Dict[str, Any]]:
+        q = " ".join(self.rng.sample(self.terms, k=min(len(self.terms), self.rng.choice([1, 1, 2]))))
+        return "GET", "/policies/search", {"params": {"q": q, "limit": 20}}
+
+    def recommend(self) -> Tuple[str, str, Dict[str, Any]]:
+        return "POST", "/recommend", {"json": sample_profile(self.rng)}
+
+    def similar(self) -> Tuple[str, str, Dict[str, Any]]:
+        return "GET", f"/similar/{self.rng.choice(self.policy_ids)}", {}
+
+    def qa(self) -> Tuple[str, str, Dict[str, Any]]:
+        # 질문마다 고유 접미사 → 이전 실행/다른 사용자의 캐시 답을 재사용하지 않음
+        q = f"{self.rng.choice(self.questions)} (#{self._qa_tag}-{next(self._qa_seq)})"
+        return "POST", "/policy-qa", {"json": {"question": q}}
+
+    def qa_cached(self) -> Tuple[str, str, Dict[str, Any]]:
+        return "POST", "/policy-qa", {"json": {"question": self.rng.choice(self.questions)}}
+
+
+# -------------------------
+# runner
+# -------------------------
+class Recorder:
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.status: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.recording = False
+
+    def add(self, name: str, seconds: float, status: str) -> None:
+        if not self.recording:
+            return
+        self.latencies[name].append(seconds)
+        self.status[name][status] += 1
+
+
+async def user_loop(
+    client: httpx.AsyncClient,
+    traffic: Traffic,
+    names: List[str],
+    weights: List[float],
+    rec: Recorder,
+    stop_at: float,
+    think_ms: float,
+) -> None:
+    rng = traffic.rng
+    while time.perf_counter() < stop_at:
+        name = rng.choices(names, weights)[0]
+        method, path, kwargs = getattr(traffic, name)()
+        t0 = time.perf_counter()
+        try:
+            r = await client.request(method, path, **kwargs)
+            status = str(r.status_code)
+        except httpx.HTTPError as e:
+            status = type(e).__name__
+        rec.add(name, time.perf_counter() - t0, status)
+        if think_ms > 0:
+            await asyncio.sleep(rng.expovariate(1000.0 / think_ms))
+
+
+def percentile(sorted_values: List[float], p: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    k = max(0, min(len(sorted_values) - 1, math.ceil(p / 100.0 * len(sorted_values)) - 1))
+    return sorted_values[k]
+
+
+def summarize(rec: Recorder, duration: float) -> Dict[str, Dict[str, Any]]:
+    out: Dict[str, Dict[str, Any]] = {}
+    for name in sorted(rec.latencies):
+        lat = sorted(rec.latencies[name])
+        statuses = dict(rec.status[name])
+        ok = sum(n for s, n in statuses.items() if s.startswith("2") or s == "304")
+        shed = statuses.get("503", 0) + statuses.get("429", 0)
+        total = len(lat)
+        out[name] = {
+            "requests": total,
+            "rps": round(total / duration, 2),
+            "p50_ms": round(percentile(lat, 50) * 1000, 2),
+            "p95_ms": round(percentile(lat, 95) * 1000, 2),
+            "p99_ms": round(percentile(lat, 99) * 1000, 2),
+            "error_rate": round((total - ok - shed) / total, 4) if total else 0.0,
+            "shed_rate": round(shed / total, 4) if total else 0.0,
+            "status": statuses,
+        }
+    return out
+
+
+async def fetch_policy_ids(client: httpx.AsyncClient) -> List[str]:
+    try:
+        r = await client.get("/policies", params={"limit": 100})
+        return [it["policy_id"] for it in r.json()["data"]["items"]]
+    except Exception:
+        return []
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    rng = random.Random(args.seed)
+    questions = [q.strip() for q in Path(args.questions).read_text(encoding="utf-8").splitlines() if q.strip()]
+    names, weights = parse_mix(args.mix)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        policy_ids = await fetch_policy_ids(client)
+        rec = Recorder()
+        start = time.perf_counter()
+        stop_at = start + args.warmup + args.duration
+        users = [
+            user_loop(client, Traffic(random.Random(rng.random()), questions, policy_ids), names, weights, rec, stop_at, args.think_ms)
+            for _ in range(args.concurrency)
+        ]
+
+        async def start_recording():
+            await asyncio.sleep(args.warmup)
+            rec.recording = True
+
+        await asyncio.gather(start_recording(), *users)
+        measured = time.perf_counter() - start - args.warmup
+
+    return {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "config": {
+            "base_url": args.base_url,
+            "duration": args.duration,
+            "concurrency": args.concurrency,
+            "think_ms": args.think_ms,
+            "mix": args.mix,
+            "seed": args.seed,
+            "spawned_server": args.spawn_server,
+            "llm_latency_ms": args.llm_latency_ms if args.spawn_server else None,
+        },
+        "measured_seconds": round(measured, 2),
+        "endpoints": summarize(rec, measured),
+    }
+
+
+# -------------------------
+# report
+# -------------------------
+def print_table(result: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> None:
+    cols = ["endpoint", "requests", "rps", "p50_ms", "p95_ms", "p99_ms", "error_rate", "shed_rate"]
+    if baseline:
+        cols += ["Δrps", "Δp95_ms"]
+    rows = []
+    for name, m in result["endpoints"].items():
+        row = {"endpoint": name, **{c: m[c] for c in cols[1:8]}}
+        base = (baseline or {}).get("endpoints", {}).get(name)
+        if baseline:
+            row["Δrps"] = f"{m['rps'] - base['rps']:+.2f}" if base else "-"
+            row["Δp95_ms"] = f"{m['p95_ms'] - base['p95_ms']:+.2f}" if base else "-"
+        rows.append(row)
+    widths = [max(len(c), *(len(str(r.get(c, ""))) for r in rows)) for c in cols] if rows else [len(c) for c in cols]
+    print(" | ".join(c.ljust(w) for c, w in zip(cols, widths)))
+    print("-+-".join("-" * w for w in widths))
+    for r in rows:
+        print(" | ".join(str(r.get(c, "")).ljust(w) for c, w in zip(cols, widths)))
+
+
+def wait_ready(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"{base_url}/", timeout=1.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"server did not become ready: {base_url}")
+
+
+def main() -> None:
+    args = parse_args()
+
+    server = None
+    if args.spawn_server:
+        port = httpx.URL(args.base_url).port or 8000
+        server = subprocess.Popen(
+            [sys.executable, str(ROOT_DIR / "scripts" / "load_test_server.py"),
+             "--port", str(port), "--llm-latency-ms", str(args.llm_latency_ms)],
+        )
+        wait_ready(args.base_url)
+
+    try:
+        result = asyncio.run(run(args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+
+    baseline = None
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+    print_table(result, baseline)
+
+    out = Path(args.out) if args.out else ROOT_DIR / "results" / "loadtest" / f"{datetime.now():%Y%m%d-%H%M%S}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"[INFO] Saved → {out}")
+
+
+if __name__ == "__main__":
+    main()
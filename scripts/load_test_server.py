@@ -0,0 +1,77 @@
+# load_test_server.py
+# ------------------------------------------------------------
+# 부하 테스트용 로컬 서버: 실제 앱 + 가짜 LLM 백엔드
+#   - QA 경로의 ask_policy_question을 OpenAI/llama_index 대신
+#     지연 분포(lognormal)만 흉내 내는 함수로 바꿔 끼운 뒤 uvicorn 실행
+#   - 외부 API 비용/변동 없이 서버 자체의 처리량·지연을 측정하기 위한 용도
+#   - QA 공유 캐시는 실행마다 새 임시 파일 → 이전 실행의 캐시 상태가 결과에 섞이지 않음
+#
+# 실행:
+#   python scripts/load_test_server.py --port 8000 --llm-latency-ms 800
+# ------------------------------------------------------------
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+import types
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8000)
+    ap.add_argument("--llm-latency-ms", type=float, default=800.0, help="가짜 LLM 응답 시간 중앙값")
+    ap.add_argument("--llm-latency-sigma", type=float, default=0.5, help="lognormal sigma (꼬리 길이)")
+    ap.add_argument("--llm-error-rate", type=float, default=0.0, help="가짜 LLM 실패 비율 (0~1)")
+    return ap.parse_args()
+
+
+def install_fake_llm(median_ms: float, sigma: float, error_rate: float) -> None:
+    """app.pipeline.rag_qa_ver2 를 import 전에 가짜 모듈로 등록"""
+    mu = math.log(max(median_ms, 1e-3) / 1000.0)
+
+    def ask_policy_question(question: str) -> str:
+        time.sleep(random.lognormvariate(mu, sigma))
+        if error_rate and random.random() < error_rate:
+            raise RuntimeError("fake LLM error")
+        return f"[fake-llm] {question[:40]} 에 대한 답변입니다."
+
+    def qa_index_version() -> str:
+        # QA 답변 캐시 키에 쓰이는 인덱스 버전 (가짜 LLM은 인덱스가 없으므로 고정값)
+        return "fake-llm"
+
+    fake = types.ModuleType("app.pipeline.rag_qa_ver2")
+    fake.ask_policy_question = ask_policy_question
+    fake.qa_index_version = qa_index_version
+    sys.modules["app.pipeline.rag_qa_ver2"] = fake
+
+
+def main() -> None:
+    args = parse_args()
+    sys.path.insert(0, str(ROOT_DIR / "backend"))
+    os.chdir(ROOT_DIR)
+    install_fake_llm(args.llm_latency_ms, args.llm_latency_sigma, args.llm_error_rate)
+
+    with tempfile.TemporaryDirectory(prefix="loadtest-cache-") as cache_dir:
+        # shared_cache는 import 시점에 경로를 읽으므로 app import 전에 설정
+        os.environ["SHARED_CACHE_PATH"] = str(Path(cache_dir) / "shared_cache.sqlite3")
+
+        import uvicorn
+        from app.main import app
+
+        print(f"[INFO] fake LLM: median={args.llm_latency_ms}ms sigma={args.llm_latency_sigma} error_rate={args.llm_error_rate}")
+        print(f"[INFO] shared cache: {os.environ['SHARED_CACHE_PATH']}")
+        uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1 @@
-curl http://localhost:8000/health
\ No newline at end of file
+curl -fsS http://localhost:8000/ && curl -fsS "http://localhost:8000/policies?limit=1" > /dev/null && echo OK